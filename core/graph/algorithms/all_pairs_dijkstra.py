@@ -0,0 +1,137 @@
+"""
+All-pairs shortest paths by running Dijkstra from many sources, optionally across worker processes
+
+The graph is frozen to CSR arrays and, in parallel mode, copied once into
+``multiprocessing.shared_memory`` blocks; every worker attaches to the same
+blocks and writes its distance rows straight into a shared output matrix.
+A MappedGraph (core/graph/snapshot.py) is not copied: each worker maps the
+same snapshot file.
+"""
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from core.graph.csr import typecode
+
+# Per-worker views onto the shared blocks, set by _attach_worker
+_worker = {}
+
+def _dijkstra_row(offsets, targets, weights, source, row):
+    """Fill ``row`` (pre-set to inf) with distances from vertex id ``source``."""
+    row[source] = 0
+    heap = [(0, source)]
+    push, pop = heapq.heappush, heapq.heappop
+    while heap:
+        d, u = pop(heap)
+        if d > row[u]:
+            continue
+        for p in range(offsets[u], offsets[u + 1]):
+            v = targets[p]
+            nd = d + weights[p]
+            if nd < row[v]:
+                row[v] = nd
+                push(heap, (nd, v))
+
+def _share(buf):
+    raw = memoryview(buf).cast('B')
+    shm = shared_memory.SharedMemory(create=True, size=max(raw.nbytes, 1))
+    shm.buf[:raw.nbytes] = raw
+    return shm
+
+def _attach(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # ``track`` was added in Python 3.13
+        return shared_memory.SharedMemory(name=name)
+
+def _attach_worker(names, formats, sizes, n, snapshot=None):
+    blocks = [_attach(name) for name in names]
+    _worker['blocks'] = blocks
+    _worker['views'] = [block.buf[:size * array(fmt).itemsize].cast(fmt) for block, fmt, size in zip(blocks, formats, sizes)]
+    _worker['n'] = n
+    if snapshot is not None:
+        # A mapped snapshot is opened from its file instead of being copied
+        from core.graph.snapshot import open_snapshot
+        graph = _worker['graph'] = open_snapshot(snapshot)
+        _worker['views'][:0] = [graph.offsets, graph.targets, graph.weights]
+
+def _solve_rows(jobs):
+    offsets, targets, weights, out = _worker['views']
+    n = _worker['n']
+    inf = float('inf')
+    for row_index, source in jobs:
+        row = array('d', [inf]) * n
+        _dijkstra_row(offsets, targets, weights, source, row)
+        out[row_index * n:(row_index + 1) * n] = row
+    return len(jobs)
+
+def _solve_parallel(csr, source_ids, jobs):
+    from core.graph.snapshot import MappedGraph
+    n = len(csr.labels)
+    out = array('d', [float('inf')]) * (len(source_ids) * n)
+    snapshot = csr.path if isinstance(csr, MappedGraph) else None
+    buffers = (out,) if snapshot else (csr.offsets, csr.targets, csr.weights, out)
+    blocks = [_share(buf) for buf in buffers]
+    try:
+        names = [block.name for block in blocks]
+        formats = [typecode(buf) for buf in buffers]
+        sizes = [len(buf) for buf in buffers]
+        tasks = list(enumerate(source_ids))
+        chunk = max(1, len(tasks) // (jobs * 4))
+        with ProcessPoolExecutor(jobs, initializer=_attach_worker, initargs=(names, formats, sizes, n, snapshot)) as pool:
+            for _ in pool.map(_solve_rows, [tasks[i:i + chunk] for i in range(0, len(tasks), chunk)]):
+                pass
+        view = blocks[-1].buf[:out.itemsize * len(out)].cast('d')
+        out = array('d', view)
+        view.release()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return out
+
+def _solve_serial(csr, source_ids):
+    n = len(csr.labels)
+    inf = float('inf')
+    out = array('d')
+    for source in source_ids:
+        row = array('d', [inf]) * n
+        _dijkstra_row(csr.offsets, csr.targets, csr.weights, source, row)
+        out.extend(row)
+    return out
+
+def multi_source_distances(csr, source_ids, jobs=1):
+    """Row-major ``len(source_ids) x n`` distance buffer (``array('d')``) over a CSRGraph."""
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs > 1 and len(source_ids) > 1:
+        return _solve_parallel(csr, source_ids, min(jobs, len(source_ids)))
+    return _solve_serial(csr, source_ids)
+
+def all_pairs_dijkstra(graph, jobs=1):
+    """Non-generator all-pairs Dijkstra returning an AllPairsResult.
+
+    Raises ValueError on a negative edge weight.  ``jobs`` is the number of worker
+    processes (``None`` uses every core).  With NumPy installed ``dist`` is an
+    ``n x n`` NumPy array, otherwise a list of rows.
+    """
+    from core.graph.csr import CSRGraph
+    from core.graph.results import AllPairsResult
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    if len(csr.weights) and min(csr.weights) < 0:
+        raise ValueError("All-pairs Dijkstra needs non-negative edge weights; use johnson.")
+    n = len(csr.labels)
+    out = multi_source_distances(csr, range(n), jobs)
+    return AllPairsResult(csr.get_vertices(), distance_matrix(out, n, n, typecode(csr.weights) == 'q'))
+
+def distance_matrix(out, rows, cols, integral=False):
+    """Shape a row-major distance buffer as a NumPy array, or a list of rows without NumPy."""
+    try:
+        import numpy as np
+    except ImportError:
+        inf = float('inf')
+        cast = (lambda x: int(x) if x != inf else x) if integral else float
+        return [[cast(x) for x in out[r * cols:(r + 1) * cols]] for r in range(rows)]
+    return np.frombuffer(out, dtype=np.float64).reshape(rows, cols)
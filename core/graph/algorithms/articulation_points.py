@@ -45,4 +45,43 @@ def articulation_points_and_bridges(graph, visualize=False):
                 yield step
     if visualize:
         yield ("done", list(ap), bridges)
-    return ap, bridges 
\ No newline at end of file
+    return ap, bridges 
+
+def articulation_points_and_bridges_fast(graph):
+    """Non-generator (iterative) Tarjan returning an ArticulationResult."""
+    from core.graph.results import ArticulationResult
+    disc = {}
+    low = {}
+    ap = set()
+    bridges = []
+    time = 0
+    for root in graph.get_vertices():
+        if root in disc:
+            continue
+        disc[root] = low[root] = time
+        time += 1
+        root_children = 0
+        stack = [(root, None, iter(graph.get_neighbors(root)))]
+        while stack:
+            u, parent, it = stack[-1]
+            for v, _ in it:
+                if v not in disc:
+                    disc[v] = low[v] = time
+                    time += 1
+                    if u == root:
+                        root_children += 1
+                    stack.append((v, u, iter(graph.get_neighbors(v))))
+                    break
+                if v != parent:
+                    low[u] = min(low[u], disc[v])
+            else:
+                stack.pop()
+                if parent is not None:
+                    low[parent] = min(low[parent], low[u])
+                    if parent != root and low[u] >= disc[parent]:
+                        ap.add(parent)
+                    if low[u] > disc[parent]:
+                        bridges.append((parent, u))
+        if root_children > 1:
+            ap.add(root)
+    return ArticulationResult(ap, bridges)
@@ -1,23 +1,96 @@
 """
 A* Algorithm for shortest path (step-by-step visualization)
 Assumes graph nodes have (x, y) positions in node_pos dict.
+
+``heuristic`` selects the lower bound used to guide the search:
+"euclidean" or "manhattan" distance between node positions (scaled by the
+smallest cost-per-distance of any edge, so it never overestimates), "alt"
+for landmark bounds precomputed once per graph, "zero" for plain Dijkstra,
+or any callable ``h(v, target)``.  The default is "euclidean" when every
+vertex has a position and "zero" otherwise.
 """
-from collections import deque
+import math
+from weakref import WeakKeyDictionary
+from core.graph.views import graph_signature
+
+# graph -> {metric name: (graph signature, positions, admissible scale)}
+_scale_cache = WeakKeyDictionary()
+
+def euclidean(p, q):
+    return math.hypot(p[0] - q[0], p[1] - q[1])
+
+def manhattan(p, q):
+    return abs(p[0] - q[0]) + abs(p[1] - q[1])
+
+METRICS = {"euclidean": euclidean, "manhattan": manhattan}
+
+def admissible_scale(graph, node_pos, metric=euclidean):
+    """Largest factor ``s`` such that ``s * metric(u, v) <= w`` for every edge ``u -> v``."""
+    scale = float('inf')
+    for u in graph.get_vertices():
+        pu = node_pos[u]
+        for v, w in graph.get_neighbors(u):
+            if w < 0:
+                return 0
+            length = metric(pu, node_pos[v])
+            if length > 0 and w / length < scale:
+                scale = w / length
+    return scale if scale < float('inf') else 0
+
+def _cached_scale(graph, target, node_pos, name):
+    """``admissible_scale`` for ``name``, reused until the graph or the positions change."""
+    if target not in node_pos:
+        raise ValueError(f"The {name} heuristic needs a position for every vertex (missing [{target!r}]).")
+    signature = graph_signature(graph)
+    per_graph = _scale_cache.setdefault(graph, {})
+    cached = per_graph.get(name)
+    if cached is not None and cached[0] == signature and cached[1] == node_pos:
+        return cached[2]
+    missing = [v for v in graph.get_vertices() if v not in node_pos]
+    if missing:
+        raise ValueError(f"The {name} heuristic needs a position for every vertex (missing {missing[:3]}).")
+    limit = admissible_scale(graph, node_pos, METRICS[name])
+    per_graph[name] = (signature, dict(node_pos), limit)
+    return limit
 
-def astar(graph, source, target, node_pos, visualize=False):
-    import heapq
-    def heuristic(u, v):
-        return 0
+def make_heuristic(graph, target, node_pos, heuristic=None, scale=None):
+    """Return ``h(v)``, an admissible estimate of the distance from ``v`` to ``target``."""
+    if callable(heuristic):
+        return lambda v: heuristic(v, target)
+    if heuristic is None:
+        vertices = graph.get_vertices()
+        has_pos = node_pos and target in node_pos and all(v in node_pos for v in vertices)
+        heuristic = "euclidean" if has_pos else "zero"
+    if heuristic == "zero":
+        return lambda v: 0
+    if heuristic == "alt":
+        from core.graph.algorithms.landmarks import landmarks_for
+        landmarks = landmarks_for(graph)
+        return lambda v: landmarks.heuristic(v, target)
+    if heuristic not in METRICS:
+        raise ValueError(f"Unknown heuristic {heuristic!r}.")
+    metric = METRICS[heuristic]
+    limit = _cached_scale(graph, target, node_pos, heuristic)
+    if scale is None:
+        scale = limit
+    elif scale > limit:
+        raise ValueError(f"Heuristic scale {scale} overestimates some edge; the largest admissible scale is {limit}.")
+    target_pos = node_pos[target]
+    return lambda v: scale * metric(node_pos[v], target_pos)
+
+def astar(graph, source, target, node_pos, visualize=False, heuristic=None, scale=None, queue="heap"):
+    from core.priority_queue import make_queue
+    h = make_heuristic(graph, target, node_pos, heuristic, scale)
     dist = {v: float('inf') for v in graph.get_vertices()}
     prev = {v: None for v in graph.get_vertices()}
     dist[source] = 0
-    heap = [(heuristic(source, target), 0, source)]
-    visited = set()
+    # Priorities are (f, g): ties on f go to the vertex with the smaller g.
+    # A vertex may be queued again after it was expanded if an inconsistent
+    # (but admissible) heuristic reached it by a longer route first.
+    heap = make_queue(queue)
+    heap.push(source, (h(source), 0))
     while heap:
-        f, d, u = heapq.heappop(heap)
-        if u in visited:
-            continue
-        visited.add(u)
+        (f, d), u = heap.pop()
         if visualize:
             yield ("visit", u, d)
         if u == target:
@@ -26,7 +99,7 @@ def astar(graph, source, target, node_pos, visualize=False):
             if dist[v] > dist[u] + w:
                 dist[v] = dist[u] + w
                 prev[v] = u
-                heapq.heappush(heap, (dist[v] + heuristic(v, target), dist[v], v))
+                heap.push(v, (dist[v] + h(v), dist[v]))
                 if visualize:
                     yield ("update", v, dist[v])
     # Reconstruct path
@@ -44,4 +117,28 @@ def astar(graph, source, target, node_pos, visualize=False):
     path.reverse()
     if visualize:
         yield ("done", dist, prev, path)
-    return dist, prev, path 
\ No newline at end of file
+    return dist, prev, path
+
+def astar_fast(graph, source, target, node_pos, heuristic=None, scale=None, queue="heap"):
+    """Non-generator A* returning a ShortestPathResult with ``path`` set."""
+    from core.priority_queue import make_queue
+    from core.graph.results import ShortestPathResult
+    inf = float('inf')
+    h = make_heuristic(graph, target, node_pos, heuristic, scale)
+    dist = dict.fromkeys(graph.get_vertices(), inf)
+    prev = dict.fromkeys(dist)
+    dist[source] = 0
+    heap = make_queue(queue)
+    heap.push(source, (h(source), 0))
+    push, pop = heap.push, heap.pop
+    while heap:
+        (_, d), u = pop()
+        if u == target:
+            break
+        for v, w in graph.get_neighbors(u):
+            nd = d + w
+            if nd < dist.get(v, inf):
+                dist[v] = nd
+                prev[v] = u
+                push(v, (nd + h(v), nd))
+    return ShortestPathResult(source, dist, prev, target=target)
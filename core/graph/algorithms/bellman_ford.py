@@ -2,17 +2,18 @@
 Bellman-Ford Algorithm for shortest paths in directed graphs (step-by-step visualization)
 """
 def bellman_ford(graph, source, visualize=False):
-    dist = {v: float('inf') for v in graph.get_vertices()}
-    prev = {v: None for v in graph.get_vertices()}
+    vertices = graph.get_vertices()
+    dist = {v: float('inf') for v in vertices}
+    prev = {v: None for v in vertices}
     dist[source] = 0
-    # Ensure all vertices are present in dist, even if not in graph.adj
-    for u in graph.get_vertices():
+    # Ensure all vertices are present in dist, even if a graph view omits sinks
+    for u in vertices:
         for v, w in graph.get_neighbors(u):
             if v not in dist:
                 dist[v] = float('inf')
                 prev[v] = None
-    for _ in range(len(graph.get_vertices()) - 1):
-        for u in graph.get_vertices():
+    for _ in range(len(dist) - 1):
+        for u in vertices:
             for v, w in graph.get_neighbors(u):
                 if dist[u] + w < dist[v]:
                     dist[v] = dist[u] + w
@@ -20,7 +21,7 @@ def bellman_ford(graph, source, visualize=False):
                     if visualize:
                         yield ("update", v, dist[v])
     # Check for negative-weight cycles
-    for u in graph.get_vertices():
+    for u in vertices:
         for v, w in graph.get_neighbors(u):
             if dist[u] + w < dist[v]:
                 if visualize:
@@ -30,3 +31,30 @@ def bellman_ford(graph, source, visualize=False):
         yield ("done", dist, prev)
     # Always return a tuple, even if visualize=True, for generator use in Johnson's algorithm
     return dist, prev
+
+def bellman_ford_fast(graph, source):
+    """Non-generator Bellman-Ford returning a ShortestPathResult."""
+    from core.graph.results import ShortestPathResult
+    inf = float('inf')
+    vertices = graph.get_vertices()
+    edges = [(u, v, w) for u in vertices for v, w in graph.get_neighbors(u)]
+    dist = dict.fromkeys(vertices, inf)
+    for _, v, _ in edges:
+        dist.setdefault(v, inf)
+    prev = dict.fromkeys(dist)
+    dist[source] = 0
+    for _ in range(len(dist) - 1):
+        changed = False
+        for u, v, w in edges:
+            du = dist[u]
+            if du + w < dist[v]:
+                dist[v] = du + w
+                prev[v] = u
+                changed = True
+        if not changed:
+            break
+    else:
+        for u, v, w in edges:
+            if dist[u] + w < dist[v]:
+                return ShortestPathResult(source, None, None, negative_cycle=True)
+    return ShortestPathResult(source, dist, prev)
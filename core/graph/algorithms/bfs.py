@@ -13,4 +13,20 @@ def bfs(graph, start):
             visited.add(u)
             for v, _ in graph.get_neighbors(u):
                 if v not in visited:
-                    queue.append(v) 
\ No newline at end of file
+                    queue.append(v) 
+
+def bfs_fast(graph, start):
+    """Non-generator BFS returning the visit order as a TraversalResult."""
+    from collections import deque
+    from core.graph.results import TraversalResult
+    visited = {start}
+    order = []
+    queue = deque([start])
+    while queue:
+        u = queue.popleft()
+        order.append(u)
+        for v, _ in graph.get_neighbors(u):
+            if v not in visited:
+                visited.add(v)
+                queue.append(v)
+    return TraversalResult(order)
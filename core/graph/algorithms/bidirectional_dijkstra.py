@@ -0,0 +1,91 @@
+"""
+Bidirectional Dijkstra for point-to-point shortest paths (step-by-step visualization)
+
+Searches forward from the source and backward from the target, always
+expanding the side with the smaller frontier key, and stops once
+top_forward + top_backward >= best path found so far.
+"""
+import heapq
+from core.graph.views import reverse_adjacency
+from core.steps import run_to_completion
+
+def _search(graph, source, target, visualize):
+    inf = float('inf')
+    if graph.directed:
+        radj = reverse_adjacency(graph)
+        neighbors = (graph.get_neighbors, lambda u: radj.get(u, ()))
+    else:
+        neighbors = (graph.get_neighbors, graph.get_neighbors)
+    dist = ({source: 0}, {target: 0})
+    prev = ({source: None}, {target: None})
+    heaps = ([(0, source)], [(0, target)])
+    settled = (set(), set())
+    best, meet = (0, source) if source == target else (inf, None)
+    push, pop = heapq.heappush, heapq.heappop
+    while heaps[0] and heaps[1]:
+        top_f, top_b = heaps[0][0][0], heaps[1][0][0]
+        if top_f + top_b >= best:
+            break
+        side = 0 if top_f <= top_b else 1
+        d, u = pop(heaps[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+        if visualize:
+            yield ("visit", u, d)
+        mine, other = dist[side], dist[1 - side]
+        for v, w in neighbors[side](u):
+            nd = d + w
+            if nd < mine.get(v, inf):
+                mine[v] = nd
+                prev[side][v] = u
+                push(heaps[side], (nd, v))
+                if visualize:
+                    yield ("update", v, nd)
+            if v in other and nd + other[v] < best:
+                best = nd + other[v]
+                meet = v
+    return best, meet, dist, prev
+
+def _join(meet, prev):
+    path = []
+    cur = meet
+    while cur is not None:
+        path.append(cur)
+        cur = prev[0][cur]
+    path.reverse()
+    cur = prev[1][meet]
+    while cur is not None:
+        path.append(cur)
+        cur = prev[1][cur]
+    return path
+
+def bidirectional_dijkstra(graph, source, target, visualize=False):
+    """Yield Dijkstra-style ("visit"/"update"/"found"/"not_found") steps; return (distance, path)."""
+    best, meet, _, prev = yield from _search(graph, source, target, visualize)
+    if meet is None:
+        if visualize:
+            yield ("not_found",)
+        return float('inf'), []
+    path = _join(meet, prev)
+    if visualize:
+        yield ("found", path)
+    return best, path
+
+def bidirectional_dijkstra_fast(graph, source, target):
+    """Non-generator bidirectional Dijkstra returning a ShortestPathResult.
+
+    Only the source-to-target path and distance are final; other entries of
+    ``dist`` are whatever the forward search settled.
+    """
+    from core.graph.results import ShortestPathResult
+    best, meet, dist, prev = run_to_completion(_search(graph, source, target, False))
+    forward_dist, forward_prev = dict(dist[0]), dict(prev[0])
+    if meet is not None:
+        # Graft the backward half onto the forward tree so path_to(target) works
+        cur = meet
+        while prev[1][cur] is not None:
+            forward_prev[prev[1][cur]] = cur
+            cur = prev[1][cur]
+        forward_dist[target] = best
+    return ShortestPathResult(source, forward_dist, forward_prev, target=target)
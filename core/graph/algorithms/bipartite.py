@@ -27,4 +27,24 @@ def is_bipartite(graph, visualize=False):
                         return False
     if visualize:
         yield ("done", True, color, None)
-    return True 
\ No newline at end of file
+    return True 
+
+def is_bipartite_fast(graph):
+    """Non-generator bipartite check returning a BipartiteResult."""
+    from collections import deque
+    from core.graph.results import BipartiteResult
+    color = {}
+    for u in graph.get_vertices():
+        if u in color:
+            continue
+        color[u] = 0
+        queue = deque([u])
+        while queue:
+            v = queue.popleft()
+            for w, _ in graph.get_neighbors(v):
+                if w not in color:
+                    color[w] = 1 - color[v]
+                    queue.append(w)
+                elif color[w] == color[v]:
+                    return BipartiteResult(False, color, (v, w))
+    return BipartiteResult(True, color)
@@ -27,4 +27,26 @@ def connected_components(graph, visualize=False):
             color_id += 1
     if visualize:
         yield ("done", components, color_map)
-    return components 
\ No newline at end of file
+    return components 
+
+def connected_components_fast(graph):
+    """Non-generator connected components returning a ComponentsResult."""
+    from collections import deque
+    from core.graph.results import ComponentsResult
+    visited = set()
+    components = []
+    for u in graph.get_vertices():
+        if u in visited:
+            continue
+        visited.add(u)
+        comp = [u]
+        queue = deque([u])
+        while queue:
+            v = queue.popleft()
+            for w, _ in graph.get_neighbors(v):
+                if w not in visited:
+                    visited.add(w)
+                    comp.append(w)
+                    queue.append(w)
+        components.append(comp)
+    return ComponentsResult(components)
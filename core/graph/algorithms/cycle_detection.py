@@ -36,4 +36,30 @@ def has_cycle(graph, visualize=False):
                 break
     if visualize:
         yield ("done", bool(found_cycle), found_cycle)
-    return bool(found_cycle) 
\ No newline at end of file
+    return bool(found_cycle) 
+
+def has_cycle_fast(graph):
+    """Non-generator (iterative) directed cycle detection returning a CycleResult."""
+    from core.graph.results import CycleResult
+    WHITE, GREY, BLACK = 0, 1, 2
+    state = {}
+    for root in graph.get_vertices():
+        if state.get(root, WHITE) != WHITE:
+            continue
+        path = [root]
+        state[root] = GREY
+        stack = [iter(graph.get_neighbors(root))]
+        while stack:
+            for v, _ in stack[-1]:
+                s = state.get(v, WHITE)
+                if s == WHITE:
+                    state[v] = GREY
+                    path.append(v)
+                    stack.append(iter(graph.get_neighbors(v)))
+                    break
+                if s == GREY:
+                    return CycleResult(True, path[path.index(v):] + [v])
+            else:
+                state[path.pop()] = BLACK
+                stack.pop()
+    return CycleResult(False, [])
@@ -33,4 +33,32 @@ def has_cycle_undirected(graph, visualize=False):
                 break
     if visualize:
         yield ("done", bool(found_cycle), found_cycle)
-    return bool(found_cycle) 
\ No newline at end of file
+    return bool(found_cycle) 
+
+def has_cycle_undirected_fast(graph):
+    """Non-generator (iterative) undirected cycle detection returning a CycleResult."""
+    from core.graph.results import CycleResult
+    visited = set()
+    for root in graph.get_vertices():
+        if root in visited:
+            continue
+        visited.add(root)
+        path = [root]
+        on_path = {root: 0}
+        stack = [(None, iter(graph.get_neighbors(root)))]
+        while stack:
+            parent, it = stack[-1]
+            for v, _ in it:
+                if v not in visited:
+                    visited.add(v)
+                    on_path[v] = len(path)
+                    stack.append((path[-1], iter(graph.get_neighbors(v))))
+                    path.append(v)
+                    break
+                if v != parent:
+                    idx = on_path.get(v, 0)
+                    return CycleResult(True, path[idx:] + [v])
+            else:
+                del on_path[path.pop()]
+                stack.pop()
+    return CycleResult(False, [])
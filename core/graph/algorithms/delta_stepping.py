@@ -0,0 +1,197 @@
+"""
+Delta-stepping single-source shortest paths over a CSR graph (NumPy batched)
+
+Tentative distances are grouped into buckets of width ``delta``.  The lowest
+non-empty bucket is emptied by repeatedly relaxing its light edges
+(w <= delta) as one batch, then the heavy edges (w > delta) of every vertex
+removed from it are relaxed once.  Each relaxation batch expands the CSR
+rows of many vertices at once and resolves competing updates with a single
+sort, so the work is done in NumPy rather than one edge at a time.
+
+``mode`` runs the edge expansion of each batch serially, on a thread pool
+(NumPy releases the GIL), or on a process pool that reads the graph and the
+distance array from shared memory.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+# Per-worker NumPy views onto the shared blocks, set by _attach_worker
+_worker = {}
+
+def _split(offsets, targets, weights, keep):
+    """CSR rows restricted to the edges selected by the boolean mask ``keep``."""
+    import numpy as np
+    n = offsets.size - 1
+    rows = np.repeat(np.arange(n), np.diff(offsets))
+    new_offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows[keep], minlength=n), out=new_offsets[1:])
+    return new_offsets, targets[keep], weights[keep]
+
+def _expand(offsets, targets, weights, dist, ids):
+    """Candidate relaxations (target, distance, source) from vertices ``ids`` that improve ``dist``."""
+    import numpy as np
+    starts = offsets[ids]
+    counts = offsets[ids + 1] - starts
+    total = int(counts.sum())
+    if not total:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, np.empty(0), empty
+    src = np.repeat(ids, counts)
+    first = np.cumsum(counts) - counts
+    edge = np.arange(total) - np.repeat(first - starts, counts)
+    tgt = targets[edge]
+    cand = dist[src] + weights[edge]
+    better = cand < dist[tgt]
+    return tgt[better], cand[better], src[better]
+
+def _expand_shared(part, ids):
+    views = _worker['views']
+    offsets, targets, weights = views[part]
+    return _expand(offsets, targets, weights, views['dist'], ids)
+
+def _attach_worker(specs):
+    import numpy as np
+    from core.graph.algorithms.all_pairs_dijkstra import _attach
+    blocks = []
+    views = {}
+    for key, fields in specs.items():
+        arrays = []
+        for name, dtype, size in fields:
+            block = _attach(name)
+            blocks.append(block)
+            arrays.append(np.ndarray((size,), dtype=dtype, buffer=block.buf))
+        views[key] = arrays[0] if key == 'dist' else tuple(arrays)
+    _worker['blocks'] = blocks
+    _worker['views'] = views
+
+class _Relaxer:
+    """Runs the edge expansion of a batch serially or on a thread/process pool."""
+    def __init__(self, parts, dist, mode, jobs):
+        import numpy as np
+        self.parts = parts
+        self.dist = dist
+        self.mode = mode
+        self.jobs = jobs
+        self.pool = None
+        self.blocks = []
+        if mode == "thread":
+            self.pool = ThreadPoolExecutor(jobs)
+        elif mode == "process":
+            specs = {}
+            for key, arrays in list(parts.items()) + [('dist', (dist,))]:
+                fields = []
+                for arr in arrays:
+                    block = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+                    self.blocks.append(block)
+                    shared = np.ndarray(arr.shape, dtype=arr.dtype, buffer=block.buf)
+                    shared[:] = arr
+                    fields.append((block.name, arr.dtype.str, arr.size))
+                    if key == 'dist':
+                        # The parent keeps writing distances into the shared copy
+                        self.dist = shared
+                specs[key] = fields
+            self.pool = ProcessPoolExecutor(jobs, initializer=_attach_worker, initargs=(specs,))
+        elif mode != "serial":
+            raise ValueError(f"Unknown mode {mode!r}; choose 'serial', 'thread' or 'process'.")
+
+    def relax(self, part, ids, prev):
+        """Apply the best improving relaxation per target; return the improved vertex ids."""
+        import numpy as np
+        dist = self.dist
+        if self.pool is None or ids.size < 2 * self.jobs:
+            tgt, cand, src = _expand(*self.parts[part], dist, ids)
+        else:
+            chunks = np.array_split(ids, self.jobs)
+            if self.mode == "thread":
+                results = list(self.pool.map(lambda c: _expand(*self.parts[part], dist, c), chunks))
+            else:
+                results = list(self.pool.map(_expand_shared, [part] * len(chunks), chunks))
+            tgt, cand, src = (np.concatenate(r) for r in zip(*results))
+        if not tgt.size:
+            return tgt
+        order = np.lexsort((cand, tgt))
+        tgt, cand, src = tgt[order], cand[order], src[order]
+        first = np.empty(tgt.size, dtype=bool)
+        first[0] = True
+        np.not_equal(tgt[1:], tgt[:-1], out=first[1:])
+        tgt, cand, src = tgt[first], cand[first], src[first]
+        dist[tgt] = cand
+        prev[tgt] = src
+        return tgt
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+
+def delta_stepping(graph, source, delta=None, mode="serial", jobs=None):
+    """Single-source shortest paths for non-negative weights; returns ``(dist, prev)`` dicts.
+
+    ``delta`` is the bucket width (default: the mean edge weight).  ``mode``
+    is "serial", "thread" or "process", with ``jobs`` workers (default: every
+    core).  Without NumPy this falls back to Dijkstra with the same result.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        from core.graph.algorithms.dijkstra import dijkstra_fast
+        result = dijkstra_fast(graph, source)
+        return result.dist, result.prev
+    from core.graph.csr import CSRGraph, typecode
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    labels = csr.labels
+    n = len(labels)
+    offsets, targets, weights = csr.as_numpy()
+    weights = weights.astype(np.float64)
+    targets = targets.astype(np.int64)
+    if weights.size and weights.min() < 0:
+        raise ValueError("Delta-stepping needs non-negative edge weights; use bellman_ford or spfa.")
+    if delta is None:
+        delta = float(weights.mean()) if weights.size else 1.0
+    if delta <= 0:
+        delta = 1.0
+    light = weights <= delta
+    parts = {
+        'light': _split(offsets, targets, weights, light),
+        'heavy': _split(offsets, targets, weights, ~light),
+    }
+    dist = np.full(n, np.inf)
+    prev = np.full(n, -1, dtype=np.int64)
+    settled = np.zeros(n, dtype=bool)
+    s = csr.index[source]
+    relaxer = _Relaxer(parts, dist, mode, jobs or os.cpu_count() or 1)
+    dist = relaxer.dist
+    dist[s] = 0
+    pending = np.array([s], dtype=np.int64)
+    try:
+        while True:
+            pending = np.unique(pending[~settled[pending]])
+            if not pending.size:
+                break
+            bucket_end = (np.floor(dist[pending].min() / delta) + 1) * delta
+            active = pending[dist[pending] < bucket_end]
+            removed = []
+            # Light edges can refill the current bucket, so repeat until it stays empty
+            while active.size:
+                removed.append(active)
+                improved = relaxer.relax('light', active, prev)
+                pending = np.concatenate((pending, improved))
+                active = improved[dist[improved] < bucket_end]
+            removed = np.unique(np.concatenate(removed))
+            settled[removed] = True
+            # Heavy edges always land in a later bucket, so one pass suffices
+            pending = np.concatenate((pending, relaxer.relax('heavy', removed, prev)))
+        dist = dist.copy()
+    finally:
+        relaxer.close()
+    integral = typecode(csr.weights) == 'q'
+    dist_out = {}
+    prev_out = {}
+    for i, label in enumerate(labels):
+        d = dist[i]
+        dist_out[label] = (int(d) if integral else float(d)) if d != np.inf else float('inf')
+        prev_out[label] = labels[prev[i]] if prev[i] >= 0 else None
+    return dist_out, prev_out
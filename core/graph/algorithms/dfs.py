@@ -12,4 +12,20 @@ def dfs(graph, start):
             visited.add(u)
             for v, _ in reversed(graph.get_neighbors(u)):
                 if v not in visited:
-                    stack.append(v) 
\ No newline at end of file
+                    stack.append(v) 
+
+def dfs_fast(graph, start):
+    """Non-generator DFS returning the visit order as a TraversalResult."""
+    from core.graph.results import TraversalResult
+    visited = set()
+    order = []
+    stack = [start]
+    while stack:
+        u = stack.pop()
+        if u not in visited:
+            visited.add(u)
+            order.append(u)
+            for v, _ in reversed(graph.get_neighbors(u)):
+                if v not in visited:
+                    stack.append(v)
+    return TraversalResult(order)
@@ -1,40 +1,59 @@
 """
 Dijkstra's Algorithm for shortest path (step-by-step visualization)
 """
-def dijkstra(graph, source, visualize=False):
-    import heapq
+def dijkstra(graph, source, visualize=False, target=None, queue="heap"):
+    from core.priority_queue import make_queue
+    from core.graph.results import PathMap
     dist = {v: float('inf') for v in graph.get_vertices()}
     prev = {v: None for v in graph.get_vertices()}
     dist[source] = 0
-    heap = [(0, source)]
-    visited = set()
+    heap = make_queue(queue)
+    heap.push(source, 0)
     while heap:
-        d, u = heapq.heappop(heap)
-        if u in visited:
-            continue
-        visited.add(u)
+        d, u = heap.pop()
         if visualize:
             yield ("visit", u, d)
+        if u == target:
+            # Point-to-point query: the target's distance is final once settled
+            break
         for v, w in graph.get_neighbors(u):
             if dist[v] > dist[u] + w:
                 dist[v] = dist[u] + w
                 prev[v] = u
-                heapq.heappush(heap, (dist[v], v))
+                heap.push(v, dist[v])
                 if visualize:
                     yield ("update", v, dist[v])
-    # Reconstruct paths for all nodes
-    paths = {}
-    for target in dist:
-        path = []
-        cur = target
-        while cur is not None:
-            path.append(cur)
-            cur = prev.get(cur, None)
-        path.reverse()
-        if len(path) > 1 or (len(path) == 1 and path[0] == source):
-            paths[target] = path
-        else:
-            paths[target] = []
+    # Paths are rebuilt from prev only for the targets that are looked up
+    paths = PathMap(source, dist, prev)
     if visualize:
         yield ("done", dist, prev, paths)
-    return dist, prev, paths 
\ No newline at end of file
+    return dist, prev, paths 
+
+def dijkstra_fast(graph, source, target=None, queue="heap"):
+    """Non-generator Dijkstra returning a ShortestPathResult.
+
+    With ``target`` the search stops as soon as the target is settled; only
+    distances of settled vertices are final in that case.  ``queue`` names a
+    priority queue from ``core.priority_queue``.
+    """
+    from core.priority_queue import make_queue
+    from core.graph.results import ShortestPathResult
+    inf = float('inf')
+    dist = dict.fromkeys(graph.get_vertices(), inf)
+    prev = dict.fromkeys(dist)
+    dist[source] = 0
+    heap = make_queue(queue)
+    heap.push(source, 0)
+    push, pop = heap.push, heap.pop
+    get_neighbors = graph.get_neighbors
+    while heap:
+        d, u = pop()
+        if u == target:
+            break
+        for v, w in get_neighbors(u):
+            nd = d + w
+            if nd < dist.get(v, inf):
+                dist[v] = nd
+                prev[v] = u
+                push(v, nd)
+    return ShortestPathResult(source, dist, prev, target=target)
@@ -10,16 +10,113 @@ def floyd_warshall(graph, visualize=False):
     for u in vertices:
         dist[idx[u]][idx[u]] = 0
         for v, w in graph.get_neighbors(u):
-            dist[idx[u]][idx[v]] = w
-            next_hop[idx[u]][idx[v]] = v
+            # Keep the lightest of parallel edges; a self-loop only matters if negative
+            if w < dist[idx[u]][idx[v]]:
+                dist[idx[u]][idx[v]] = w
+                next_hop[idx[u]][idx[v]] = v
     for k in range(n):
+        row_k = dist[k]
+        updates = []
         for i in range(n):
+            row_i = dist[i]
+            d_ik = row_i[k]
             for j in range(n):
-                if dist[i][j] > dist[i][k] + dist[k][j]:
-                    dist[i][j] = dist[i][k] + dist[k][j]
+                if row_i[j] > d_ik + row_k[j]:
+                    row_i[j] = d_ik + row_k[j]
                     next_hop[i][j] = next_hop[i][k]
                     if visualize:
-                        yield ("update", vertices[i], vertices[j], dist[i][j])
+                        updates.append((vertices[i], vertices[j], row_i[j]))
+        # One aggregated event per intermediate vertex instead of one per cell
+        if visualize and updates:
+            yield ("round", vertices[k], updates)
     if visualize:
         yield ("done", dist, next_hop, vertices)
-    return dist, next_hop 
\ No newline at end of file
+    return dist, next_hop
+
+def _initial_matrices(graph):
+    vertices = list(graph.get_vertices())
+    idx = {v: i for i, v in enumerate(vertices)}
+    edges = []
+    for u in vertices:
+        for v, w in graph.get_neighbors(u):
+            edges.append((idx[u], idx[v], w))
+    return vertices, edges
+
+def _floyd_warshall_numpy(n, edges, block_size):
+    import numpy as np
+    dist = np.full((n, n), np.inf)
+    next_hop = np.full((n, n), -1, dtype=np.int32)
+    diag = np.arange(n)
+    dist[diag, diag] = 0
+    next_hop[diag, diag] = diag
+    if edges:
+        src, dst, w = (np.array(col) for col in zip(*edges))
+        # Lightest parallel edge wins; the zero diagonal absorbs non-negative self-loops
+        np.minimum.at(dist, (src, dst), w)
+        next_hop[src, dst] = dst
+    if not block_size or block_size >= n:
+        for k in range(n):
+            cand = dist[:, k, None] + dist[k]
+            better = cand < dist
+            np.copyto(dist, cand, where=better)
+            np.copyto(next_hop, np.broadcast_to(next_hop[:, k, None], next_hop.shape), where=better)
+        return dist, next_hop
+    # Cache-blocked sweep: for each block of pivots, finish the pivot rows
+    # first, then relax every other row chunk against all pivots in the block
+    # while that chunk is still hot in cache.
+    for k0 in range(0, n, block_size):
+        pivots = range(k0, min(k0 + block_size, n))
+        chunks = [(k0, pivots.stop)] + [(r0, min(r0 + block_size, n)) for r0 in range(0, n, block_size) if r0 != k0]
+        for r0, r1 in chunks:
+            d = dist[r0:r1]
+            h = next_hop[r0:r1]
+            for k in pivots:
+                cand = d[:, k, None] + dist[k]
+                better = cand < d
+                np.copyto(d, cand, where=better)
+                np.copyto(h, np.broadcast_to(h[:, k, None], h.shape), where=better)
+    return dist, next_hop
+
+def floyd_warshall_fast(graph, block_size=None):
+    """Non-generator Floyd-Warshall returning an AllPairsResult.
+
+    ``next_hop[i][j]`` is the index of the first vertex after ``i`` on the
+    shortest ``i -> j`` path, or -1 when ``j`` is unreachable.  With NumPy
+    installed the matrices are NumPy arrays computed by a vectorized min-plus
+    kernel; ``block_size`` enables the cache-blocked variant of that kernel.
+    """
+    from core.graph.results import AllPairsResult
+    vertices, edges = _initial_matrices(graph)
+    n = len(vertices)
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        dist, next_hop = _floyd_warshall_numpy(n, edges, block_size)
+        return AllPairsResult(vertices, dist, next_hop)
+    inf = float('inf')
+    dist = [[inf] * n for _ in range(n)]
+    next_hop = [[-1] * n for _ in range(n)]
+    for i in range(n):
+        dist[i][i] = 0
+        next_hop[i][i] = i
+    for i, j, w in edges:
+        if w < dist[i][j]:
+            dist[i][j] = w
+            next_hop[i][j] = j
+    for k in range(n):
+        row_k = dist[k]
+        for i in range(n):
+            row_i = dist[i]
+            d_ik = row_i[k]
+            if d_ik == inf:
+                continue
+            hop_i = next_hop[i]
+            hop_ik = hop_i[k]
+            for j in range(n):
+                nd = d_ik + row_k[j]
+                if nd < row_i[j]:
+                    row_i[j] = nd
+                    hop_i[j] = hop_ik
+    return AllPairsResult(vertices, dist, next_hop)
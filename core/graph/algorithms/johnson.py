@@ -1,18 +1,13 @@
 """
 Johnson's Algorithm for all-pairs shortest paths (step-by-step visualization)
 """
-from core.graph.graph import Graph
+from core.graph.views import ReweightedView, SuperSourceView
 def johnson(graph, visualize=False):
-    from core.graph.algorithms.bellman_ford import bellman_ford
-    from core.graph.algorithms.dijkstra import dijkstra
+    from core.graph.algorithms.bellman_ford import bellman_ford, bellman_ford_fast
+    from core.graph.algorithms.dijkstra import dijkstra_fast
     vertices = list(graph.get_vertices())
-    new_graph = Graph(directed=True)
-    for u in vertices:
-        for v, w in graph.get_neighbors(u):
-            new_graph.add_edge(u, v, w)
     s = '__new__'
-    for v in vertices:
-        new_graph.add_edge(s, v, 0)
+    new_graph = SuperSourceView(graph, s)
     # Use generator to get both animation steps and the return value
     if visualize:
         gen = bellman_ford(new_graph, s, visualize=True)
@@ -27,37 +22,63 @@ def johnson(graph, visualize=False):
             return None
         h, _ = h_prev
         for step in steps:
-            yield step
+            # Bellman-Ford's own "done" would end the trace before the Dijkstra passes
+            if step[0] != "done":
+                yield step
     else:
-        h, _ = bellman_ford(new_graph, s)
-        if h is None:
-            if visualize:
-                yield ("negative_cycle",)
+        potentials = bellman_ford_fast(new_graph, s)
+        if potentials.negative_cycle:
             return None
+        h = potentials.dist
     # Ensure h contains all vertices (including those with no outgoing edges)
     for v in vertices + [s]:
         if v not in h:
             h[v] = float('inf')
     dist = {u: {v: float('inf') for v in vertices} for u in vertices}
+    # The reweighting does not depend on the source, so one view serves every run
+    reweighted_graph = ReweightedView(graph, h)
     for u in vertices:
-        def reweight(v, w):
-            return w + h[u] - h[v]
-        # Build reweighted graph for Dijkstra
-        reweighted_graph = Graph(directed=True)
-        for x in vertices:
-            for y, w in graph.get_neighbors(x):
-                reweighted_graph.add_edge(x, y, reweight(y, w))
         try:
-            d, _, _ = dijkstra(reweighted_graph, u)
+            d = dijkstra_fast(reweighted_graph, u).dist
         except Exception as e:
             if visualize:
                 yield ("error", f"Dijkstra failed for node {u}: {e}")
             continue
         for v in vertices:
-            if d[v] < float('inf'):
+            if d.get(v, float('inf')) < float('inf'):
                 dist[u][v] = d[v] - h[u] + h[v]
                 if visualize:
                     yield ("update", u, v, dist[u][v])
     if visualize:
         yield ("done", dist)
-    return dist 
\ No newline at end of file
+    return dist 
+
+def johnson_fast(graph, jobs=1):
+    """Non-generator Johnson returning an AllPairsResult.
+
+    The Dijkstra passes run on the CSR engine of all_pairs_dijkstra; ``jobs``
+    worker processes (``None`` for every core) share the reweighted graph.
+    """
+    from core.graph.algorithms.all_pairs_dijkstra import distance_matrix, multi_source_distances
+    from core.graph.algorithms.bellman_ford import bellman_ford_fast
+    from core.graph.csr import CSRGraph, typecode
+    from core.graph.results import AllPairsResult
+    inf = float('inf')
+    vertices = list(graph.get_vertices())
+    potentials = bellman_ford_fast(SuperSourceView(graph, '__new__'), '__new__')
+    if potentials.negative_cycle:
+        return AllPairsResult(vertices, None, negative_cycle=True)
+    h = potentials.dist
+    # CSR ids start with ``vertices`` in order; any sink-only vertices follow
+    csr = CSRGraph.from_graph(ReweightedView(graph, h))
+    m = len(vertices)
+    out = multi_source_distances(csr, range(m), jobs)
+    dist = distance_matrix(out, m, len(csr.labels), typecode(csr.weights) == 'q')
+    hv = [h[v] for v in vertices]
+    if isinstance(dist, list):
+        dist = [[row[j] - hv[i] + hv[j] if row[j] < inf else inf for j in range(m)] for i, row in enumerate(dist)]
+    else:
+        import numpy as np
+        hv = np.array(hv, dtype=np.float64)
+        dist = dist[:, :m] - hv[:, None] + hv[None, :]
+    return AllPairsResult(vertices, dist)
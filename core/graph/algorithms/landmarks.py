@@ -0,0 +1,72 @@
+"""
+ALT (A*, Landmarks, Triangle inequality) preprocessing for graph A*
+
+A few landmark vertices are chosen by farthest-point selection, and exact
+distances to and from each landmark are precomputed.  For any landmark L the
+triangle inequality gives the lower bounds
+
+    d(v, t) >= d(L, t) - d(L, v)    and    d(v, t) >= d(v, L) - d(t, L)
+
+and the largest of them is an admissible heuristic for A*.
+"""
+from weakref import WeakKeyDictionary
+from core.graph.views import ReverseView, graph_signature
+
+# graph -> {count: (graph signature, Landmarks)}
+_landmark_cache = WeakKeyDictionary()
+
+class Landmarks:
+    """Landmark distance tables for one graph (non-negative weights only)."""
+    def __init__(self, graph, count=4):
+        from core.graph.algorithms.dijkstra import dijkstra_fast
+        inf = float('inf')
+        vertices = graph.get_vertices()
+        reverse = ReverseView(graph) if graph.directed else None
+        self.landmarks = []
+        # One (d(L, .), d(., L)) pair of distance dicts per landmark
+        self.tables = []
+        if not vertices:
+            return
+        if any(w < 0 for u in vertices for _, w in graph.get_neighbors(u)):
+            raise ValueError("Landmark (ALT) bounds need non-negative edge weights.")
+        seed = dijkstra_fast(graph, vertices[0]).dist
+        candidate = max(vertices, key=lambda v: seed.get(v, inf) if seed.get(v, inf) < inf else -1)
+        # Distance from the nearest chosen landmark; the farthest vertex is picked next
+        nearest = dict.fromkeys(vertices, inf)
+        while candidate is not None and len(self.landmarks) < count:
+            from_l = dijkstra_fast(graph, candidate).dist
+            to_l = dijkstra_fast(reverse, candidate).dist if reverse else from_l
+            self.landmarks.append(candidate)
+            self.tables.append((from_l, to_l))
+            for v in nearest:
+                d = from_l.get(v, inf)
+                if d < nearest[v]:
+                    nearest[v] = d
+            # Unreached vertices (inf) win, so other components get a landmark too
+            candidate = max(nearest, key=nearest.get)
+            if nearest[candidate] == 0:
+                candidate = None
+
+    def heuristic(self, v, target):
+        """Admissible lower bound on d(v, target)."""
+        inf = float('inf')
+        best = 0
+        for from_l, to_l in self.tables:
+            l_v, l_t = from_l.get(v, inf), from_l.get(target, inf)
+            if l_v < inf and l_t < inf and l_t - l_v > best:
+                best = l_t - l_v
+            v_l, t_l = to_l.get(v, inf), to_l.get(target, inf)
+            if v_l < inf and t_l < inf and v_l - t_l > best:
+                best = v_l - t_l
+        return best
+
+def landmarks_for(graph, count=4):
+    """Landmarks for ``graph``, reused across queries until the graph changes."""
+    signature = graph_signature(graph)
+    per_graph = _landmark_cache.setdefault(graph, {})
+    cached = per_graph.get(count)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    landmarks = Landmarks(graph, count)
+    per_graph[count] = (signature, landmarks)
+    return landmarks
@@ -1,29 +1,30 @@
 """
 Minimum Spanning Tree (MST) algorithms: Kruskal and Prim (step-by-step visualization)
 """
+from core.graph.disjoint_set import DisjointSet
+from core.priority_queue import make_queue
+from core.steps import run_to_completion
+
+def undirected_edges(graph):
+    """List each edge once as (u, v, w) in O(E).
+
+    An undirected Graph stores every edge at both endpoints; it is kept only
+    at the endpoint seen first, so parallel edges survive and no pairwise
+    dedupe scan is needed.  Directed graphs yield every edge as-is.
+    """
+    vertices = graph.get_vertices()
+    if graph.directed:
+        return [(u, v, w) for u in vertices for v, w in graph.get_neighbors(u)]
+    order = {u: i for i, u in enumerate(vertices)}
+    return [(u, v, w) for u in vertices for v, w in graph.get_neighbors(u) if order[u] < order[v]]
+
 def kruskal(graph, visualize=False):
-    parent = {}
-    def find(u):
-        while parent[u] != u:
-            parent[u] = parent[parent[u]]
-            u = parent[u]
-        return u
-    def union(u, v):
-        pu, pv = find(u), find(v)
-        if pu != pv:
-            parent[pu] = pv
-    edges = []
-    for u in graph.get_vertices():
-        for v, w in graph.get_neighbors(u):
-            if (v, u, w) not in edges:  # avoid double counting
-                edges.append((u, v, w))
+    edges = undirected_edges(graph)
     edges.sort(key=lambda x: x[2])
-    for u in graph.get_vertices():
-        parent[u] = u
+    dsu = DisjointSet(graph.get_vertices())
     mst = []
     for u, v, w in edges:
-        if find(u) != find(v):
-            union(u, v)
+        if dsu.union(u, v):
             mst.append((u, v, w))
             if visualize:
                 yield ("add_edge", u, v, w)
@@ -31,27 +32,205 @@ def kruskal(graph, visualize=False):
         yield ("done", mst)
     return mst
 
-def prim(graph, visualize=False):
-    import heapq
+def prim(graph, visualize=False, queue="heap"):
     vertices = graph.get_vertices()
     if not vertices:
         return []
     start = vertices[0]
     visited = set([start])
-    heap = []
+    # Each queued vertex keyed by its cheapest known edge into the tree, from parent[v]
+    heap = make_queue(queue)
+    parent = {}
     for v, w in graph.get_neighbors(start):
-        heapq.heappush(heap, (w, start, v))
+        if v not in visited and heap.push(v, w):
+            parent[v] = start
     mst = []
     while heap and len(visited) < len(vertices):
-        w, u, v = heapq.heappop(heap)
-        if v not in visited:
-            visited.add(v)
-            mst.append((u, v, w))
-            if visualize:
-                yield ("add_edge", u, v, w)
-            for to, weight in graph.get_neighbors(v):
-                if to not in visited:
-                    heapq.heappush(heap, (weight, v, to))
+        w, v = heap.pop()
+        u = parent[v]
+        visited.add(v)
+        mst.append((u, v, w))
+        if visualize:
+            yield ("add_edge", u, v, w)
+        for to, weight in graph.get_neighbors(v):
+            if to not in visited and heap.push(to, weight):
+                parent[to] = v
     if visualize:
         yield ("done", mst)
     return mst
+
+def kruskal_fast(graph):
+    """Non-generator Kruskal returning a SpanningTreeResult."""
+    edges = undirected_edges(graph)
+    edges.sort(key=lambda x: x[2])
+    return kruskal_stream(edges, num_vertices=len(graph.get_vertices()))
+
+def kruskal_stream(sorted_edges, num_vertices=None):
+    """Kruskal over an iterable of (u, v, w) already sorted by weight.
+
+    Edges are consumed one at a time, so a pre-sorted edge file can be fed
+    through without loading it; with ``num_vertices`` the stream stops as
+    soon as the tree is complete.  Returns a SpanningTreeResult (a spanning
+    forest if the graph is disconnected).
+    """
+    from core.graph.results import SpanningTreeResult
+    dsu = DisjointSet()
+    union = dsu.union
+    mst = []
+    last = None
+    for u, v, w in sorted_edges:
+        if last is not None and w < last:
+            raise ValueError(f"Edges are not sorted by weight ({w} after {last}).")
+        last = w
+        if union(u, v):
+            mst.append((u, v, w))
+            if num_vertices is not None and len(mst) == num_vertices - 1:
+                break
+    return SpanningTreeResult(mst)
+
+def prim_fast(graph, queue="heap"):
+    """Non-generator Prim returning a SpanningTreeResult.
+
+    ``queue`` names a priority queue from ``core.priority_queue``; Prim's keys
+    are not monotone, so "radix" is rejected by the queue.
+    """
+    from core.graph.results import SpanningTreeResult
+    vertices = graph.get_vertices()
+    if not vertices:
+        return SpanningTreeResult([])
+    start = vertices[0]
+    visited = {start}
+    heap = make_queue(queue)
+    push = heap.push
+    parent = {}
+    for v, w in graph.get_neighbors(start):
+        if v not in visited and push(v, w):
+            parent[v] = start
+    mst = []
+    while heap and len(visited) < len(vertices):
+        w, v = heap.pop()
+        visited.add(v)
+        mst.append((parent[v], v, w))
+        for to, weight in graph.get_neighbors(v):
+            if to not in visited and push(to, weight):
+                parent[to] = v
+    return SpanningTreeResult(mst)
+
+def boruvka(graph, visualize=False):
+    """Borůvka's algorithm: every component adds its cheapest outgoing edge each round.
+
+    Returns a minimum spanning forest, so disconnected graphs are covered.
+    Ties are broken by edge position, which keeps the chosen edges acyclic.
+    """
+    edges = undirected_edges(graph)
+    dsu = DisjointSet(graph.get_vertices())
+    forest = []
+    round_no = 0
+    while edges:
+        cheapest = {}
+        for i, (u, v, w) in enumerate(edges):
+            ru, rv = dsu.find(u), dsu.find(v)
+            if ru == rv:
+                continue
+            key = (w, i)
+            for root in (ru, rv):
+                if root not in cheapest or key < cheapest[root]:
+                    cheapest[root] = key
+        if not cheapest:
+            break
+        round_no += 1
+        added = []
+        for _, i in sorted(set(cheapest.values()), key=lambda k: k[1]):
+            u, v, w = edges[i]
+            if dsu.union(u, v):
+                added.append((u, v, w))
+        forest.extend(added)
+        if visualize:
+            yield ("round", round_no, added)
+        # Edges inside a merged component can never be chosen again
+        edges = [(u, v, w) for u, v, w in edges if dsu.find(u) != dsu.find(v)]
+    if visualize:
+        yield ("done", forest)
+    return forest
+
+def _cheapest_in_chunk(chunk):
+    """Per-component minimum edge rank over one chunk of live edges (int64 max means none)."""
+    import numpy as np
+    n, cu, cv, rank = chunk
+    best = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(best, cu, rank)
+    np.minimum.at(best, cv, rank)
+    return best
+
+def boruvka_fast(graph, jobs=1):
+    """Non-generator Borůvka returning a SpanningTreeResult (a forest if disconnected).
+
+    With NumPy each round is a handful of vectorized passes over the edge
+    arrays: edges are ranked once by (weight, position), each component's
+    cheapest edge is a scatter-minimum of those ranks, components hook onto
+    the neighbour across that edge, and pointer jumping relabels them.
+    ``jobs`` > 1 splits the scatter-minimum over edge chunks across a process
+    pool and merges the partial minima.
+    """
+    from core.graph.results import SpanningTreeResult
+    try:
+        import numpy as np
+    except ImportError:
+        return SpanningTreeResult(run_to_completion(boruvka(graph)))
+    edges = undirected_edges(graph)
+    index = {u: i for i, u in enumerate(graph.get_vertices())}
+    if graph.directed:
+        # Sink-only vertices have no adjacency entry of their own
+        for _, v, _ in edges:
+            index.setdefault(v, len(index))
+    n, m = len(index), len(edges)
+    src = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=m)
+    dst = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=m)
+    weight = np.array([w for _, _, w in edges]) if edges else np.empty(0)
+    # order[r] is the edge of rank r; ties in weight keep edge order
+    order = np.argsort(weight, kind='stable')
+    rank = np.empty(m, dtype=np.int64)
+    rank[order] = np.arange(m)
+    none = np.iinfo(np.int64).max
+    comp = np.arange(n)
+    live = np.arange(m)
+    chosen = []
+    pool = None
+    if jobs is not None and jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(jobs)
+    try:
+        while live.size:
+            cu, cv = comp[src[live]], comp[dst[live]]
+            keep = cu != cv
+            live, cu, cv = live[keep], cu[keep], cv[keep]
+            if not live.size:
+                break
+            r = rank[live]
+            if pool is not None and live.size > 4 * jobs:
+                bounds = np.linspace(0, live.size, jobs + 1).astype(np.int64)
+                chunks = [(n, cu[a:b], cv[a:b], r[a:b]) for a, b in zip(bounds, bounds[1:])]
+                best = np.minimum.reduce(list(pool.map(_cheapest_in_chunk, chunks)))
+            else:
+                best = _cheapest_in_chunk((n, cu, cv, r))
+            best_c = np.flatnonzero(best != none)
+            best_e = order[best[best_c]]
+            # Hook each component onto the component across its cheapest edge
+            ends_u, ends_v = comp[src[best_e]], comp[dst[best_e]]
+            succ = np.arange(n)
+            succ[best_c] = np.where(ends_u == best_c, ends_v, ends_u)
+            # Two components that chose the same edge form a 2-cycle; the smaller id becomes the root
+            mutual = (succ[succ[best_c]] == best_c) & (best_c < succ[best_c])
+            succ[best_c[mutual]] = best_c[mutual]
+            chosen.append(best_e[~mutual])
+            while True:
+                jumped = succ[succ]
+                if np.array_equal(jumped, succ):
+                    break
+                succ = jumped
+            comp = succ[comp]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    ids = np.sort(np.concatenate(chosen)) if chosen else []
+    return SpanningTreeResult([edges[i] for i in ids])
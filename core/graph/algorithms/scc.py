@@ -44,4 +44,47 @@ def strongly_connected_components(graph, visualize=False):
                 yield ("component", list(component), list(sccs))
     if visualize:
         yield ("done", list(sccs))
-    return sccs 
\ No newline at end of file
+    return sccs 
+
+def strongly_connected_components_fast(graph):
+    """Non-generator (iterative) Kosaraju returning a ComponentsResult."""
+    from core.graph.results import ComponentsResult
+    vertices = graph.get_vertices()
+    visited = set()
+    order = []
+    for root in vertices:
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [(root, iter(graph.get_neighbors(root)))]
+        while stack:
+            u, it = stack[-1]
+            for v, _ in it:
+                if v not in visited:
+                    visited.add(v)
+                    stack.append((v, iter(graph.get_neighbors(v))))
+                    break
+            else:
+                order.append(u)
+                stack.pop()
+    transpose = {u: [] for u in order}
+    for u in order:
+        for v, _ in graph.get_neighbors(u):
+            transpose.setdefault(v, []).append(u)
+    visited.clear()
+    sccs = []
+    for root in reversed(order):
+        if root in visited:
+            continue
+        visited.add(root)
+        component = []
+        stack = [root]
+        while stack:
+            u = stack.pop()
+            component.append(u)
+            for v in transpose[u]:
+                if v not in visited:
+                    visited.add(v)
+                    stack.append(v)
+        sccs.append(component)
+    return ComponentsResult(sccs)
@@ -3,10 +3,12 @@ SPFA (Shortest Path Faster Algorithm) for shortest path (step-by-step visualizat
 """
 def spfa(graph, source, visualize=False):
     from collections import deque
-    dist = {v: float('inf') for v in graph.get_vertices()}
-    prev = {v: None for v in graph.get_vertices()}
-    in_queue = {v: False for v in graph.get_vertices()}
-    count = {v: 0 for v in graph.get_vertices()}
+    vertices = graph.get_vertices()
+    dist = {v: float('inf') for v in vertices}
+    prev = {v: None for v in vertices}
+    in_queue = {v: False for v in vertices}
+    count = {v: 0 for v in vertices}
+    n = len(vertices)
     dist[source] = 0
     queue = deque([source])
     in_queue[source] = True
@@ -20,15 +22,46 @@ def spfa(graph, source, visualize=False):
                 dist[v] = dist[u] + w
                 prev[v] = u
                 if not in_queue[v]:
+                    # Count queue entries, not relaxations: parallel edges
+                    # can improve v many times while it waits in the queue
+                    count[v] += 1
+                    if count[v] > n:
+                        if visualize:
+                            yield ("negative_cycle",)
+                        return None, None
                     queue.append(v)
                     in_queue[v] = True
-                count[v] += 1
-                if count[v] > len(graph.get_vertices()):
-                    if visualize:
-                        yield ("negative_cycle",)
-                    return None, None
                 if visualize:
                     yield ("update", v, dist[v])
     if visualize:
         yield ("done", dist, prev)
-    return dist, prev 
\ No newline at end of file
+    return dist, prev 
+
+def spfa_fast(graph, source):
+    """Non-generator SPFA returning a ShortestPathResult."""
+    from collections import deque
+    from core.graph.results import ShortestPathResult
+    inf = float('inf')
+    dist = dict.fromkeys(graph.get_vertices(), inf)
+    prev = dict.fromkeys(dist)
+    n = len(dist)
+    count = {}
+    in_queue = {source}
+    dist[source] = 0
+    queue = deque([source])
+    get_neighbors = graph.get_neighbors
+    while queue:
+        u = queue.popleft()
+        in_queue.discard(u)
+        du = dist[u]
+        for v, w in get_neighbors(u):
+            if du + w < dist.get(v, inf):
+                dist[v] = du + w
+                prev[v] = u
+                if v not in in_queue:
+                    count[v] = count.get(v, 0) + 1
+                    if count[v] > n:
+                        return ShortestPathResult(source, None, None, negative_cycle=True)
+                    queue.append(v)
+                    in_queue.add(v)
+    return ShortestPathResult(source, dist, prev)
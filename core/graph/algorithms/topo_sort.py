@@ -29,3 +29,24 @@ def topo_sort(graph, visualize=False):
     if visualize:
         yield ("done", list(topo_order))
     return topo_order
+
+def topo_sort_fast(graph):
+    """Non-generator Kahn topological sort; the order is empty if a cycle exists."""
+    from collections import deque
+    from core.graph.results import TraversalResult
+    in_degree = dict.fromkeys(graph.get_vertices(), 0)
+    for u in list(in_degree):
+        for v, _ in graph.get_neighbors(u):
+            in_degree[v] = in_degree.get(v, 0) + 1
+    queue = deque(u for u, d in in_degree.items() if d == 0)
+    topo_order = []
+    while queue:
+        u = queue.popleft()
+        topo_order.append(u)
+        for v, _ in graph.get_neighbors(u):
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                queue.append(v)
+    if len(topo_order) != len(in_degree):
+        return TraversalResult([])
+    return TraversalResult(topo_order)
@@ -42,4 +42,29 @@ def topo_sort_relax(graph, source, visualize=False):
     
     if visualize:
         yield ("done", dist, prev)
-    return dist, prev 
\ No newline at end of file
+    return dist, prev 
+
+def topo_sort_relax_fast(graph, source):
+    """Non-generator DAG shortest paths returning a ShortestPathResult."""
+    from collections import deque
+    from core.graph.results import ShortestPathResult
+    inf = float('inf')
+    in_degree = dict.fromkeys(graph.get_vertices(), 0)
+    for u in list(in_degree):
+        for v, _ in graph.get_neighbors(u):
+            in_degree[v] = in_degree.get(v, 0) + 1
+    dist = dict.fromkeys(in_degree, inf)
+    prev = dict.fromkeys(in_degree)
+    dist[source] = 0
+    queue = deque(u for u, d in in_degree.items() if d == 0)
+    while queue:
+        u = queue.popleft()
+        du = dist[u]
+        for v, w in graph.get_neighbors(u):
+            if du + w < dist[v]:
+                dist[v] = du + w
+                prev[v] = u
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                queue.append(v)
+    return ShortestPathResult(source, dist, prev)
@@ -0,0 +1,274 @@
+"""
+Contraction hierarchies for fast repeated point-to-point shortest-path queries
+
+Preprocessing contracts vertices one at a time in edge-difference order,
+adding a shortcut u -> x whenever the path u -> v -> x through the contracted
+vertex v is the only shortest one (no witness path avoids v).  A query then
+runs a bidirectional Dijkstra that only follows edges towards higher-ranked
+vertices, and shortcuts are unpacked back into original edges.
+"""
+import heapq
+import json
+
+class ContractionHierarchy:
+    """Preprocessed hierarchy over a static graph with non-negative weights.
+
+    ``up[v]`` maps ``x -> (w, mid)`` for edges ``v -> x`` with ``rank[x] > rank[v]``
+    and ``down[v]`` maps ``u -> (w, mid)`` for edges ``u -> v`` with
+    ``rank[u] > rank[v]``; ``mid`` is the contracted vertex a shortcut
+    bypasses, or -1 for an original edge.  All vertices are integer ids into
+    ``labels``.
+    """
+    def __init__(self, labels, rank, up, down, directed=True):
+        self.labels = labels
+        self.index = {label: i for i, label in enumerate(labels)}
+        self.rank = rank
+        self.up = up
+        self.down = down
+        self.directed = directed
+
+    @classmethod
+    def from_graph(cls, graph, witness_limit=500):
+        """Contract every vertex of ``graph``.
+
+        ``witness_limit`` caps the vertices settled by each witness search;
+        a failed search only costs an unnecessary shortcut, never a wrong answer.
+        """
+        labels = list(graph.get_vertices())
+        index = {label: i for i, label in enumerate(labels)}
+        for u in list(labels):
+            for v, _ in graph.get_neighbors(u):
+                if v not in index:
+                    index[v] = len(labels)
+                    labels.append(v)
+        n = len(labels)
+        # Remaining (uncontracted) graph: out_edges[u][v] = in_edges[v][u] = (w, mid)
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        for u in labels:
+            i = index[u]
+            for v, w in graph.get_neighbors(u):
+                if w < 0:
+                    raise ValueError("Contraction hierarchies need non-negative edge weights.")
+                j = index[v]
+                if i != j and w < out_edges[i].get(j, (float('inf'),))[0]:
+                    out_edges[i][j] = in_edges[j][i] = (w, -1)
+        builder = _Builder(out_edges, in_edges, witness_limit)
+        rank, up, down = builder.contract_all()
+        return cls(labels, rank, up, down, directed=graph.directed)
+
+    def distance(self, source, target):
+        return self._search(self.index[source], self.index[target])[0]
+
+    def shortest_path(self, source, target):
+        """Return a ShortestPathResult whose ``path`` is the unpacked source-to-target path."""
+        from core.graph.results import ShortestPathResult
+        best, meet, prev_f, prev_b = self._search(self.index[source], self.index[target])
+        if meet is None:
+            return ShortestPathResult(source, {source: 0, target: float('inf')}, {source: None}, target=target)
+        ids = self._unpack_route(meet, prev_f, prev_b)
+        labels = self.labels
+        prev = {labels[ids[0]]: None}
+        for a, b in zip(ids, ids[1:]):
+            prev[labels[b]] = labels[a]
+        return ShortestPathResult(source, {source: 0, target: best}, prev, target=target)
+
+    def _search(self, s, t):
+        inf = float('inf')
+        dist = ({s: 0}, {t: 0})
+        prev = ({s: None}, {t: None})
+        heaps = ([(0, s)], [(0, t)])
+        graphs = (self.up, self.down)
+        best, meet = (0, s) if s == t else (inf, None)
+        push, pop = heapq.heappush, heapq.heappop
+        side = 1
+        while (heaps[0] and heaps[0][0][0] < best) or (heaps[1] and heaps[1][0][0] < best):
+            # Alternate directions; a direction whose frontier passed best is finished
+            side = 1 - side
+            if not heaps[side] or heaps[side][0][0] >= best:
+                side = 1 - side
+            d, u = pop(heaps[side])
+            mine = dist[side]
+            if d > mine[u]:
+                continue
+            other = dist[1 - side].get(u)
+            if other is not None and d + other < best:
+                best, meet = d + other, u
+            for v, (w, _) in graphs[side][u].items():
+                nd = d + w
+                if nd < mine.get(v, inf):
+                    mine[v] = nd
+                    prev[side][v] = u
+                    push(heaps[side], (nd, v))
+        return best, meet, prev[0], prev[1]
+
+    def _unpack_route(self, meet, prev_f, prev_b):
+        # Hierarchy edges along the route, in order from source to target
+        edges = []
+        v = meet
+        while prev_f[v] is not None:
+            edges.append((prev_f[v], v))
+            v = prev_f[v]
+        edges.reverse()
+        v = meet
+        while prev_b[v] is not None:
+            edges.append((v, prev_b[v]))
+            v = prev_b[v]
+        walk = [edges[0][0]] if edges else [meet]
+        for a, b in edges:
+            walk.extend(self._unpack_edge(a, b))
+        # Zero-weight edges can make the unpacked walk revisit a vertex; cut
+        # those loops (they cost 0) so the route is a simple path
+        path = []
+        position = {}
+        for v in walk:
+            if v in position:
+                for u in path[position[v] + 1:]:
+                    del position[u]
+                del path[position[v] + 1:]
+            else:
+                position[v] = len(path)
+                path.append(v)
+        return path
+
+    def _unpack_edge(self, a, b):
+        """Original vertices after ``a`` on the hierarchy edge ``a -> b``."""
+        out = []
+        stack = [(a, b)]
+        while stack:
+            a, b = stack.pop()
+            mid = self._edge(a, b)[1]
+            if mid == -1:
+                out.append(b)
+            else:
+                # Expand a -> mid first, so push it last
+                stack.append((mid, b))
+                stack.append((a, mid))
+        return out
+
+    def _edge(self, a, b):
+        # Every hierarchy edge is stored at its lower-ranked endpoint
+        if self.rank[a] < self.rank[b]:
+            return self.up[a][b]
+        return self.down[b][a]
+
+    def save(self, path):
+        """Write the hierarchy as JSON (labels must be JSON-serializable)."""
+        data = {
+            "format": "contraction-hierarchy",
+            "version": 1,
+            "directed": self.directed,
+            "labels": self.labels,
+            "rank": self.rank,
+            "up": [[v, x, w, mid] for v, edges in enumerate(self.up) for x, (w, mid) in edges.items()],
+            "down": [[v, u, w, mid] for v, edges in enumerate(self.down) for u, (w, mid) in edges.items()],
+        }
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("format") != "contraction-hierarchy":
+            raise ValueError(f"{path} is not a saved contraction hierarchy.")
+        n = len(data["labels"])
+        up = [{} for _ in range(n)]
+        down = [{} for _ in range(n)]
+        for v, x, w, mid in data["up"]:
+            up[v][x] = (w, mid)
+        for v, u, w, mid in data["down"]:
+            down[v][u] = (w, mid)
+        return cls(data["labels"], data["rank"], up, down, directed=data["directed"])
+
+    def __repr__(self):
+        shortcuts = sum(1 for edges in self.up for _, mid in edges.values() if mid != -1)
+        shortcuts += sum(1 for edges in self.down for _, mid in edges.values() if mid != -1)
+        return f"ContractionHierarchy(vertices={len(self.labels)}, shortcuts={shortcuts})"
+
+class _Builder:
+    """Contraction state used only during preprocessing."""
+    def __init__(self, out_edges, in_edges, witness_limit):
+        self.out_edges = out_edges
+        self.in_edges = in_edges
+        self.witness_limit = witness_limit
+        self.deleted_neighbors = [0] * len(out_edges)
+
+    def contract_all(self):
+        n = len(self.out_edges)
+        rank = [0] * n
+        up = [None] * n
+        down = [None] * n
+        heap = [(self._priority(v, self._shortcuts(v)), v) for v in range(n)]
+        heapq.heapify(heap)
+        order = 0
+        while heap:
+            _, v = heapq.heappop(heap)
+            # Lazy update: re-evaluate and requeue if v is no longer the cheapest
+            shortcuts = self._shortcuts(v)
+            priority = self._priority(v, shortcuts)
+            if heap and priority > heap[0][0]:
+                heapq.heappush(heap, (priority, v))
+                continue
+            rank[v] = order
+            order += 1
+            up[v], down[v] = self._contract(v, shortcuts)
+        return rank, up, down
+
+    def _priority(self, v, shortcuts):
+        # Edge difference, plus contracted neighbours to spread contraction evenly
+        removed = len(self.in_edges[v]) + len(self.out_edges[v])
+        return len(shortcuts) - removed + self.deleted_neighbors[v]
+
+    def _shortcuts(self, v):
+        shortcuts = []
+        outgoing = self.out_edges[v]
+        if not outgoing:
+            return shortcuts
+        max_out = max(w for w, _ in outgoing.values())
+        for u, (w_uv, _) in self.in_edges[v].items():
+            witness = self._witness_search(u, v, w_uv + max_out, outgoing)
+            for x, (w_vx, _) in outgoing.items():
+                if x != u and witness.get(x, float('inf')) > w_uv + w_vx:
+                    shortcuts.append((u, x, w_uv + w_vx))
+        return shortcuts
+
+    def _witness_search(self, source, skip, limit, targets):
+        """Bounded Dijkstra from ``source`` in the remaining graph, avoiding ``skip``."""
+        dist = {source: 0}
+        heap = [(0, source)]
+        remaining = len(targets)
+        settled = 0
+        out_edges = self.out_edges
+        while heap and remaining and settled < self.witness_limit:
+            d, u = heapq.heappop(heap)
+            if d > limit:
+                break
+            if d > dist[u]:
+                continue
+            settled += 1
+            if u in targets:
+                remaining -= 1
+            for x, (w, _) in out_edges[u].items():
+                nd = d + w
+                if x != skip and nd <= limit and nd < dist.get(x, float('inf')):
+                    dist[x] = nd
+                    heapq.heappush(heap, (nd, x))
+        return dist
+
+    def _contract(self, v, shortcuts):
+        out_edges, in_edges = self.out_edges, self.in_edges
+        for u, x, w in shortcuts:
+            if w < out_edges[u].get(x, (float('inf'),))[0]:
+                out_edges[u][x] = in_edges[x][u] = (w, v)
+        up, down = out_edges[v], in_edges[v]
+        # Remove v from the remaining graph; its own edges now all lead upward
+        for u in down:
+            del out_edges[u][v]
+            self.deleted_neighbors[u] += 1
+        for x in up:
+            del in_edges[x][v]
+            self.deleted_neighbors[x] += 1
+        out_edges[v] = {}
+        in_edges[v] = {}
+        return up, down
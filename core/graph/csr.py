@@ -0,0 +1,136 @@
+"""
+Compact, read-only CSR (compressed sparse row) graph frozen from a Graph
+"""
+from array import array
+
+class CSRGraph:
+    """Immutable graph stored as flat offsets/targets/weights buffers.
+
+    Vertices are interned to integer ids 0..n-1 (``labels[i]`` is the original
+    label, ``index[label]`` the id).  The out-edges of vertex ``i`` are
+    ``targets[offsets[i]:offsets[i+1]]`` with matching ``weights``.  The class
+    exposes the same ``get_vertices``/``get_neighbors`` interface as ``Graph``,
+    so the algorithms in ``core/graph/algorithms`` can run on it unchanged.
+    """
+    def __init__(self, labels, offsets, targets, weights, directed=False):
+        self.labels = labels
+        self.index = {label: i for i, label in enumerate(labels)}
+        self.vertices = tuple(labels)
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.directed = directed
+
+    @classmethod
+    def from_graph(cls, graph):
+        labels = list(graph.get_vertices())
+        index = {label: i for i, label in enumerate(labels)}
+        # Directed graphs may reference sink-only vertices that have no adj entry
+        for u in list(labels):
+            for v, _ in graph.get_neighbors(u):
+                if v not in index:
+                    index[v] = len(labels)
+                    labels.append(v)
+        offsets = array('q', [0])
+        targets = array('i')
+        weight_list = []
+        for u in labels:
+            for v, w in graph.get_neighbors(u):
+                targets.append(index[v])
+                weight_list.append(w)
+            offsets.append(len(targets))
+        return cls(labels, offsets, targets, _weight_array(weight_list), directed=graph.directed)
+
+    @classmethod
+    def from_edges(cls, labels, sources, targets, weights, directed=False):
+        """Build from parallel edge arrays of integer ids (counting sort by source)."""
+        n = len(labels)
+        counts = array('q', bytes(8 * (n + 1)))
+        for s in sources:
+            counts[s + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        offsets = array('q', counts)
+        pos = array('q', counts)
+        out_targets = array('i', bytes(4 * len(sources)))
+        out_weights = array(typecode(weights), bytes(weights.itemsize * len(sources)))
+        for s, t, w in zip(sources, targets, weights):
+            p = pos[s]
+            out_targets[p] = t
+            out_weights[p] = w
+            pos[s] = p + 1
+        return cls(list(labels), offsets, out_targets, out_weights, directed=directed)
+
+    @classmethod
+    def from_arrays(cls, labels, sources, targets, weights, directed=False):
+        """Like ``from_edges`` for NumPy arrays: one stable sort by source instead of a Python loop."""
+        import numpy as np
+        n = len(labels)
+        order = np.argsort(sources, kind='stable')
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+        weights = np.asarray(weights)[order]
+        if weights.dtype.kind in 'iub':
+            out_weights = array('q', weights.astype(np.int64).tobytes())
+        else:
+            out_weights = array('d', weights.astype(np.float64).tobytes())
+        out_targets = array('i', np.asarray(targets)[order].astype(np.int32).tobytes())
+        return cls(list(labels), array('q', offsets.tobytes()), out_targets, out_weights, directed=directed)
+
+    def num_vertices(self):
+        return len(self.labels)
+
+    def num_edges(self):
+        return len(self.targets)
+
+    def get_vertices(self):
+        return self.vertices
+
+    def get_neighbors(self, u):
+        i = self.index.get(u)
+        if i is None:
+            return []
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        labels = self.labels
+        return [(labels[t], w) for t, w in zip(self.targets[lo:hi], self.weights[lo:hi])]
+
+    def neighbor_ids(self, i):
+        """Return (targets, weights) slices for vertex id ``i``."""
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        return self.targets[lo:hi], self.weights[lo:hi]
+
+    def thaw(self):
+        """Return a mutable Graph with the same vertices and edges."""
+        from core.graph.graph import Graph
+        graph = Graph(directed=self.directed)
+        labels, offsets, targets, weights = self.labels, self.offsets, self.targets, self.weights
+        adj = graph.adj
+        for i, label in enumerate(labels):
+            lo, hi = offsets[i], offsets[i + 1]
+            adj[label] = list(zip(map(labels.__getitem__, targets[lo:hi]), weights[lo:hi]))
+        graph._changed()
+        return graph
+
+    def as_numpy(self):
+        """Zero-copy NumPy views of (offsets, targets, weights)."""
+        import numpy as np
+        return (np.frombuffer(self.offsets, dtype=np.int64),
+                np.frombuffer(self.targets, dtype=np.int32),
+                np.frombuffer(self.weights, dtype=np.int64 if typecode(self.weights) == 'q' else np.float64))
+
+    def __repr__(self):
+        return f"CSRGraph(vertices={self.num_vertices()}, edges={self.num_edges()}, directed={self.directed})"
+
+def typecode(buf):
+    """Item format of an ``array`` or a memoryview (e.g. of a mapped snapshot): 'q', 'i' or 'd'."""
+    code = getattr(buf, 'typecode', None)
+    return code if code is not None else buf.format
+
+def _weight_array(weights):
+    # Keep integer weights integral so distances print the same as with Graph
+    if all(isinstance(w, int) for w in weights):
+        try:
+            return array('q', weights)
+        except OverflowError:
+            pass
+    return array('d', weights)
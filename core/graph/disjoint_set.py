@@ -0,0 +1,50 @@
+"""
+Disjoint-set union (union-find) with union by rank and path halving
+"""
+class DisjointSet:
+    """Union-find over arbitrary hashable items; unknown items are added on first use."""
+    def __init__(self, items=()):
+        self.parent = {}
+        self.rank = {}
+        self.sets = 0
+        for item in items:
+            self.add(item)
+
+    def add(self, item):
+        if item not in self.parent:
+            self.parent[item] = item
+            self.rank[item] = 0
+            self.sets += 1
+
+    def find(self, item):
+        parent = self.parent
+        if item not in parent:
+            self.add(item)
+            return item
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a, b):
+        """Merge the sets of ``a`` and ``b``; return False if they were already joined."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        rank = self.rank
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
+        self.sets -= 1
+        return True
+
+    def connected(self, a, b):
+        return self.find(a) == self.find(b)
+
+    def __len__(self):
+        return len(self.parent)
+
+    def __repr__(self):
+        return f"DisjointSet(items={len(self.parent)}, sets={self.sets})"
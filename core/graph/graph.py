@@ -1,22 +1,77 @@
 """
 Simple Graph class for algorithms (adjacency list)
+
+Every vertex, including a sink of a directed graph, has an entry in ``adj``.
+Change the graph through its methods: each mutation gives the graph a new
+``version`` and drops the cached vertex tuple.  Versions come from one
+counter shared by every Graph, so a version never repeats, even across
+graphs, and callers can key caches on it alone.
 """
+from itertools import count
+
+_versions = count(1)
+
 class Graph:
     def __init__(self, directed=False):
         self.adj = {}
         self.directed = directed
+        self.version = next(_versions)
+        self._vertices = None
 
-    def add_edge(self, u, v, weight=1):
+    def _changed(self):
+        self.version = next(_versions)
+        self._vertices = None
+
+    def add_vertex(self, u):
         if u not in self.adj:
             self.adj[u] = []
-        self.adj[u].append((v, weight))
+            self._changed()
+
+    def add_edge(self, u, v, weight=1):
+        adj = self.adj
+        if u not in adj:
+            adj[u] = []
+        if v not in adj:
+            adj[v] = []
+        adj[u].append((v, weight))
         if not self.directed:
-            if v not in self.adj:
-                self.adj[v] = []
-            self.adj[v].append((u, weight))
+            adj[v].append((u, weight))
+        self._changed()
+
+    def remove_edge(self, u, v):
+        """Remove every edge ``u -> v`` (and ``v -> u`` if the graph is undirected)."""
+        adj = self.adj
+        if u in adj:
+            adj[u] = [pair for pair in adj[u] if pair[0] != v]
+        if not self.directed and v in adj:
+            adj[v] = [pair for pair in adj[v] if pair[0] != u]
+        self._changed()
+
+    def remove_vertex(self, u):
+        """Remove ``u`` and every edge into or out of it."""
+        adj = self.adj
+        if u not in adj:
+            return
+        del adj[u]
+        for nbrs in adj.values():
+            nbrs[:] = [pair for pair in nbrs if pair[0] != u]
+        self._changed()
+
+    def num_vertices(self):
+        return len(self.adj)
 
     def get_vertices(self):
-        return list(self.adj.keys())
+        """Immutable tuple of the vertices, rebuilt only after the graph changes."""
+        vertices = self._vertices
+        # The length check also catches vertices added to or deleted from adj directly
+        if vertices is None or len(vertices) != len(self.adj):
+            vertices = self._vertices = tuple(self.adj)
+        return vertices
 
     def get_neighbors(self, u):
         return self.adj.get(u, [])
+
+    def freeze(self):
+        """Return an immutable array-backed CSRGraph snapshot of this graph."""
+        from core.graph.csr import CSRGraph
+        return CSRGraph.from_graph(self)
@@ -0,0 +1,487 @@
+"""
+Streaming graph readers and writers: edge list / CSV, DIMACS .gr, JSON and GraphML
+
+Readers consume the file a block of lines at a time and keep only flat edge
+arrays while reading.  With NumPy installed, each block of numeric
+edge-list or DIMACS lines is parsed in one call, vertex labels are interned
+with one ``np.unique`` at the end and the CSR rows are built with a single
+stable sort (``CSRGraph.from_arrays``); files with non-numeric labels, and
+installs without NumPy, fall back to parsing line by line.  Every reader
+returns a ``Graph``, or the frozen ``CSRGraph`` when ``frozen=True``.
+
+``progress(done, total)`` is called after every block: readers report the
+bytes read and the file size (``total`` is None for ``.gz`` files, which are
+decompressed on the fly), writers the edges written and the edge count.
+
+Numeric labels are read back as ints and integral weights stay integers.
+Undirected graphs are written with each edge once, except in DIMACS, which
+only knows arcs and gets one in each direction.
+"""
+import gzip
+import json
+import os
+import re
+import warnings
+from array import array
+from xml.etree.ElementTree import iterparse
+from xml.sax.saxutils import quoteattr
+from core.graph.csr import CSRGraph, _weight_array
+
+# Bytes read per block
+BLOCK_BYTES = 1 << 22
+# Edges formatted per write call
+BLOCK_EDGES = 1 << 16
+
+_SKIP = b'#%\r\n'
+_NOT_ARC = re.compile(rb'\n[^a]')
+_HEADER_NAMES = {"source", "target", "src", "dst", "from", "to", "node1", "node2", "weight"}
+
+FORMATS = {
+    ".txt": "edgelist", ".edges": "edgelist", ".el": "edgelist",
+    ".csv": "csv", ".tsv": "tsv",
+    ".gr": "dimacs", ".dimacs": "dimacs",
+    ".json": "json",
+    ".graphml": "graphml",
+    ".snap": "snapshot",
+}
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+def _open(path, mode):
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+def _total(path):
+    return None if str(path).endswith(".gz") else os.path.getsize(path)
+
+def _chunks(f):
+    """Yield the file as byte chunks of about BLOCK_BYTES that end on a line boundary."""
+    rest = b''
+    while True:
+        data = f.read(BLOCK_BYTES)
+        if not data:
+            if rest:
+                yield rest
+            return
+        data = rest + data
+        cut = data.rfind(b'\n') + 1
+        rest = data[cut:]
+        if cut:
+            yield data[:cut]
+
+def _count_lines(chunk):
+    return chunk.count(b'\n') + (chunk[-1:] != b'\n')
+
+def _plain(chunk, other=re.compile(rb'\n[#%\r\n]')):
+    """True when no line of ``chunk`` is a comment or blank, so it can be parsed without splitting."""
+    return chunk[:1] not in _SKIP and other.search(chunk) is None
+
+def _label(token):
+    """A vertex label from a file field: an int when it parses as one, else the stripped text."""
+    try:
+        return int(token)
+    except ValueError:
+        if isinstance(token, bytes):
+            token = token.decode()
+        return token.strip().strip('"')
+
+def _number(token):
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+def _parse_numeric(np, text, rows, cols):
+    """Parse ``rows`` lines of ``cols`` numbers in one call; None if any field is not numeric."""
+    for dtype in (np.int64, np.float64):
+        try:
+            with warnings.catch_warnings():
+                # Older NumPy only warns when the text stops parsing part way
+                warnings.simplefilter("error", DeprecationWarning)
+                values = np.fromstring(text, dtype=dtype, sep=' ')
+        except (ValueError, DeprecationWarning):
+            continue
+        if values.size != rows * cols:
+            return None
+        return values.reshape(rows, cols)
+    return None
+
+def _build(np, labels, sources, targets, weights, directed, frozen):
+    """CSRGraph (or thawed Graph) from edge arrays of ids, mirroring each edge when undirected."""
+    if np is None:
+        if not directed:
+            # Interleave the reverse arcs so rows keep the order Graph.add_edge gives them
+            sources, targets = (array('q', (x for pair in zip(a, b) for x in pair)) for a, b in ((sources, targets), (targets, sources)))
+            weights = [w for w in weights for _ in (0, 1)]
+        csr = CSRGraph.from_edges(labels, sources, targets, _weight_array(weights), directed=directed)
+    else:
+        if not directed:
+            sources, targets = np.column_stack((sources, targets)).ravel(), np.column_stack((targets, sources)).ravel()
+            weights = np.repeat(weights, 2)
+        csr = CSRGraph.from_arrays(labels, sources, targets, weights, directed=directed)
+    return csr if frozen else csr.thaw()
+
+class _EdgeBuffer:
+    """Edges collected by a reader: raw integer-label blocks until a label has to be interned one by one."""
+    def __init__(self, np):
+        self.np = np
+        self.blocks = []
+        self.generic = np is None
+        self.labels = []
+        self.index = {}
+        self.sources = array('q')
+        self.targets = array('q')
+        self.weights = []
+
+    def vertex(self, label):
+        if not self.generic:
+            self.generic = True
+            blocks, self.blocks = self.blocks, []
+            for block in blocks:
+                self.add_block(*block)
+        i = self.index.get(label)
+        if i is None:
+            i = self.index[label] = len(self.labels)
+            self.labels.append(label)
+        return i
+
+    def add(self, u, v, w):
+        self.sources.append(self.vertex(u))
+        self.targets.append(self.vertex(v))
+        self.weights.append(w)
+
+    def add_block(self, u, v, w):
+        """Add NumPy arrays of integer labels and weights."""
+        if self.generic:
+            for edge in zip(u.tolist(), v.tolist(), w.tolist()):
+                self.add(*edge)
+        else:
+            self.blocks.append((u, v, w))
+
+    def build(self, directed, frozen):
+        np = self.np
+        if np is None:
+            return _build(None, self.labels, self.sources, self.targets, self.weights, directed, frozen)
+        if self.generic:
+            weights = np.asarray(self.weights) if self.weights else np.empty(0, dtype=np.int64)
+            return _build(np, self.labels, np.frombuffer(self.sources, dtype=np.int64),
+                          np.frombuffer(self.targets, dtype=np.int64), weights, directed, frozen)
+        if not self.blocks:
+            return _build(np, [], np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), directed, frozen)
+        u, v, w = (np.concatenate(part) for part in zip(*self.blocks))
+        labels, ids = np.unique(np.concatenate((u, v)), return_inverse=True)
+        return _build(np, labels.tolist(), ids[:u.size], ids[u.size:], w, directed, frozen)
+
+def _edges(graph):
+    """Yield each edge as ``(u, v, w)``; an undirected edge is yielded once, not once per direction."""
+    vertices = graph.get_vertices()
+    if graph.directed:
+        for u in vertices:
+            for v, w in graph.get_neighbors(u):
+                yield u, v, w
+        return
+    order = {u: i for i, u in enumerate(vertices)}
+    for u in vertices:
+        i = order[u]
+        loop = False
+        for v, w in graph.get_neighbors(u):
+            j = order.get(v, i)
+            if i < j:
+                yield u, v, w
+            elif i == j:
+                # A self-loop is stored twice in its own row
+                loop = not loop
+                if loop:
+                    yield u, v, w
+
+def _num_edges(graph):
+    total = sum(len(graph.get_neighbors(u)) for u in graph.get_vertices())
+    return total if graph.directed else total // 2
+
+def _write_blocks(f, lines, total, progress):
+    """Write formatted edge lines in blocks, reporting progress after each."""
+    done = 0
+    block = []
+    for line in lines:
+        block.append(line)
+        if len(block) == BLOCK_EDGES:
+            f.write("".join(block))
+            done += len(block)
+            block.clear()
+            if progress:
+                progress(done, total)
+    f.write("".join(block))
+    done += len(block)
+    if progress:
+        progress(done, total)
+
+def read_edge_list(path, directed=False, delimiter=None, header=None, frozen=False, progress=None):
+    """Read ``u v [weight]`` lines (whitespace-separated, or ``delimiter=","`` for CSV).
+
+    Lines starting with ``#`` or ``%`` are comments; a missing weight is 1.
+    ``header=None`` skips the first line only when it names its columns
+    (e.g. ``source,target,weight``).
+    """
+    np = _numpy()
+    edges = _EdgeBuffer(np)
+    sep = delimiter.encode() if delimiter else None
+    total = _total(path)
+    numeric = np is not None
+    cols = None
+    with _open(path, 'rb') as f:
+        for chunk in _chunks(f):
+            rows = None
+            if header is not False:
+                rows = [line for line in chunk.splitlines() if line[:1] not in _SKIP]
+                if rows and (header or rows[0].split(sep)[0].strip().lower().decode(errors='replace') in _HEADER_NAMES):
+                    rows = rows[1:]
+                header = False
+            if numeric:
+                if rows is None and _plain(chunk):
+                    text, count = chunk, _count_lines(chunk)
+                else:
+                    if rows is None:
+                        rows = [line for line in chunk.splitlines() if line[:1] not in _SKIP]
+                    text, count = b"\n".join(rows), len(rows)
+                if cols is None and count:
+                    cols = len(text.split(b"\n", 1)[0].split(sep))
+                if count and cols in (2, 3):
+                    values = _parse_numeric(np, text if sep is None else text.replace(sep, b' '), count, cols)
+                    if values is not None and (values.dtype.kind == 'i' or np.array_equal(values[:, :2], np.floor(values[:, :2]))):
+                        weights = values[:, 2] if cols == 3 else np.ones(count, dtype=np.int64)
+                        edges.add_block(values[:, 0].astype(np.int64), values[:, 1].astype(np.int64), weights)
+                        rows = ()
+                    else:
+                        numeric = False
+                elif count:
+                    numeric = False
+            if rows is None:
+                rows = [line for line in chunk.splitlines() if line[:1] not in _SKIP]
+            for row in rows:
+                fields = row.split(sep)
+                if len(fields) < 2:
+                    raise ValueError(f"{path}: expected 'u v [weight]' lines, got {row[:80]!r}.")
+                edges.add(_label(fields[0]), _label(fields[1]), _number(fields[2]) if len(fields) > 2 and fields[2].strip() else 1)
+            if progress:
+                progress(f.tell(), total)
+    return edges.build(directed, frozen)
+
+def write_edge_list(graph, path, delimiter=" ", header=False, progress=None):
+    """Write one ``u v weight`` line per edge (``delimiter=","`` for CSV, ``header=True`` to name the columns)."""
+    d = delimiter
+    with _open(path, 'wt') as f:
+        if header:
+            f.write(f"source{d}target{d}weight\n")
+        _write_blocks(f, (f"{u}{d}{v}{d}{w}\n" for u, v, w in _edges(graph)), _num_edges(graph), progress)
+
+def read_dimacs(path, directed=True, frozen=False, progress=None):
+    """Read a DIMACS shortest-path ``.gr`` file (``p sp n m`` and ``a u v w`` lines) with vertices 1..n."""
+    np = _numpy()
+    total = _total(path)
+    n = None
+    blocks = []
+    sources, targets, weights = array('q'), array('q'), []
+    with _open(path, 'rb') as f:
+        for chunk in _chunks(f):
+            if np is not None and chunk[:1] == b'a' and _plain(chunk, _NOT_ARC):
+                # Only arc lines: blank out the 'a' markers and parse the chunk whole
+                values = _parse_numeric(np, chunk.replace(b'a', b' '), _count_lines(chunk), 3)
+                if values is not None:
+                    blocks.append(values)
+                    if progress:
+                        progress(f.tell(), total)
+                    continue
+            lines = chunk.splitlines()
+            if n is None:
+                for line in lines:
+                    if line[:1] == b'p':
+                        fields = line.split()
+                        if len(fields) != 4:
+                            raise ValueError(f"{path}: malformed problem line {line.strip()!r}.")
+                        n = int(fields[2])
+                        break
+            arcs = [line[1:] for line in lines if line[:1] == b'a']
+            values = _parse_numeric(np, b"\n".join(arcs), len(arcs), 3) if np is not None and arcs else None
+            if values is not None:
+                blocks.append(values)
+            else:
+                for arc in arcs:
+                    u, v, w = arc.split()
+                    sources.append(int(u))
+                    targets.append(int(v))
+                    weights.append(_number(w))
+            if progress:
+                progress(f.tell(), total)
+    if n is None:
+        raise ValueError(f"{path}: no 'p sp n m' problem line.")
+    labels = list(range(1, n + 1))
+    if np is None:
+        sources = array('q', (u - 1 for u in sources))
+        targets = array('q', (v - 1 for v in targets))
+        if any(not 0 <= i < n for i in sources) or any(not 0 <= i < n for i in targets):
+            raise ValueError(f"{path}: arc endpoint outside 1..{n}.")
+        return _build(None, labels, sources, targets, weights, directed, frozen)
+    if sources:
+        blocks.append(np.column_stack((np.frombuffer(sources, dtype=np.int64), np.frombuffer(targets, dtype=np.int64), np.asarray(weights))))
+    values = np.concatenate(blocks) if blocks else np.empty((0, 3), dtype=np.int64)
+    ends = values[:, :2].astype(np.int64) - 1
+    if ends.size and (ends.min() < 0 or ends.max() >= n):
+        raise ValueError(f"{path}: arc endpoint outside 1..{n}.")
+    return _build(np, labels, ends[:, 0], ends[:, 1], values[:, 2], directed, frozen)
+
+def write_dimacs(graph, path, comment=None, progress=None):
+    """Write ``graph`` as a DIMACS ``.gr`` file.
+
+    Vertices are numbered 1..n in ``get_vertices()`` order unless they
+    already are exactly the ints 1..n.
+    """
+    vertices = graph.get_vertices()
+    n = len(vertices)
+    if set(vertices) == set(range(1, n + 1)):
+        ids = {v: v for v in vertices}
+    else:
+        ids = {v: i for i, v in enumerate(vertices, 1)}
+    m = sum(len(graph.get_neighbors(u)) for u in vertices)
+    with _open(path, 'wt') as f:
+        if comment:
+            f.write(f"c {comment}\n")
+        f.write(f"p sp {n} {m}\n")
+        arcs = (f"a {ids[u]} {ids[v]} {w}\n" for u in vertices for v, w in graph.get_neighbors(u))
+        _write_blocks(f, arcs, m, progress)
+
+def read_json(path, directed=None, frozen=False, progress=None):
+    """Read ``{"directed", "vertices", "edges": [[u, v, w], ...]}`` or node-link ``{"nodes", "links"}`` JSON.
+
+    JSON has no streaming parser in the standard library, so the document is
+    loaded whole; prefer the edge-list or DIMACS readers for huge graphs.
+    """
+    with _open(path, 'rb') as f:
+        data = json.load(f)
+    if progress:
+        progress(_total(path) or 0, _total(path))
+    if directed is None:
+        directed = bool(data.get("directed", False))
+    edges = _EdgeBuffer(_numpy())
+    if "links" in data:
+        for node in data.get("nodes", ()):
+            edges.vertex(node["id"])
+        for link in data["links"]:
+            edges.add(link["source"], link["target"], link.get("weight", 1))
+    else:
+        for v in data.get("vertices", ()):
+            edges.vertex(v)
+        for edge in data.get("edges", ()):
+            edges.add(edge[0], edge[1], edge[2] if len(edge) > 2 else 1)
+    return edges.build(directed, frozen)
+
+def write_json(graph, path, progress=None):
+    """Write ``{"directed", "vertices", "edges"}`` JSON, streaming one edge per line."""
+    with _open(path, 'wt') as f:
+        f.write('{"directed": %s,\n "vertices": %s,\n "edges": [\n' % (json.dumps(graph.directed), json.dumps(list(graph.get_vertices()))))
+        lines = (("  " if i == 0 else ", ") + json.dumps([u, v, w]) + "\n" for i, (u, v, w) in enumerate(_edges(graph)))
+        _write_blocks(f, lines, _num_edges(graph), progress)
+        f.write("]}\n")
+
+def read_graphml(path, directed=None, frozen=False, progress=None):
+    """Read GraphML nodes and edges, taking weights from the edge key named "weight" (default 1)."""
+    edges = _EdgeBuffer(_numpy())
+    total = _total(path)
+    weight_key = None
+    default_weight = 1
+    count = 0
+    with _open(path, 'rb') as f:
+        for event, elem in iterparse(f, events=("start", "end")):
+            tag = elem.tag.rsplit('}', 1)[-1]
+            if event == "start":
+                if tag == "graph" and directed is None:
+                    directed = elem.get("edgedefault", "directed") == "directed"
+                continue
+            if tag == "key" and elem.get("for") in ("edge", "all") and elem.get("attr.name") == "weight":
+                weight_key = elem.get("id")
+                for child in elem:
+                    if child.tag.rsplit('}', 1)[-1] == "default" and child.text:
+                        default_weight = _number(child.text.strip())
+            elif tag == "node":
+                edges.vertex(_label(elem.get("id")))
+                elem.clear()
+            elif tag == "edge":
+                w = default_weight
+                for child in elem:
+                    if child.get("key") == weight_key and child.text:
+                        w = _number(child.text.strip())
+                edges.add(_label(elem.get("source")), _label(elem.get("target")), w)
+                elem.clear()
+                count += 1
+                if progress and count % BLOCK_EDGES == 0:
+                    progress(f.tell(), total)
+        if progress:
+            progress(f.tell(), total)
+    return edges.build(bool(directed), frozen)
+
+def write_graphml(graph, path, progress=None):
+    """Write GraphML with a double-typed "weight" edge attribute."""
+    with _open(path, 'wt') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+                '  <key id="weight" for="edge" attr.name="weight" attr.type="double"/>\n'
+                f'  <graph id="G" edgedefault="{"directed" if graph.directed else "undirected"}">\n')
+        f.write("".join(f"    <node id={quoteattr(str(v))}/>\n" for v in graph.get_vertices()))
+        lines = (f'    <edge source={quoteattr(str(u))} target={quoteattr(str(v))}><data key="weight">{w}</data></edge>\n'
+                 for u, v, w in _edges(graph))
+        _write_blocks(f, lines, _num_edges(graph), progress)
+        f.write("  </graph>\n</graphml>\n")
+
+def _format(path, fmt):
+    if fmt is None:
+        name = str(path)
+        if name.endswith(".gz"):
+            name = name[:-3]
+        fmt = FORMATS.get(os.path.splitext(name)[1].lower())
+        if fmt is None:
+            raise ValueError(f"Cannot tell the format of {path}; pass fmt= one of {sorted(set(FORMATS.values()))}.")
+    if fmt not in set(FORMATS.values()):
+        raise ValueError(f"Unknown graph format {fmt!r}; choose one of {sorted(set(FORMATS.values()))}.")
+    return fmt
+
+def read_graph(path, fmt=None, **kwargs):
+    """Read a graph, picking the reader from ``fmt`` or the file extension.
+
+    Binary snapshots (core/graph/snapshot.py) are mapped rather than read
+    and come back as a MappedGraph unless ``frozen=False`` is passed.
+    """
+    fmt = _format(path, fmt)
+    if fmt == "snapshot":
+        from core.graph.snapshot import open_snapshot
+        graph = open_snapshot(path)
+        return graph if kwargs.get("frozen", True) else graph.thaw()
+    if fmt == "dimacs":
+        return read_dimacs(path, **kwargs)
+    if fmt == "json":
+        return read_json(path, **kwargs)
+    if fmt == "graphml":
+        return read_graphml(path, **kwargs)
+    if fmt in ("csv", "tsv"):
+        kwargs.setdefault("delimiter", "," if fmt == "csv" else "\t")
+    return read_edge_list(path, **kwargs)
+
+def write_graph(graph, path, fmt=None, **kwargs):
+    """Write a graph, picking the writer from ``fmt`` or the file extension."""
+    fmt = _format(path, fmt)
+    if fmt == "snapshot":
+        from core.graph.snapshot import save_snapshot
+        return save_snapshot(graph, path)
+    if fmt == "dimacs":
+        return write_dimacs(graph, path, **kwargs)
+    if fmt == "json":
+        return write_json(graph, path, **kwargs)
+    if fmt == "graphml":
+        return write_graphml(graph, path, **kwargs)
+    if fmt in ("csv", "tsv"):
+        kwargs.setdefault("delimiter", "," if fmt == "csv" else "\t")
+    return write_edge_list(graph, path, **kwargs)
@@ -0,0 +1,80 @@
+"""
+Vertex ids for the graph editors, shown as spreadsheet-style aliases
+
+The editors key their Graph on small integer ids and display id ``i`` as
+``alias(i)``: A..Z, then AA, AB, ..., ZZ, AAA, ...  so a graph is not capped
+at 26 vertices.  ``LabelAllocator`` hands out the smallest free id, so ids
+released by deleted vertices are reused before new ones are drawn and the
+aliases stay short.
+"""
+import heapq
+
+def alias(v):
+    """Display name of vertex ``v``: non-negative ints become A, B, ..., Z, AA, ...; anything else is str(v)."""
+    if type(v) is not int or v < 0:
+        return str(v)
+    name = ""
+    v += 1
+    while v:
+        v, r = divmod(v - 1, 26)
+        name = chr(65 + r) + name
+    return name
+
+def aliases(vertices):
+    return [alias(v) for v in vertices]
+
+def alias_id(name):
+    """Inverse of ``alias``: "A" -> 0, "Z" -> 25, "AA" -> 26."""
+    name = name.strip().upper()
+    if not name or not name.isascii() or not name.isalpha():
+        raise ValueError(f"{name!r} is not a vertex label (expected letters such as A, Z or AB).")
+    v = 0
+    for ch in name:
+        v = v * 26 + ord(ch) - 64
+    return v - 1
+
+class LabelAllocator:
+    """Unbounded vertex ids that reuse the smallest released id first."""
+    def __init__(self):
+        self.next_id = 0
+        self.free = []
+        self.live = set()
+
+    def allocate(self):
+        if self.free:
+            v = heapq.heappop(self.free)
+        else:
+            v = self.next_id
+            self.next_id += 1
+        self.live.add(v)
+        return v
+
+    def claim(self, v):
+        """Mark id ``v`` as used (e.g. a vertex added by label); return it."""
+        if v in self.live:
+            return v
+        if v >= self.next_id:
+            self.free.extend(range(self.next_id, v))
+            heapq.heapify(self.free)
+            self.next_id = v + 1
+        else:
+            self.free.remove(v)
+            heapq.heapify(self.free)
+        self.live.add(v)
+        return v
+
+    def release(self, v):
+        if v in self.live:
+            self.live.remove(v)
+            heapq.heappush(self.free, v)
+
+    def reset(self):
+        self.next_id = 0
+        self.free.clear()
+        self.live.clear()
+
+    def __len__(self):
+        return len(self.live)
+
+    def __repr__(self):
+        return f"LabelAllocator(live={len(self.live)}, next_id={self.next_id}, free={len(self.free)})"
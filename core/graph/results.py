@@ -0,0 +1,156 @@
+"""
+Result objects returned by the headless (non-generator) graph algorithm paths
+"""
+from collections.abc import Mapping
+
+class PathMap(Mapping):
+    """Read-only ``{target: path}`` view that walks ``prev`` only when a path is requested.
+
+    Unreachable targets map to ``[]``, matching the eagerly built dicts it replaces.
+    """
+    def __init__(self, source, dist, prev):
+        self.source = source
+        self.dist = dist
+        self.prev = prev
+
+    def __getitem__(self, target):
+        if target not in self.dist:
+            raise KeyError(target)
+        path = []
+        cur = target
+        while cur is not None:
+            path.append(cur)
+            cur = self.prev.get(cur)
+        path.reverse()
+        return path if path[0] == self.source else []
+
+    def __iter__(self):
+        return iter(self.dist)
+
+    def __len__(self):
+        return len(self.dist)
+
+class ShortestPathResult:
+    """Single-source shortest paths: distances and predecessor links."""
+    def __init__(self, source, dist, prev, target=None, negative_cycle=False):
+        self.source = source
+        self.dist = dist
+        self.prev = prev
+        self.target = target
+        self.negative_cycle = negative_cycle
+
+    def path_to(self, target):
+        if self.negative_cycle or self.dist.get(target, float('inf')) == float('inf'):
+            return []
+        path = []
+        cur = target
+        while cur is not None:
+            path.append(cur)
+            cur = self.prev.get(cur)
+        path.reverse()
+        return path
+
+    @property
+    def path(self):
+        return self.path_to(self.target) if self.target is not None else []
+
+    @property
+    def paths(self):
+        return PathMap(self.source, self.dist or {}, self.prev or {})
+
+    def __repr__(self):
+        return f"ShortestPathResult(source={self.source!r}, reached={sum(d != float('inf') for d in (self.dist or {}).values())}, negative_cycle={self.negative_cycle})"
+
+class AllPairsResult:
+    """All-pairs distances as a row-major matrix over ``vertices``."""
+    def __init__(self, vertices, dist, next_hop=None, negative_cycle=False):
+        self.vertices = vertices
+        self.index = {v: i for i, v in enumerate(vertices)}
+        self.dist = dist
+        self.next_hop = next_hop
+        self.negative_cycle = negative_cycle
+
+    def distance(self, u, v):
+        return self.dist[self.index[u]][self.index[v]]
+
+    def as_dict(self):
+        return {u: {v: self.dist[i][j] for j, v in enumerate(self.vertices)} for i, u in enumerate(self.vertices)}
+
+    def __repr__(self):
+        return f"AllPairsResult(vertices={len(self.vertices)}, negative_cycle={self.negative_cycle})"
+
+class ComponentsResult:
+    """A partition of the vertices into components."""
+    def __init__(self, components):
+        self.components = components
+        self.component_of = {v: cid for cid, comp in enumerate(components) for v in comp}
+
+    def __len__(self):
+        return len(self.components)
+
+    def __repr__(self):
+        return f"ComponentsResult(count={len(self.components)})"
+
+class SpanningTreeResult:
+    """Edges of a minimum spanning tree (or forest) and their total weight."""
+    def __init__(self, edges):
+        self.edges = edges
+        self.total_weight = sum(w for _, _, w in edges)
+
+    def __repr__(self):
+        return f"SpanningTreeResult(edges={len(self.edges)}, total_weight={self.total_weight})"
+
+class TraversalResult:
+    """A vertex ordering (BFS/DFS visit order or a topological order)."""
+    def __init__(self, order):
+        self.order = order
+
+    def __repr__(self):
+        return f"TraversalResult(order={self.order!r})"
+
+class CycleResult:
+    """Whether a cycle exists, and one witness cycle if so."""
+    def __init__(self, has_cycle, cycle):
+        self.has_cycle = has_cycle
+        self.cycle = cycle
+
+    def __repr__(self):
+        return f"CycleResult(has_cycle={self.has_cycle}, cycle={self.cycle!r})"
+
+class BipartiteResult:
+    """Bipartiteness with the 2-coloring found, or the conflicting edge."""
+    def __init__(self, is_bipartite, color, conflict=None):
+        self.is_bipartite = is_bipartite
+        self.color = color
+        self.conflict = conflict
+
+    def __repr__(self):
+        return f"BipartiteResult(is_bipartite={self.is_bipartite}, conflict={self.conflict!r})"
+
+class ArticulationResult:
+    """Articulation points and bridges of an undirected graph."""
+    def __init__(self, points, bridges):
+        self.points = points
+        self.bridges = bridges
+
+    def __repr__(self):
+        return f"ArticulationResult(points={len(self.points)}, bridges={len(self.bridges)})"
+
+class ClosureResult:
+    """Reachability over ``vertices``; ``rows[i]`` is a bitset (Python int) of
+    the vertices reachable from ``vertices[i]``."""
+    def __init__(self, vertices, rows):
+        self.vertices = vertices
+        self.index = {v: i for i, v in enumerate(vertices)}
+        self.rows = rows
+
+    def reachable(self, u, v):
+        return bool((self.rows[self.index[u]] >> self.index[v]) & 1)
+
+    @property
+    def matrix(self):
+        n = len(self.vertices)
+        return [[(bits >> j) & 1 for j in range(n)] for bits in self.rows]
+
+    def __repr__(self):
+        return f"ClosureResult(vertices={len(self.vertices)})"
@@ -0,0 +1,237 @@
+"""
+Versioned binary graph snapshots that are opened with mmap instead of parsed
+
+``save_snapshot`` writes a graph's CSR arrays to one file, and
+``open_snapshot`` maps that file and returns a ``MappedGraph``: a CSRGraph
+whose offsets/targets/weights are zero-copy memoryviews of the mapping, so
+opening costs a header read regardless of graph size and pages are loaded
+by the OS on first touch.  Processes that open the same file share its
+pages through the page cache, and a MappedGraph pickles as its path, so
+handing one to a process pool sends only the file name.
+
+Layout (little-endian, every section aligned to 64 bytes)::
+
+    header   magic "DSAGSNAP", format version, flags (1 = directed,
+             2 = float weights), n, m, label kind, label base, then
+             (position, byte length) of the five sections below
+    offsets  int64[n + 1]
+    targets  int32[m]
+    weights  int64[m] or float64[m]
+    labels   nothing    (kind 0: labels are base, base+1, ..., base+n-1)
+             int64[n]   (kind 1: integer labels)
+             int64[n+1] (kind 2: offsets into the UTF-8 text section)
+    text     UTF-8 bytes of string labels (kind 2 only)
+"""
+import mmap
+import operator
+import os
+import struct
+import sys
+from array import array
+from core.graph.csr import CSRGraph, typecode
+
+MAGIC = b"DSAGSNAP"
+FORMAT_VERSION = 1
+
+DIRECTED = 1
+FLOAT_WEIGHTS = 2
+
+LABELS_RANGE, LABELS_INT, LABELS_STR = 0, 1, 2
+
+_HEADER = struct.Struct("<8sIIQQIIq10Q")
+_ALIGN = 64
+
+class _RangeIndex:
+    """``label -> id`` for the labels ``base, base+1, ...`` without building a dict."""
+    def __init__(self, labels):
+        self.start = labels.start
+        self.n = len(labels)
+
+    def get(self, label, default=None):
+        try:
+            i = operator.index(label) - self.start
+        except TypeError:
+            return default
+        return i if 0 <= i < self.n else default
+
+    def __getitem__(self, label):
+        i = self.get(label)
+        if i is None:
+            raise KeyError(label)
+        return i
+
+    def __contains__(self, label):
+        return self.get(label) is not None
+
+    def __len__(self):
+        return self.n
+
+class _StringLabels:
+    """Sequence of string labels decoded on access from the mapped text section."""
+    def __init__(self, offsets, text):
+        self.offsets = offsets
+        self.text = text
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        return str(self.text[self.offsets[i]:self.offsets[i + 1]], 'utf-8')
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+class MappedGraph(CSRGraph):
+    """Read-only CSRGraph backed by a memory-mapped snapshot file.
+
+    ``index`` and ``get_vertices()`` are built on first use (and never for
+    consecutive integer labels, which map to ids arithmetically).  Call
+    ``close()``, or use the graph as a context manager, to unmap the file.
+    """
+    def __init__(self, path, mapping, labels, offsets, targets, weights, directed):
+        self.path = path
+        self.mapping = mapping
+        self.labels = labels
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.directed = directed
+        self._index = None
+        self._vertices = None
+
+    @property
+    def index(self):
+        if self._index is None:
+            if isinstance(self.labels, range):
+                self._index = _RangeIndex(self.labels)
+            else:
+                self._index = {label: i for i, label in enumerate(self.labels)}
+        return self._index
+
+    @property
+    def vertices(self):
+        if self._vertices is None:
+            self._vertices = tuple(self.labels)
+        return self._vertices
+
+    def close(self):
+        for view in (self.offsets, self.targets, self.weights):
+            view.release()
+        if isinstance(self.labels, memoryview):
+            self.labels.release()
+        elif isinstance(self.labels, _StringLabels):
+            self.labels.offsets.release()
+            self.labels.text.release()
+        self.mapping.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __reduce__(self):
+        return (open_snapshot, (self.path,))
+
+    def __repr__(self):
+        return f"MappedGraph({self.path!r}, vertices={self.num_vertices()}, edges={self.num_edges()}, directed={self.directed})"
+
+def _pad(f):
+    gap = -f.tell() % _ALIGN
+    if gap:
+        f.write(bytes(gap))
+
+def _label_sections(labels):
+    """(kind, base, sections) describing ``labels`` in the snapshot."""
+    n = len(labels)
+    if all(type(v) is int for v in labels):
+        if n and labels[-1] - labels[0] == n - 1 and all(v == labels[0] + i for i, v in enumerate(labels)):
+            return LABELS_RANGE, labels[0], []
+        return LABELS_INT, 0, [array('q', labels)]
+    if all(type(v) is str for v in labels):
+        encoded = [v.encode() for v in labels]
+        ends = array('q', [0])
+        total = 0
+        for b in encoded:
+            total += len(b)
+            ends.append(total)
+        return LABELS_STR, 0, [ends, b"".join(encoded)]
+    raise ValueError("Snapshots need vertex labels that are all ints or all strings.")
+
+def save_snapshot(graph, path):
+    """Write ``graph`` (a Graph, CSRGraph or anything with the graph interface) to ``path``.
+
+    The file is written next to ``path`` and renamed into place, so
+    processes that have the old snapshot mapped keep a consistent copy.
+    """
+    if sys.byteorder != 'little':
+        raise ValueError("Snapshots are little-endian; write them on a little-endian machine.")
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    labels = list(csr.labels)
+    kind, base, label_parts = _label_sections(labels)
+    flags = (DIRECTED if csr.directed else 0) | (FLOAT_WEIGHTS if typecode(csr.weights) == 'd' else 0)
+    parts = [csr.offsets, csr.targets, csr.weights] + label_parts
+    tmp = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(bytes(_HEADER.size))
+            table = []
+            for part in parts:
+                _pad(f)
+                raw = memoryview(part).cast('B')
+                table.append((f.tell(), raw.nbytes))
+                f.write(raw)
+            table += [(0, 0)] * (5 - len(table))
+            f.seek(0)
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, flags, len(labels), len(csr.targets), kind, 0, base,
+                                 *(x for entry in table for x in entry)))
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def open_snapshot(path):
+    """Map the snapshot at ``path`` read-only and return a MappedGraph over it."""
+    if sys.byteorder != 'little':
+        raise ValueError("Snapshots are little-endian; this machine cannot map them zero-copy.")
+    with open(path, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    views = []
+    try:
+        if len(mapping) < _HEADER.size:
+            raise ValueError(f"{path} is not a graph snapshot (file too short).")
+        magic, version, flags, n, m, kind, _, base, *table = _HEADER.unpack_from(mapping)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a graph snapshot.")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} has snapshot format version {version}; this build reads version {FORMAT_VERSION}.")
+        if kind not in (LABELS_RANGE, LABELS_INT, LABELS_STR):
+            raise ValueError(f"{path} has unknown label kind {kind}.")
+        formats = ['q', 'i', 'd' if flags & FLOAT_WEIGHTS else 'q', 'q' if kind != LABELS_RANGE else 'B', 'B']
+        view = memoryview(mapping)
+        views.append(view)
+        sections = []
+        for (pos, size), fmt in zip(zip(table[::2], table[1::2]), formats):
+            if pos + size > len(mapping) or size % struct.calcsize(fmt):
+                raise ValueError(f"{path} is truncated or corrupt.")
+            section = view[pos:pos + size].cast(fmt)
+            views.append(section)
+            sections.append(section)
+        offsets, targets, weights = sections[:3]
+        if kind == LABELS_RANGE:
+            labels = range(base, base + n)
+        elif kind == LABELS_INT:
+            labels = sections[3]
+        else:
+            labels = _StringLabels(sections[3], sections[4])
+        if len(offsets) != n + 1 or len(targets) != m or len(weights) != m or (kind == LABELS_INT and len(labels) != n):
+            raise ValueError(f"{path} is truncated or corrupt.")
+    except BaseException:
+        for v in reversed(views):
+            v.release()
+        mapping.close()
+        raise
+    return MappedGraph(path, mapping, labels, offsets, targets, weights, directed=bool(flags & DIRECTED))
@@ -0,0 +1,180 @@
+"""
+LRU cache of algorithm step traces keyed on (algorithm, parameters, graph version)
+
+Rerunning an algorithm on an unchanged graph with the same parameters replays
+the stored trace instead of recomputing it.  Any edit to a Graph gives it a
+new ``version`` (see core/graph/graph.py), so stale traces are never
+returned; they simply age out.  Entries are evicted least-recently-used
+first once their estimated size exceeds ``max_bytes``.
+
+``TraceCache.stream`` hands the visualizers a StepStream, which pulls steps
+from the generator as the animation consumes them instead of building the
+whole list first; a trace is stored in the cache once it has been played to
+the end.
+"""
+import sys
+from collections import OrderedDict, deque
+from core.graph.views import graph_signature
+
+def _hashable(value):
+    """Turn dict/list/set parameters (e.g. node positions) into hashable tuples."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_hashable(v) for v in value)
+    return value
+
+def trace_size(obj):
+    """Approximate bytes held by ``obj`` and the containers nested in it (each object counted once)."""
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return total
+
+class TraceCache:
+    """Least-recently-used store of step lists with a total byte budget."""
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, algo, graph, *params):
+        return (f"{algo.__module__}.{algo.__qualname__}", graph_signature(graph), _hashable(params))
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, steps):
+        """Store ``steps`` under ``key``; a trace larger than the whole budget is not kept."""
+        size = trace_size(steps)
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        if size > self.max_bytes:
+            return
+        self.entries[key] = (steps, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.bytes -= evicted
+
+    def steps(self, algo, graph, *args, **kwargs):
+        """Return the list of steps of ``algo(graph, *args, **kwargs)``, computing it only on a miss."""
+        key = self.key(algo, graph, args, kwargs)
+        steps = self.get(key)
+        if steps is None:
+            steps = list(algo(graph, *args, **kwargs))
+            self.put(key, steps)
+        return steps
+
+    def stream(self, algo, graph, *args, **kwargs):
+        """Like ``steps`` but returns a StepStream that runs ``algo`` lazily on a miss."""
+        key = self.key(algo, graph, args, kwargs)
+        steps = self.get(key)
+        if steps is not None:
+            return StepStream(steps)
+        return StepStream(algo(graph, *args, **kwargs), on_complete=lambda steps: self.put(key, steps))
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return f"TraceCache(entries={len(self.entries)}, bytes={self.bytes}, max_bytes={self.max_bytes}, hits={self.hits}, misses={self.misses})"
+
+class StepStream:
+    """Steps pulled on demand from an iterator, with look-ahead and a bounded history.
+
+    ``next()`` returns the next step (refilling up to ``lookahead`` steps at
+    a time) and ``back()`` un-reads recent steps so they are replayed.  Only
+    the last ``history`` consumed steps are kept, so memory stays flat for
+    long traces.  If ``on_complete`` is given, it receives the full list of
+    steps when the iterator is exhausted, unless the trace grew past
+    ``record_limit`` steps.
+    """
+    def __init__(self, steps, lookahead=32, history=1000, on_complete=None, record_limit=100000):
+        self.source = iter(steps)
+        self.lookahead = lookahead
+        self.buffer = deque()
+        self.history = deque(maxlen=history)
+        self.current = None
+        self.position = 0
+        self.exhausted = False
+        self.on_complete = on_complete
+        self.record = [] if on_complete is not None else None
+        self.record_limit = record_limit
+
+    def _fill(self):
+        buffer = self.buffer
+        while not self.exhausted and len(buffer) < self.lookahead:
+            try:
+                step = next(self.source)
+            except StopIteration:
+                self.exhausted = True
+                if self.record is not None:
+                    self.on_complete(self.record)
+                    self.record = None
+                break
+            buffer.append(step)
+            if self.record is not None:
+                if len(self.record) < self.record_limit:
+                    self.record.append(step)
+                else:
+                    self.record = None
+
+    def has_next(self):
+        if not self.buffer:
+            self._fill()
+        return bool(self.buffer)
+
+    def next(self):
+        """Consume and return the next step, or None when the trace is finished."""
+        if not self.has_next():
+            return None
+        step = self.current = self.buffer.popleft()
+        self.history.append(step)
+        self.position += 1
+        return step
+
+    def back(self, count=1):
+        """Un-read up to ``count`` steps from the history; return how many were moved back."""
+        moved = 0
+        while moved < count and self.history:
+            self.buffer.appendleft(self.history.pop())
+            moved += 1
+        self.position -= moved
+        self.current = self.history[-1] if self.history else None
+        return moved
+
+    def __bool__(self):
+        return self.position > 0 or self.has_next()
+
+    def __repr__(self):
+        return f"StepStream(position={self.position}, buffered={len(self.buffer)}, exhausted={self.exhausted})"
+
+# Shared by the graph visualizers so they draw on one memory budget
+trace_cache = TraceCache()
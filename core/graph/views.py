@@ -0,0 +1,83 @@
+"""
+Lightweight read-only graph views that adapt an existing graph without copying it
+
+A view exposes the same ``get_vertices`` / ``get_neighbors`` / ``directed``
+interface as Graph, so algorithms can run on it directly.
+"""
+from weakref import WeakKeyDictionary
+
+# graph -> (graph signature, reverse adjacency)
+_reverse_cache = WeakKeyDictionary()
+
+def graph_signature(graph):
+    """A cheap value that changes whenever the graph's edges change, for keying caches."""
+    version = getattr(graph, 'version', None)
+    if version is not None:
+        return version
+    adj = getattr(graph, 'adj', None)
+    if adj is None:
+        # Immutable graphs such as CSRGraph never change
+        return None
+    # Unversioned adjacency dicts: identity plus length of each list spots replaced or appended lists
+    return tuple((u, id(nbrs), len(nbrs)) for u, nbrs in adj.items())
+
+def reverse_adjacency(graph):
+    """Return ``{v: [(u, w), ...]}`` for every edge ``u -> v``, cached until the graph changes."""
+    signature = graph_signature(graph)
+    cached = _reverse_cache.get(graph)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    radj = {}
+    for u in graph.get_vertices():
+        for v, w in graph.get_neighbors(u):
+            radj.setdefault(v, []).append((u, w))
+    _reverse_cache[graph] = (signature, radj)
+    return radj
+
+class SuperSourceView:
+    """``graph`` plus an extra ``source`` vertex with a 0-weight edge to every vertex."""
+    def __init__(self, graph, source):
+        self.graph = graph
+        self.source = source
+        self.directed = True
+        self._vertices = list(graph.get_vertices())
+
+    def get_vertices(self):
+        return self._vertices + [self.source]
+
+    def get_neighbors(self, u):
+        if u == self.source:
+            return [(v, 0) for v in self._vertices]
+        return self.graph.get_neighbors(u)
+
+class ReweightedView:
+    """``graph`` with every edge weight ``w(u, v)`` presented as ``w + h[u] - h[v]``.
+
+    Weights are computed on access from the potentials ``h``; the underlying
+    adjacency lists are never copied.
+    """
+    def __init__(self, graph, h):
+        self.graph = graph
+        self.h = h
+        self.directed = True
+
+    def get_vertices(self):
+        return self.graph.get_vertices()
+
+    def get_neighbors(self, u):
+        h = self.h
+        hu = h[u]
+        return [(v, w + hu - h[v]) for v, w in self.graph.get_neighbors(u)]
+
+class ReverseView:
+    """``graph`` with every edge reversed, backed by the cached reverse adjacency."""
+    def __init__(self, graph):
+        self.graph = graph
+        self.directed = True
+        self.radj = reverse_adjacency(graph)
+
+    def get_vertices(self):
+        return self.graph.get_vertices()
+
+    def get_neighbors(self, u):
+        return self.radj.get(u, [])
@@ -0,0 +1,148 @@
+"""
+Array-backed Grid storing walls, costs and visit state in flat buffers
+"""
+from array import array
+
+class CellView:
+    """Lightweight (grid, row, col) handle that behaves like a Cell for the UI."""
+    __slots__ = ('grid', 'row', 'col')
+
+    def __init__(self, grid, row, col):
+        self.grid = grid
+        self.row = row
+        self.col = col
+
+    @property
+    def id(self):
+        return self.row * self.grid.cols + self.col
+
+    @property
+    def is_wall(self):
+        return bool(self.grid.walls[self.id])
+
+    @is_wall.setter
+    def is_wall(self, value):
+        self.grid.walls[self.id] = 1 if value else 0
+
+    @property
+    def visited(self):
+        return bool(self.grid.visited[self.id])
+
+    @visited.setter
+    def visited(self, value):
+        self.grid.visited[self.id] = 1 if value else 0
+
+    @property
+    def cost(self):
+        return self.grid.costs[self.id]
+
+    def __repr__(self):
+        return f"Cell({self.row},{self.col})"
+
+    def __eq__(self, other):
+        return isinstance(other, CellView) and self.row == other.row and self.col == other.col
+
+    def __hash__(self):
+        return hash((self.row, self.col))
+
+    def __lt__(self, other):
+        return (self.row, self.col) < (other.row, other.col)
+
+class _Row:
+    __slots__ = ('grid', 'row')
+
+    def __init__(self, grid, row):
+        self.grid = grid
+        self.row = row
+
+    def __getitem__(self, col):
+        if not 0 <= col < self.grid.cols:
+            raise IndexError(col)
+        return CellView(self.grid, self.row, col)
+
+    def __len__(self):
+        return self.grid.cols
+
+    def __iter__(self):
+        return (CellView(self.grid, self.row, c) for c in range(self.grid.cols))
+
+class _Rows:
+    __slots__ = ('grid',)
+
+    def __init__(self, grid):
+        self.grid = grid
+
+    def __getitem__(self, row):
+        if not 0 <= row < self.grid.rows:
+            raise IndexError(row)
+        return _Row(self.grid, row)
+
+    def __len__(self):
+        return self.grid.rows
+
+    def __iter__(self):
+        return (_Row(self.grid, r) for r in range(self.grid.rows))
+
+class ArrayGrid:
+    """Grid with one byte per cell for walls/visits and an int32 cost per cell.
+
+    Cells are addressed by id ``row * cols + col``.  ``grid.grid[r][c]`` and
+    ``get_neighbors(cell)`` return CellView handles so code written against
+    ``Grid`` keeps working, while the maze algorithms use ``neighbor_ids``.
+    """
+    def __init__(self, rows, cols, walls=None, costs=None):
+        self.rows = rows
+        self.cols = cols
+        n = rows * cols
+        self.walls = bytearray(n)
+        self.visited = bytearray(n)
+        self.costs = array('i', [1]) * n
+        # Up, down, left, right: same order as Grid.get_neighbors
+        self.neighbor_offsets = (-cols, cols, -1, 1)
+        if walls:
+            for (r, c) in walls:
+                self.walls[r * cols + c] = 1
+        if costs:
+            for (r, c), cost in costs.items():
+                self.costs[r * cols + c] = cost
+
+    @property
+    def grid(self):
+        return _Rows(self)
+
+    def cell_id(self, row, col):
+        return row * self.cols + col
+
+    def cell(self, i):
+        return CellView(self, i // self.cols, i % self.cols)
+
+    def neighbor_ids(self, i):
+        cols = self.cols
+        walls = self.walls
+        col = i % cols
+        up, down, left, right = self.neighbor_offsets
+        result = []
+        if i >= cols and not walls[i + up]:
+            result.append(i + up)
+        if i + cols < len(walls) and not walls[i + down]:
+            result.append(i + down)
+        if col > 0 and not walls[i + left]:
+            result.append(i + left)
+        if col < cols - 1 and not walls[i + right]:
+            result.append(i + right)
+        return result
+
+    def get_neighbors(self, cell):
+        return [self.cell(i) for i in self.neighbor_ids(cell.row * self.cols + cell.col)]
+
+    def clear_visited(self):
+        self.visited[:] = bytes(len(self.visited))
+        return self.visited
+
+    def as_numpy(self):
+        """Zero-copy NumPy views of (walls, costs, visited) shaped (rows, cols)."""
+        import numpy as np
+        shape = (self.rows, self.cols)
+        return (np.frombuffer(self.walls, dtype=np.uint8).reshape(shape),
+                np.frombuffer(self.costs, dtype=np.int32).reshape(shape),
+                np.frombuffer(self.visited, dtype=np.uint8).reshape(shape))
@@ -0,0 +1,57 @@
+"""
+Text maze files for the grid/maze algorithms
+
+One line per row, one character per cell::
+
+    S..#....
+    .#.#.##.
+    .#...#.E
+
+``#`` is a wall, ``.`` (or a space) an open cell of cost 1, ``1``-``9`` an
+open cell of that cost (used by dijkstra and astar), ``S`` the start and
+``E`` (or ``G``) the end.  Short lines are padded with open cells.
+"""
+from core.grid.array_grid import ArrayGrid
+
+WALL = "#"
+OPEN = ". "
+START = "S"
+END = "EG"
+
+def parse_grid(text):
+    """Return ``(grid, start, end)`` for a maze given as text; start/end are CellViews."""
+    lines = [line.rstrip("\r\n") for line in text.splitlines()]
+    while lines and not lines[-1].strip():
+        lines.pop()
+    rows = len(lines)
+    cols = max((len(line) for line in lines), default=0)
+    if not rows or not cols:
+        raise ValueError("The maze is empty.")
+    walls = []
+    costs = {}
+    start = end = None
+    for r, line in enumerate(lines):
+        for c, ch in enumerate(line):
+            if ch == WALL:
+                walls.append((r, c))
+            elif ch in START:
+                if start is not None:
+                    raise ValueError(f"The maze has more than one start (row {r + 1}, column {c + 1}).")
+                start = (r, c)
+            elif ch in END:
+                if end is not None:
+                    raise ValueError(f"The maze has more than one end (row {r + 1}, column {c + 1}).")
+                end = (r, c)
+            elif ch in "123456789":
+                costs[(r, c)] = int(ch)
+            elif ch not in OPEN:
+                raise ValueError(f"Unexpected character {ch!r} at row {r + 1}, column {c + 1}.")
+    if start is None or end is None:
+        raise ValueError("The maze needs a start cell 'S' and an end cell 'E'.")
+    grid = ArrayGrid(rows, cols, walls, costs)
+    return grid, grid.grid[start[0]][start[1]], grid.grid[end[0]][end[1]]
+
+def read_grid(path):
+    """Read a maze file (see the module docstring); return ``(grid, start, end)``."""
+    with open(path, encoding="utf-8") as f:
+        return parse_grid(f.read())
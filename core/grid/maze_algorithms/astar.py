@@ -1,36 +1,17 @@
 """
 A* Search for grid/maze pathfinding
 """
-import heapq
+from core.grid.maze_algorithms.search import best_first_search
+from core.steps import run_to_completion
 
 def heuristic(a, b):
     return abs(a.row - b.row) + abs(a.col - b.col)
 
-def astar(grid, start, end, visualize=False):
-    open_set = []
-    heapq.heappush(open_set, (0, start, [start]))
-    g_score = {start: 0}
-    visited = set()
-    while open_set:
-        _, current, path = heapq.heappop(open_set)
-        if current == end:
-            if visualize:
-                yield ('found', path)
-            else:
-                return path
-            return
-        if current in visited:
-            continue
-        visited.add(current)
-        for neighbor in grid.get_neighbors(current):
-            temp_g = g_score[current] + 1
-            if neighbor not in g_score or temp_g < g_score[neighbor]:
-                g_score[neighbor] = temp_g
-                f_score = temp_g + heuristic(neighbor, end)
-                heapq.heappush(open_set, (f_score, neighbor, path + [neighbor]))
-                if visualize:
-                    yield ('visit', neighbor)
-    if visualize:
-        yield ('not_found', None)
-    else:
-        return []
+def astar(grid, start, end, visualize=False, queue="heap"):
+    cols = grid.cols
+    end_row, end_col = end.row, end.col
+    def manhattan(i):
+        r, c = divmod(i, cols)
+        return abs(r - end_row) + abs(c - end_col)
+    steps = best_first_search(grid, start, end, heuristic=manhattan, visualize=visualize, queue=queue)
+    return steps if visualize else run_to_completion(steps)
@@ -1,71 +1,62 @@
 """
 Bidirectional BFS for grid/maze pathfinding
 """
+from array import array
 from collections import deque
+from core.grid.maze_algorithms.search import _bind, cell_id, id_cell
+from core.steps import run_to_completion
 
-def reconstruct_path(meet, parents_start, parents_end):
-    # Reconstruct path from start to meet and meet to end
-    path = []
-    node = meet
-    while node:
-        path.append(node)
-        node = parents_start.get((node.row, node.col))
-    path = path[::-1]
-    node = parents_end.get((meet.row, meet.col))
-    while node:
-        path.append(node)
-        node = parents_end.get((node.row, node.col))
-    return path
+def reconstruct_path(grid, start_side, end_side, parents_start, parents_end):
+    # Reconstruct path from start to start_side, then end_side to end
+    ids = []
+    node = start_side
+    while node != -1:
+        ids.append(node)
+        node = parents_start[node]
+    ids.reverse()
+    node = end_side
+    while node != -1:
+        ids.append(node)
+        node = parents_end[node]
+    return [id_cell(grid, i) for i in ids]
 
-def bidirectional_bfs(grid, start, end, visualize=False):
+def _bidirectional_steps(grid, start, end, visualize):
     if start == end:
         if visualize:
             yield ('found', [start])
-        else:
-            return [start]
-        return
-    queue_start = deque([start])
-    queue_end = deque([end])
-    visited_start = {(start.row, start.col)}
-    visited_end = {(end.row, end.col)}
-    parents_start = {(start.row, start.col): None}
-    parents_end = {(end.row, end.col): None}
-    while queue_start and queue_end:
-        # Expand from start
-        current = queue_start.popleft()
-        for neighbor in grid.get_neighbors(current):
-            key = (neighbor.row, neighbor.col)
-            if key not in visited_start:
-                parents_start[key] = current
-                visited_start.add(key)
-                queue_start.append(neighbor)
-                if visualize:
-                    yield ('visit', neighbor)
-                if key in visited_end:
-                    path = reconstruct_path(neighbor, parents_start, parents_end)
-                    if visualize:
-                        yield ('found', path)
+        return [start]
+    n = grid.rows * grid.cols
+    neighbors, _, _ = _bind(grid)
+    start_id, end_id = cell_id(grid, start), cell_id(grid, end)
+    # side[i]: 0 unseen, 1 reached from start, 2 reached from end
+    side = bytearray(n)
+    parents = (None, array('i', [-1]) * n, array('i', [-1]) * n)
+    side[start_id], side[end_id] = 1, 2
+    queues = (None, deque([start_id]), deque([end_id]))
+    while queues[1] and queues[2]:
+        for this, other in ((1, 2), (2, 1)):
+            current = queues[this].popleft()
+            for neighbor in neighbors(current):
+                if side[neighbor] == this:
+                    continue
+                if side[neighbor] == other:
+                    # The (current, neighbor) edge joins the two search trees
+                    if this == 1:
+                        path = reconstruct_path(grid, current, neighbor, parents[1], parents[2])
                     else:
-                        return path
-                    return
-        # Expand from end
-        current = queue_end.popleft()
-        for neighbor in grid.get_neighbors(current):
-            key = (neighbor.row, neighbor.col)
-            if key not in visited_end:
-                parents_end[key] = current
-                visited_end.add(key)
-                queue_end.append(neighbor)
-                if visualize:
-                    yield ('visit', neighbor)
-                if key in visited_start:
-                    path = reconstruct_path(neighbor, parents_start, parents_end)
+                        path = reconstruct_path(grid, neighbor, current, parents[1], parents[2])
                     if visualize:
                         yield ('found', path)
-                    else:
-                        return path
-                    return
+                    return path
+                side[neighbor] = this
+                parents[this][neighbor] = current
+                queues[this].append(neighbor)
+                if visualize:
+                    yield ('visit', id_cell(grid, neighbor))
     if visualize:
         yield ('not_found', None)
-    else:
-        return []
+    return []
+
+def bidirectional_bfs(grid, start, end, visualize=False):
+    steps = _bidirectional_steps(grid, start, end, visualize)
+    return steps if visualize else run_to_completion(steps)
@@ -0,0 +1,106 @@
+"""
+Shared parent-pointer search engine for grid/maze pathfinding
+
+Cells are addressed by integer ids (row * cols + col).  Each search keeps a
+flat parent array and rebuilds the path once when the end cell is reached,
+instead of carrying a copy of the path with every frontier entry.
+"""
+from array import array
+from collections import deque
+from core.priority_queue import make_queue
+
+def cell_id(grid, cell):
+    return cell.row * grid.cols + cell.col
+
+def id_cell(grid, i):
+    return grid.grid[i // grid.cols][i % grid.cols]
+
+def neighbor_ids(grid, i):
+    cols = grid.cols
+    return [n.row * cols + n.col for n in grid.get_neighbors(id_cell(grid, i))]
+
+def _bind(grid):
+    """Return (neighbors, visited buffer, per-cell costs or None) for a grid.
+
+    ArrayGrid supplies id-based neighbors, its own visit buffer and a cost
+    array; the object-per-cell Grid falls back to get_neighbors and unit costs.
+    """
+    if hasattr(grid, 'neighbor_ids'):
+        return grid.neighbor_ids, grid.clear_visited(), grid.costs
+    return (lambda i: neighbor_ids(grid, i)), bytearray(grid.rows * grid.cols), None
+
+def reconstruct_path(grid, parent, end_id):
+    ids = []
+    i = end_id
+    while i != -1:
+        ids.append(i)
+        i = parent[i]
+    ids.reverse()
+    return [id_cell(grid, i) for i in ids]
+
+def unweighted_search(grid, start, end, lifo=False, visualize=False):
+    """BFS (FIFO frontier) or DFS (LIFO frontier); cells are marked on discovery."""
+    n = grid.rows * grid.cols
+    neighbors, seen, _ = _bind(grid)
+    parent = array('i', [-1]) * n
+    start_id, end_id = cell_id(grid, start), cell_id(grid, end)
+    frontier = deque([start_id])
+    take = frontier.pop if lifo else frontier.popleft
+    seen[start_id] = 1
+    while frontier:
+        current = take()
+        if current == end_id:
+            path = reconstruct_path(grid, parent, end_id)
+            if visualize:
+                yield ('found', path)
+            return path
+        for neighbor in neighbors(current):
+            if not seen[neighbor]:
+                seen[neighbor] = 1
+                parent[neighbor] = current
+                frontier.append(neighbor)
+                if visualize:
+                    yield ('visit', id_cell(grid, neighbor))
+    if visualize:
+        yield ('not_found', None)
+    return []
+
+def best_first_search(grid, start, end, heuristic=None, visualize=False, queue="heap"):
+    """Dijkstra (no heuristic) or A*.
+
+    Moves cost 1, or the entered cell's cost on grids that carry a cost
+    array.  ``heuristic`` maps a cell id to an estimate of its remaining
+    distance.  ``queue`` names a priority queue from ``core.priority_queue``.
+    """
+    n = grid.rows * grid.cols
+    neighbors, closed, costs = _bind(grid)
+    parent = array('i', [-1]) * n
+    g_score = array('q', [-1]) * n
+    start_id, end_id = cell_id(grid, start), cell_id(grid, end)
+    g_score[start_id] = 0
+    # Priorities are (f, h): ties on f go to the cell closer to the goal
+    open_set = make_queue(queue)
+    open_set.push(start_id, (0, 0))
+    while open_set:
+        _, current = open_set.pop()
+        if current == end_id:
+            path = reconstruct_path(grid, parent, end_id)
+            if visualize:
+                yield ('found', path)
+            return path
+        if closed[current]:
+            continue
+        closed[current] = 1
+        g_current = g_score[current]
+        for neighbor in neighbors(current):
+            temp_g = g_current + (costs[neighbor] if costs is not None else 1)
+            if g_score[neighbor] == -1 or temp_g < g_score[neighbor]:
+                g_score[neighbor] = temp_g
+                parent[neighbor] = current
+                h = heuristic(neighbor) if heuristic else 0
+                open_set.push(neighbor, (temp_g + h, h))
+                if visualize:
+                    yield ('visit', id_cell(grid, neighbor))
+    if visualize:
+        yield ('not_found', None)
+    return []
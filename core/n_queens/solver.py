@@ -0,0 +1,55 @@
+"""
+N-Queens backtracking: the step generator used by the visualizer and a
+headless solver that enumerates solutions with bitmasks
+"""
+
+def nqueens_solver(N):
+    board = [-1] * N
+    def is_safe(row, col):
+        for r in range(row):
+            c = board[r]
+            if c == col or abs(row - r) == abs(col - c):
+                return False
+        return True
+    def solve(row):
+        if row == N:
+            yield ('solution', list(board))
+            return
+        for col in range(N):
+            if is_safe(row, col):
+                board[row] = col
+                yield ('place', row, col, list(board))
+                yield from solve(row+1)
+                board[row] = -1
+                yield ('remove', row, col, list(board))
+    return solve(0)
+
+def nqueens_solutions(N, limit=None):
+    """Return ``(count, boards)`` for the N-Queens problem.
+
+    ``boards`` lists the first ``limit`` solutions (every solution when
+    ``limit`` is None) as ``board[row] = col``, in the order ``nqueens_solver``
+    finds them; ``count`` is always the total number of solutions.  Columns
+    and both diagonals are tracked as bitmasks, so no board is copied per step.
+    """
+    if N < 0:
+        raise ValueError(f"N must be non-negative, got {N}.")
+    full = (1 << N) - 1
+    board = [-1] * N
+    boards = []
+    count = 0
+    def solve(row, cols, left, right):
+        nonlocal count
+        if row == N:
+            count += 1
+            if limit is None or len(boards) < limit:
+                boards.append(list(board))
+            return
+        free = full & ~(cols | left | right)
+        while free:
+            bit = free & -free
+            free ^= bit
+            board[row] = bit.bit_length() - 1
+            solve(row + 1, cols | bit, (left | bit) << 1 & full, (right | bit) >> 1)
+    solve(0, 0, 0, 0)
+    return count, boards
@@ -0,0 +1,285 @@
+"""
+Addressable priority queues shared by the heap-based graph and grid algorithms
+
+Every queue stores each item at most once and supports the same operations:
+
+    push(item, priority)  insert, or lower the priority of a queued item
+                          (returns False if the item already had a priority
+                          that is as good)
+    pop()                 remove and return (priority, item) with the lowest priority
+    len(q), bool(q), item in q
+
+Priorities may be numbers or tuples (compared lexicographically).  Pick an
+implementation by name with ``make_queue``:
+
+    "heap"     heapq with lazy deletion (stale entries are skipped on pop)
+    "indexed"  binary heap with a position index and true decrease-key
+    "pairing"  pairing heap, O(1) insert and decrease-key
+    "radix"    radix heap for monotone non-negative integer priorities
+               (Dijkstra/A* with integer weights); a tuple priority is
+               allowed if its first element is that integer
+"""
+import heapq
+
+class HeapQueue:
+    """heapq with lazy deletion; ``best`` holds the live priority of each queued item."""
+    def __init__(self):
+        self.heap = []
+        self.best = {}
+
+    def push(self, item, priority):
+        current = self.best.get(item)
+        if current is not None and current <= priority:
+            return False
+        self.best[item] = priority
+        heapq.heappush(self.heap, (priority, item))
+        return True
+
+    def pop(self):
+        heap, best = self.heap, self.best
+        while True:
+            priority, item = heapq.heappop(heap)
+            if best.get(item) == priority:
+                del best[item]
+                return priority, item
+
+    def __len__(self):
+        return len(self.best)
+
+    def __contains__(self, item):
+        return item in self.best
+
+class IndexedHeap:
+    """Binary min-heap with ``pos[item]`` so decrease-key sifts the entry in place."""
+    def __init__(self):
+        self.keys = []
+        self.items = []
+        self.pos = {}
+
+    def push(self, item, priority):
+        i = self.pos.get(item)
+        if i is None:
+            self.keys.append(priority)
+            self.items.append(item)
+            i = len(self.items) - 1
+            self.pos[item] = i
+        elif self.keys[i] <= priority:
+            return False
+        else:
+            self.keys[i] = priority
+        self._sift_up(i)
+        return True
+
+    def pop(self):
+        keys, items, pos = self.keys, self.items, self.pos
+        priority, item = keys[0], items[0]
+        del pos[item]
+        last_key, last_item = keys.pop(), items.pop()
+        if items:
+            keys[0], items[0] = last_key, last_item
+            pos[last_item] = 0
+            self._sift_down(0)
+        return priority, item
+
+    def _sift_up(self, i):
+        keys, items, pos = self.keys, self.items, self.pos
+        key, item = keys[i], items[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if keys[parent] <= key:
+                break
+            keys[i], items[i] = keys[parent], items[parent]
+            pos[items[i]] = i
+            i = parent
+        keys[i], items[i] = key, item
+        pos[item] = i
+
+    def _sift_down(self, i):
+        keys, items, pos = self.keys, self.items, self.pos
+        n = len(items)
+        key, item = keys[i], items[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and keys[child + 1] < keys[child]:
+                child += 1
+            if key <= keys[child]:
+                break
+            keys[i], items[i] = keys[child], items[child]
+            pos[items[i]] = i
+            i = child
+        keys[i], items[i] = key, item
+        pos[item] = i
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.pos
+
+class _PairingNode:
+    __slots__ = ('priority', 'item', 'child', 'sibling', 'prev')
+
+    def __init__(self, priority, item):
+        self.priority = priority
+        self.item = item
+        self.child = None
+        self.sibling = None
+        # Parent if this is the leftmost child, otherwise the left sibling
+        self.prev = None
+
+class PairingHeap:
+    """Pairing heap with node handles: O(1) push and decrease-key, amortized O(log n) pop."""
+    def __init__(self):
+        self.root = None
+        self.nodes = {}
+
+    def push(self, item, priority):
+        node = self.nodes.get(item)
+        if node is None:
+            node = self.nodes[item] = _PairingNode(priority, item)
+            self.root = self._meld(self.root, node)
+            return True
+        if node.priority <= priority:
+            return False
+        node.priority = priority
+        if node is not self.root:
+            self._cut(node)
+            self.root = self._meld(self.root, node)
+        return True
+
+    def pop(self):
+        root = self.root
+        del self.nodes[root.item]
+        self.root = self._merge_pairs(root.child)
+        if self.root is not None:
+            self.root.prev = None
+        return root.priority, root.item
+
+    @staticmethod
+    def _meld(a, b):
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.priority < a.priority:
+            a, b = b, a
+        # b becomes the leftmost child of a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        a.sibling = None
+        return a
+
+    @staticmethod
+    def _cut(node):
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.sibling = node.prev = None
+
+    def _merge_pairs(self, first):
+        # Two-pass pairing, iterative so long child lists cannot hit the recursion limit
+        pairs = []
+        while first is not None:
+            a, b = first, first.sibling
+            first = b.sibling if b is not None else None
+            a.sibling = a.prev = None
+            if b is not None:
+                b.sibling = b.prev = None
+            pairs.append(self._meld(a, b))
+        root = None
+        for tree in reversed(pairs):
+            root = self._meld(tree, root)
+        return root
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, item):
+        return item in self.nodes
+
+class RadixQueue:
+    """Radix heap: integer keys, and no key may be pushed below the last popped key.
+
+    A key k lives in bucket ``(k ^ last).bit_length()``; popping refills the
+    low buckets from the first non-empty one, so each entry moves at most
+    O(log C) times.  Bucket 0 (keys equal to ``last``) is a small heap that
+    orders tuple priorities by their remaining elements.  Decrease-key is
+    lazy, as in HeapQueue.
+    """
+    def __init__(self):
+        self.last = 0
+        self.buckets = [[]]
+        self.best = {}
+
+    def push(self, item, priority):
+        current = self.best.get(item)
+        if current is not None and current <= priority:
+            return False
+        key = priority[0] if isinstance(priority, tuple) else priority
+        if not isinstance(key, int) or key < self.last:
+            raise ValueError(f"Radix queue needs monotone non-negative integer priorities (got {priority!r} after {self.last}).")
+        self.best[item] = priority
+        self._place(key, priority, item)
+        return True
+
+    def _place(self, key, priority, item):
+        b = (key ^ self.last).bit_length()
+        if b == 0:
+            heapq.heappush(self.buckets[0], (priority, item))
+            return
+        while len(self.buckets) <= b:
+            self.buckets.append([])
+        self.buckets[b].append((key, priority, item))
+
+    def pop(self):
+        best = self.best
+        while True:
+            if not self.buckets[0]:
+                self._refill()
+            priority, item = heapq.heappop(self.buckets[0])
+            if best.get(item) == priority:
+                del best[item]
+                return priority, item
+
+    def _refill(self):
+        best = self.best
+        for bucket in self.buckets[1:]:
+            # Drop stale entries first so an empty-but-stale bucket is skipped
+            live = [entry for entry in bucket if best.get(entry[2]) == entry[1]]
+            bucket.clear()
+            if live:
+                self.last = min(entry[0] for entry in live)
+                for key, priority, item in live:
+                    self._place(key, priority, item)
+                return
+        raise IndexError("pop from an empty priority queue")
+
+    def __len__(self):
+        return len(self.best)
+
+    def __contains__(self, item):
+        return item in self.best
+
+QUEUES = {
+    "heap": HeapQueue,
+    "indexed": IndexedHeap,
+    "pairing": PairingHeap,
+    "radix": RadixQueue,
+}
+
+def make_queue(kind="heap"):
+    """Return an empty queue of the named kind (or an instance of ``kind`` if it is a class)."""
+    if isinstance(kind, type):
+        return kind()
+    try:
+        return QUEUES[kind]()
+    except KeyError:
+        raise ValueError(f"Unknown queue {kind!r}; choose one of {', '.join(QUEUES)}.") from None
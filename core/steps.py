@@ -0,0 +1,11 @@
+"""
+Helpers for the step generators shared by the graph and grid algorithms
+"""
+
+def run_to_completion(steps):
+    """Drain a step generator and return its return value."""
+    try:
+        while True:
+            next(steps)
+    except StopIteration as e:
+        return e.value
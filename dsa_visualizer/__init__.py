@@ -0,0 +1,8 @@
+"""
+Headless command-line front end for the DSA Visualizer algorithms
+
+``python -m dsa_visualizer run <algorithm> ...`` loads graph, maze or tree
+files, runs one of the core algorithms without pygame or the menus, and
+writes the result as JSON.  ``python -m dsa_visualizer list`` shows the
+available algorithms.
+"""
@@ -0,0 +1,145 @@
+"""
+Argument parsing and batch execution for ``python -m dsa_visualizer``
+
+    python -m dsa_visualizer run dijkstra --graph g.gr --source 1 --format json
+    python -m dsa_visualizer run scc --graph a.txt b.txt c.txt --jobs 4 --format jsonl
+    python -m dsa_visualizer run maze_astar --grid maze.txt
+    python -m dsa_visualizer run bst --tree values.txt --lca 3 8
+    python -m dsa_visualizer run nqueens --n 8 10 12 --limit 1
+    python -m dsa_visualizer list
+
+With one input, ``--jobs N`` is handed to algorithms that parallelize
+internally (all_pairs_dijkstra, johnson, boruvka, delta_stepping); with
+several inputs the inputs are spread over N worker processes instead.
+Exit status is 0 when every input succeeded, 1 if any record has an error.
+"""
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dsa_visualizer.tasks import TASKS, coerce, run_task
+
+INPUT_FLAGS = {"graph": "--graph", "grid": "--grid", "tree": "--tree", "nqueens": "--n"}
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m dsa_visualizer",
+                                     description="Run DSA Visualizer algorithms without the GUI and print JSON.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list the available algorithms")
+    run = commands.add_parser("run", help="run an algorithm on one or more inputs")
+    run.add_argument("algorithm", choices=sorted(TASKS), metavar="algorithm", help="algorithm name (see 'list')")
+    inputs = run.add_argument_group("inputs")
+    inputs.add_argument("--graph", nargs="+", default=[], metavar="PATH",
+                        help="graph files: edge list (.txt/.csv/.tsv), DIMACS (.gr), JSON, GraphML or snapshot (.snap), optionally .gz")
+    inputs.add_argument("--grid", nargs="+", default=[], metavar="PATH", help="text mazes (# wall, S start, E end, 1-9 cost)")
+    inputs.add_argument("--tree", nargs="+", default=[], metavar="PATH", help="files of whitespace-separated values (words for trie)")
+    inputs.add_argument("--n", nargs="+", default=[], type=int, metavar="N", help="N-Queens board sizes")
+    graph = run.add_argument_group("graph options")
+    graph.add_argument("--source", help="source vertex")
+    graph.add_argument("--target", help="target vertex")
+    graph.add_argument("--input-format", choices=["edgelist", "csv", "tsv", "dimacs", "json", "graphml", "snapshot"],
+                       help="graph file format (default: from the extension)")
+    direction = graph.add_mutually_exclusive_group()
+    direction.add_argument("--directed", dest="directed", action="store_true", default=None, help="treat edges as directed")
+    direction.add_argument("--undirected", dest="directed", action="store_false", help="treat edges as undirected")
+    graph.add_argument("--queue", default="heap", choices=["heap", "indexed", "pairing", "radix"],
+                       help="priority queue for dijkstra/astar/prim and the maze searches")
+    graph.add_argument("--heuristic", choices=["alt", "zero"], help="A* lower bound (default: alt)")
+    graph.add_argument("--delta", type=float, help="delta-stepping bucket width")
+    graph.add_argument("--mode", choices=["serial", "thread", "process"], help="delta-stepping execution mode")
+    tree = run.add_argument_group("tree and N-Queens options")
+    tree.add_argument("--delete", nargs="+", default=[], metavar="VALUE", help="values to delete after inserting")
+    tree.add_argument("--lca", nargs=2, metavar=("A", "B"), help="report the lowest common ancestor of A and B")
+    tree.add_argument("--prefix", help="trie: list the words starting with PREFIX")
+    tree.add_argument("--search", nargs="+", default=[], metavar="WORD", help="trie: look up these words")
+    tree.add_argument("--limit", type=int, help="N-Queens: solutions to list (all are counted)")
+    output = run.add_argument_group("output")
+    output.add_argument("--format", default="json", choices=["json", "jsonl"],
+                        help="json: one document (a list for several inputs); jsonl: one record per line, written as each input completes (in input order)")
+    output.add_argument("--output", "-o", metavar="PATH", help="write to PATH instead of stdout")
+    output.add_argument("--indent", type=int, help="indent json output")
+    run.add_argument("--jobs", "-j", type=int, default=1, metavar="N", help="worker processes (see above)")
+    run.set_defaults(parser=run)
+    return parser
+
+def _options(args):
+    """The picklable option dict every task receives."""
+    return {
+        "source": args.source,
+        "target": args.target,
+        "input_format": args.input_format,
+        "directed": args.directed,
+        "queue": args.queue,
+        "heuristic": args.heuristic,
+        "delta": args.delta,
+        "mode": args.mode,
+        "jobs": args.jobs,
+        "delete": coerce(args.delete),
+        "lca": coerce(args.lca) if args.lca else None,
+        "prefix": args.prefix,
+        "search": args.search,
+        "limit": args.limit,
+    }
+
+def _records(name, items, opts, jobs):
+    """Yield one record per input, in input order."""
+    if jobs <= 1 or len(items) == 1:
+        for item in items:
+            yield run_task(name, item, opts)
+        return
+    # Algorithms run single-process inside the pool so workers do not nest pools
+    opts = dict(opts, jobs=1)
+    with ProcessPoolExecutor(max_workers=min(jobs, len(items))) as pool:
+        yield from pool.map(run_task, [name] * len(items), items, [opts] * len(items))
+
+def _dump(record, indent=None):
+    return json.dumps(record, indent=indent, allow_nan=False, default=str)
+
+def run(args):
+    parser = args.parser
+    kind, needs, _ = TASKS[args.algorithm]
+    flag = INPUT_FLAGS[kind]
+    items = getattr(args, flag[2:])
+    if not items:
+        parser.error(f"{args.algorithm} needs at least one {flag} input.")
+    for other_kind, other_flag in INPUT_FLAGS.items():
+        if other_kind != kind and getattr(args, other_flag[2:]):
+            parser.error(f"{args.algorithm} takes {flag} inputs, not {other_flag}.")
+    for option in needs:
+        if getattr(args, option) is None:
+            parser.error(f"{args.algorithm} needs --{option}.")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+    opts = _options(args)
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    failed = False
+    try:
+        if args.format == "jsonl":
+            for record in _records(args.algorithm, items, opts, args.jobs):
+                failed |= "error" in record
+                out.write(_dump(record) + "\n")
+                out.flush()
+        else:
+            records = list(_records(args.algorithm, items, opts, args.jobs))
+            failed = any("error" in record for record in records)
+            out.write(_dump(records[0] if len(records) == 1 else records, args.indent) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failed else 0
+
+def list_tasks():
+    for kind, flag in INPUT_FLAGS.items():
+        names = sorted(name for name, (k, _, _) in TASKS.items() if k == kind)
+        print(f"{kind} ({flag}):")
+        for name in names:
+            needs = TASKS[name][1]
+            print(f"  {name}" + "".join(f" --{option}" for option in needs))
+    return 0
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        return list_tasks()
+    return run(args)
@@ -0,0 +1,381 @@
+"""
+Algorithm table for the headless CLI
+
+Each entry maps a command-line name to its input kind ("graph", "grid",
+"tree" or "nqueens"), the vertex options it needs and a function that runs
+the core algorithm on one loaded input.  ``run_task`` loads an input, runs
+the entry and returns a JSON-ready record; it is what each worker process
+calls in ``--jobs`` mode, so everything it takes and returns pickles.
+"""
+import contextlib
+import io
+import math
+import time
+
+TASKS = {}
+
+def _task(name, kind, needs=()):
+    """Register the decorated function as algorithm ``name`` for ``kind`` inputs."""
+    def register(fn):
+        TASKS[name] = (kind, needs, fn)
+        return fn
+    return register
+
+# --- Graph algorithms (the *_fast variants, run on a frozen CSRGraph) ---
+
+@_task("bfs", "graph", ("source",))
+def _bfs(graph, opts):
+    from core.graph.algorithms.bfs import bfs_fast
+    return bfs_fast(graph, opts["source"])
+
+@_task("dfs", "graph", ("source",))
+def _dfs(graph, opts):
+    from core.graph.algorithms.dfs import dfs_fast
+    return dfs_fast(graph, opts["source"])
+
+@_task("dijkstra", "graph", ("source",))
+def _dijkstra(graph, opts):
+    from core.graph.algorithms.dijkstra import dijkstra_fast
+    return dijkstra_fast(graph, opts["source"], opts.get("target"), queue=opts["queue"])
+
+@_task("bidirectional_dijkstra", "graph", ("source", "target"))
+def _bidirectional_dijkstra(graph, opts):
+    from core.graph.algorithms.bidirectional_dijkstra import bidirectional_dijkstra_fast
+    return bidirectional_dijkstra_fast(graph, opts["source"], opts["target"])
+
+@_task("astar", "graph", ("source", "target"))
+def _astar(graph, opts):
+    from core.graph.algorithms.astar import astar_fast
+    # Graph files carry no vertex positions, so only "alt" and "zero" apply
+    return astar_fast(graph, opts["source"], opts["target"], {}, heuristic=opts["heuristic"] or "alt", queue=opts["queue"])
+
+@_task("bellman_ford", "graph", ("source",))
+def _bellman_ford(graph, opts):
+    from core.graph.algorithms.bellman_ford import bellman_ford_fast
+    return bellman_ford_fast(graph, opts["source"])
+
+@_task("spfa", "graph", ("source",))
+def _spfa(graph, opts):
+    from core.graph.algorithms.spfa import spfa_fast
+    return spfa_fast(graph, opts["source"])
+
+@_task("delta_stepping", "graph", ("source",))
+def _delta_stepping(graph, opts):
+    from core.graph.algorithms.delta_stepping import delta_stepping
+    from core.graph.results import ShortestPathResult
+    mode = opts["mode"] or ("process" if opts["jobs"] > 1 else "serial")
+    dist, prev = delta_stepping(graph, opts["source"], delta=opts["delta"], mode=mode, jobs=opts["jobs"])
+    return ShortestPathResult(opts["source"], dist, prev, target=opts.get("target"))
+
+@_task("topo_sort_relax", "graph", ("source",))
+def _topo_sort_relax(graph, opts):
+    from core.graph.algorithms.topo_sort_relax import topo_sort_relax_fast
+    return topo_sort_relax_fast(graph, opts["source"])
+
+@_task("floyd_warshall", "graph")
+def _floyd_warshall(graph, opts):
+    from core.graph.algorithms.floyd_warshall import floyd_warshall_fast
+    return floyd_warshall_fast(graph)
+
+@_task("johnson", "graph")
+def _johnson(graph, opts):
+    from core.graph.algorithms.johnson import johnson_fast
+    return johnson_fast(graph, jobs=opts["jobs"])
+
+@_task("all_pairs_dijkstra", "graph")
+def _all_pairs_dijkstra(graph, opts):
+    from core.graph.algorithms.all_pairs_dijkstra import all_pairs_dijkstra
+    return all_pairs_dijkstra(graph, jobs=opts["jobs"])
+
+@_task("prim", "graph")
+def _prim(graph, opts):
+    from core.graph.algorithms.mst import prim_fast
+    return prim_fast(graph, queue=opts["queue"])
+
+@_task("kruskal", "graph")
+def _kruskal(graph, opts):
+    from core.graph.algorithms.mst import kruskal_fast
+    return kruskal_fast(graph)
+
+@_task("boruvka", "graph")
+def _boruvka(graph, opts):
+    from core.graph.algorithms.mst import boruvka_fast
+    return boruvka_fast(graph, jobs=opts["jobs"])
+
+@_task("topo_sort", "graph")
+def _topo_sort(graph, opts):
+    from core.graph.algorithms.topo_sort import topo_sort_fast
+    return topo_sort_fast(graph)
+
+@_task("scc", "graph")
+def _scc(graph, opts):
+    from core.graph.algorithms.scc import strongly_connected_components_fast
+    return strongly_connected_components_fast(graph)
+
+@_task("connected_components", "graph")
+def _connected_components(graph, opts):
+    from core.graph.algorithms.connected_components import connected_components_fast
+    return connected_components_fast(graph)
+
+@_task("cycle", "graph")
+def _cycle(graph, opts):
+    if graph.directed:
+        from core.graph.algorithms.cycle_detection import has_cycle_fast
+        return has_cycle_fast(graph)
+    from core.graph.algorithms.cycle_detection_undirected import has_cycle_undirected_fast
+    return has_cycle_undirected_fast(graph)
+
+@_task("bipartite", "graph")
+def _bipartite(graph, opts):
+    from core.graph.algorithms.bipartite import is_bipartite_fast
+    return is_bipartite_fast(graph)
+
+@_task("articulation_points", "graph")
+def _articulation_points(graph, opts):
+    from core.graph.algorithms.articulation_points import articulation_points_and_bridges_fast
+    return articulation_points_and_bridges_fast(graph)
+
+@_task("transitive_closure", "graph")
+def _transitive_closure(graph, opts):
+    from core.graph.algorithms.transitive_closure import transitive_closure_fast
+    return transitive_closure_fast(graph)
+
+# --- Grid/maze algorithms (text mazes, see core/grid/grid_io.py) ---
+
+def _maze_path(path):
+    return {
+        "found": bool(path),
+        "length": len(path) - 1 if path else None,
+        "cost": sum(cell.cost for cell in path[1:]) if path else None,
+        "path": [[cell.row, cell.col] for cell in path or ()],
+    }
+
+@_task("maze_bfs", "grid")
+def _maze_bfs(maze, opts):
+    from core.grid.maze_algorithms.bfs import bfs
+    return _maze_path(bfs(*maze))
+
+@_task("maze_dfs", "grid")
+def _maze_dfs(maze, opts):
+    from core.grid.maze_algorithms.dfs import dfs
+    return _maze_path(dfs(*maze))
+
+@_task("maze_dijkstra", "grid")
+def _maze_dijkstra(maze, opts):
+    from core.grid.maze_algorithms.dijkstra import dijkstra
+    return _maze_path(dijkstra(*maze, queue=opts["queue"]))
+
+@_task("maze_astar", "grid")
+def _maze_astar(maze, opts):
+    from core.grid.maze_algorithms.astar import astar
+    return _maze_path(astar(*maze, queue=opts["queue"]))
+
+@_task("maze_bidirectional_bfs", "grid")
+def _maze_bidirectional_bfs(maze, opts):
+    from core.grid.maze_algorithms.bidir_bfs import bidirectional_bfs
+    return _maze_path(bidirectional_bfs(*maze))
+
+# --- Trees (a file of whitespace-separated values; see read_tree_values) ---
+
+def _binary_tree(root):
+    from core.tree.bst import bst_traversals
+    def height(node):
+        return 1 + max(height(node.left), height(node.right)) if node else 0
+    result = bst_traversals(root)
+    result["height"] = height(root)
+    return result
+
+def _lca(opts, find):
+    if opts["lca"] is None:
+        return {}
+    a, b = opts["lca"]
+    return {"lca": find(a, b)}
+
+@_task("bst", "tree")
+def _bst(values, opts):
+    from core.tree.bst import bst_insert, bst_delete, bst_lca
+    root = None
+    for v in values:
+        root = bst_insert(root, v)
+    for v in opts["delete"]:
+        root = bst_delete(root, v)
+    return {**_binary_tree(root), **_lca(opts, lambda a, b: bst_lca(root, a, b))}
+
+@_task("avl", "tree")
+def _avl(values, opts):
+    from core.tree.avl import avl_insert, avl_delete
+    from core.tree.bst import bst_lca
+    root = None
+    for v in values:
+        root = avl_insert(root, v)
+    for v in opts["delete"]:
+        root = avl_delete(root, v)
+    return {**_binary_tree(root), **_lca(opts, lambda a, b: bst_lca(root, a, b))}
+
+@_task("binary_tree", "tree")
+def _generic_tree(values, opts):
+    from core.tree.operations import tree_insert, tree_delete, tree_lca
+    root = None
+    for v in values:
+        root = tree_insert(root, v)
+    for v in opts["delete"]:
+        root = tree_delete(root, v)
+    return {**_binary_tree(root), **_lca(opts, lambda a, b: tree_lca(root, a, b))}
+
+@_task("trie", "tree")
+def _trie(values, opts):
+    from core.tree.trie import TrieNode, trie_insert, trie_search, trie_prefix_match
+    root = TrieNode()
+    for word in values:
+        trie_insert(root, str(word))
+    result = {"words": len(set(map(str, values)))}
+    if opts["prefix"] is not None:
+        result["matches"] = trie_prefix_match(root, opts["prefix"])
+    if opts["search"]:
+        result["found"] = {word: trie_search(root, word) for word in opts["search"]}
+    return result
+
+@_task("nary_tree", "tree")
+def _nary_tree(values, opts):
+    from core.tree.nary_tree import NaryTreeNode, nary_bfs, nary_dfs
+    # Values are read as "parent child" pairs; the first parent is the root
+    if len(values) % 2:
+        raise ValueError("An n-ary tree file lists 'parent child' pairs; the value count is odd.")
+    nodes = {}
+    root = None
+    for parent, child in zip(values[::2], values[1::2]):
+        if parent not in nodes:
+            if root is not None:
+                raise ValueError(f"Parent {parent!r} appears before it is added as a child.")
+            root = nodes[parent] = NaryTreeNode(parent)
+        if child in nodes:
+            raise ValueError(f"{child!r} has more than one parent.")
+        nodes[child] = NaryTreeNode(child)
+        nodes[parent].children.append(nodes[child])
+    return {"bfs": nary_bfs(root), "dfs": nary_dfs(root)}
+
+# --- N-Queens (inputs are board sizes) ---
+
+@_task("nqueens", "nqueens")
+def _nqueens(n, opts):
+    from core.n_queens.solver import nqueens_solutions
+    count, boards = nqueens_solutions(n, limit=opts["limit"])
+    return {"n": n, "count": count, "solutions": boards}
+
+# --- Loading inputs ---
+
+def coerce(tokens):
+    """Tree values and CLI vertex names: ints when every token is an int, else strings."""
+    try:
+        return [int(t) for t in tokens]
+    except ValueError:
+        return list(tokens)
+
+def read_tree_values(path):
+    """Whitespace-separated values; lines starting with '#' are comments."""
+    with open(path, encoding="utf-8") as f:
+        return coerce([t for line in f if not line.lstrip().startswith("#") for t in line.split()])
+
+def _vertex(graph, name):
+    """The vertex of ``graph`` called ``name`` on the command line."""
+    index = getattr(graph, "index", None)
+    has = index.__contains__ if index is not None else set(graph.get_vertices()).__contains__
+    if has(name):
+        return name
+    try:
+        if has(int(name)):
+            return int(name)
+    except ValueError:
+        pass
+    raise ValueError(f"Vertex {name!r} is not in the graph.")
+
+def _load(kind, item, opts):
+    if kind == "graph":
+        from core.graph.graph_io import read_graph
+        kwargs = {} if opts["directed"] is None else {"directed": opts["directed"]}
+        graph = read_graph(item, opts["input_format"], frozen=True, **kwargs)
+        opts = dict(opts)
+        for key in ("source", "target"):
+            if opts.get(key) is not None:
+                opts[key] = _vertex(graph, opts[key])
+        return graph, opts
+    if kind == "grid":
+        from core.grid.grid_io import read_grid
+        return read_grid(item), opts
+    if kind == "tree":
+        return read_tree_values(item), opts
+    return item, opts
+
+# --- JSON encoding ---
+
+def _number(x):
+    """JSON-safe number: unreachable (infinite) distances become null."""
+    if x is None:
+        return None
+    x = x.item() if hasattr(x, "item") else x
+    return None if isinstance(x, float) and math.isinf(x) else x
+
+def _matrix(rows):
+    if rows is None:
+        return None
+    rows = rows.tolist() if hasattr(rows, "tolist") else rows
+    return [[_number(x) for x in row] for row in rows]
+
+def encode(result, opts):
+    """JSON-ready form of an algorithm result (objects from core/graph/results.py or plain dicts)."""
+    from core.graph import results as r
+    if isinstance(result, r.ShortestPathResult):
+        out = {"source": result.source, "negative_cycle": result.negative_cycle}
+        target = result.target if result.target is not None else opts.get("target")
+        if target is not None:
+            out["target"] = target
+            out["distance"] = None if result.negative_cycle else _number(result.dist.get(target))
+            out["path"] = result.path_to(target)
+        if result.dist is not None and result.target is None:
+            out["distances"] = [[v, _number(d)] for v, d in result.dist.items()]
+            out["predecessors"] = [[v, p] for v, p in result.prev.items() if p is not None]
+        return out
+    if isinstance(result, r.AllPairsResult):
+        return {"vertices": list(result.vertices), "negative_cycle": result.negative_cycle, "distances": _matrix(result.dist)}
+    if isinstance(result, r.ComponentsResult):
+        return {"count": len(result), "components": [list(c) for c in result.components]}
+    if isinstance(result, r.SpanningTreeResult):
+        return {"total_weight": _number(result.total_weight), "edges": [[u, v, _number(w)] for u, v, w in result.edges]}
+    if isinstance(result, r.TraversalResult):
+        return {"order": list(result.order)}
+    if isinstance(result, r.CycleResult):
+        return {"has_cycle": result.has_cycle, "cycle": list(result.cycle)}
+    if isinstance(result, r.BipartiteResult):
+        return {"is_bipartite": result.is_bipartite, "coloring": [[v, c] for v, c in result.color.items()],
+                "conflict": list(result.conflict) if result.conflict else None}
+    if isinstance(result, r.ArticulationResult):
+        return {"points": list(result.points), "bridges": [list(e) for e in result.bridges]}
+    if isinstance(result, r.ClosureResult):
+        vertices = list(result.vertices)
+        return {"vertices": vertices, "reachable": [[u, [v for v in vertices if result.reachable(u, v)]] for u in vertices]}
+    return result
+
+def run_task(name, item, opts):
+    """Load ``item``, run algorithm ``name`` on it and return a JSON-ready record.
+
+    Any exception from loading or running is reported in the record's
+    "error" field instead of raised, so one bad file does not stop a batch
+    (or a worker pool's ``map``).
+    """
+    kind, _, fn = TASKS[name]
+    record = {"algorithm": name, "input": item}
+    try:
+        start = time.perf_counter()
+        data, opts = _load(kind, item, opts)
+        loaded = time.perf_counter()
+        # The tree engines print progress lines; keep them out of the JSON stream
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = encode(fn(data, opts), opts)
+        done = time.perf_counter()
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+        return record
+    record["load_seconds"] = round(loaded - start, 6)
+    record["run_seconds"] = round(done - loaded, 6)
+    record["result"] = result
+    return record
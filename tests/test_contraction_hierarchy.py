@@ -0,0 +1,78 @@
+import random
+import pytest
+from core.graph.graph import Graph
+from core.graph.contraction_hierarchy import ContractionHierarchy
+from core.graph.algorithms.dijkstra import dijkstra_fast
+
+def random_graph(seed, directed):
+    rng = random.Random(seed)
+    n = rng.randint(2, 40)
+    graph = Graph(directed=directed)
+    for v in range(n):
+        graph.add_vertex(v)
+    for _ in range(rng.randint(0, 4 * n)):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            graph.add_edge(u, v, rng.randint(0, 20))
+    return graph
+
+def weight(graph, u, v):
+    return min(w for x, w in graph.get_neighbors(u) if x == v)
+
+def check_against_dijkstra(graph, ch, pairs):
+    for s, t in pairs:
+        expected = dijkstra_fast(graph, s).dist[t]
+        assert ch.distance(s, t) == expected
+        result = ch.shortest_path(s, t)
+        path = result.path
+        if expected == float('inf'):
+            assert path == []
+            continue
+        assert path[0] == s and path[-1] == t
+        assert sum(weight(graph, u, v) for u, v in zip(path, path[1:])) == expected
+
+@pytest.mark.parametrize("directed", [True, False])
+@pytest.mark.parametrize("seed", range(30))
+def test_matches_dijkstra_on_random_graphs(seed, directed):
+    graph = random_graph(seed, directed)
+    ch = ContractionHierarchy.from_graph(graph)
+    rng = random.Random(seed + 1000)
+    vertices = list(graph.get_vertices())
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(20)]
+    check_against_dijkstra(graph, ch, pairs)
+
+def test_small_witness_limit_still_exact():
+    graph = random_graph(7, True)
+    ch = ContractionHierarchy.from_graph(graph, witness_limit=1)
+    vertices = list(graph.get_vertices())
+    check_against_dijkstra(graph, ch, [(s, t) for s in vertices[:5] for t in vertices])
+
+def test_string_labels():
+    graph = Graph(directed=True)
+    for u, v, w in [("a", "b", 1), ("b", "c", 2), ("a", "c", 5), ("c", "d", 1), ("d", "a", 1)]:
+        graph.add_edge(u, v, w)
+    ch = ContractionHierarchy.from_graph(graph)
+    assert ch.distance("a", "d") == 4
+    assert ch.shortest_path("a", "d").path == ["a", "b", "c", "d"]
+    assert ch.distance("d", "b") == 2
+
+@pytest.mark.parametrize("directed", [True, False])
+def test_save_load_round_trip(tmp_path, directed):
+    graph = random_graph(42, directed)
+    ch = ContractionHierarchy.from_graph(graph)
+    path = tmp_path / "ch.json"
+    ch.save(path)
+    loaded = ContractionHierarchy.load(path)
+    assert loaded.labels == ch.labels
+    assert loaded.rank == ch.rank
+    assert loaded.up == ch.up
+    assert loaded.down == ch.down
+    assert loaded.directed == ch.directed
+    vertices = list(graph.get_vertices())
+    check_against_dijkstra(graph, loaded, [(s, t) for s in vertices[:4] for t in vertices])
+
+def test_load_rejects_other_json(tmp_path):
+    path = tmp_path / "other.json"
+    path.write_text('{"format": "something-else"}')
+    with pytest.raises(ValueError):
+        ContractionHierarchy.load(path)
@@ -0,0 +1,134 @@
+import random
+import pytest
+from core.graph import graph_io
+from core.graph.csr import CSRGraph
+from core.graph.graph import Graph
+
+EDGE_LIST_FORMATS = [".txt", ".csv", ".tsv", ".txt.gz"]
+ALL_FORMATS = EDGE_LIST_FORMATS + [".json", ".graphml", ".gr", ".snap"]
+
+@pytest.fixture(params=["numpy", "pure"])
+def backend(request, monkeypatch):
+    """Run each test with NumPy and with the pure-Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(graph_io, "_numpy", lambda: None)
+    return request.param
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    # Chunks of a few lines, so multi-chunk reads and chunk boundaries are exercised
+    monkeypatch.setattr(graph_io, "BLOCK_BYTES", 64)
+
+def random_graph(seed, directed, labels="int", weights="int", n=40, m=150):
+    rng = random.Random(seed)
+    names = list(range(1, n + 1)) if labels == "int" else [f"v{i}" for i in range(n)]
+    graph = Graph(directed=directed)
+    for v in names:
+        graph.add_vertex(v)
+    for _ in range(m):
+        u, v = rng.choice(names), rng.choice(names)
+        w = rng.randint(-5, 20) if weights == "int" else round(rng.uniform(0, 5), 3)
+        graph.add_edge(u, v, w)
+    return graph
+
+def adjacency(graph, keep_isolated=True):
+    adj = {u: sorted(graph.get_neighbors(u), key=repr) for u in graph.get_vertices()}
+    if not keep_isolated:
+        touched = {u for u, nbrs in adj.items() if nbrs} | {v for nbrs in adj.values() for v, _ in nbrs}
+        adj = {u: nbrs for u, nbrs in adj.items() if u in touched}
+    return adj
+
+def as_directed(graph):
+    """The arcs of ``graph`` as a directed Graph (what DIMACS stores for an undirected one)."""
+    out = Graph(directed=True)
+    for u in graph.get_vertices():
+        out.add_vertex(u)
+        for v, w in graph.get_neighbors(u):
+            out.add_edge(u, v, w)
+    return out
+
+def round_trip(graph, path, frozen):
+    graph_io.write_graph(graph, path)
+    kwargs = {}
+    if str(path).endswith(".gr"):
+        kwargs["directed"] = True
+    elif not str(path).endswith((".json", ".graphml", ".snap")):
+        kwargs["directed"] = graph.directed
+    return graph_io.read_graph(path, frozen=frozen, **kwargs)
+
+def check_round_trip(graph, path, frozen):
+    loaded = round_trip(graph, path, frozen)
+    expected = as_directed(graph) if str(path).endswith(".gr") else graph
+    # Edge lists cannot store isolated vertices
+    keep_isolated = not any(str(path).endswith(ext) for ext in EDGE_LIST_FORMATS)
+    assert adjacency(loaded, keep_isolated) == adjacency(expected, keep_isolated)
+    assert loaded.directed == expected.directed
+    assert isinstance(loaded, CSRGraph) == frozen
+
+@pytest.mark.parametrize("ext", ALL_FORMATS)
+@pytest.mark.parametrize("directed", [True, False])
+@pytest.mark.parametrize("labels", ["int", "str"])
+@pytest.mark.parametrize("frozen", [False, True])
+def test_round_trip(tmp_path, backend, ext, directed, labels, frozen):
+    if ext == ".gr" and labels == "str":
+        pytest.skip("DIMACS vertices are 1..n")
+    graph = random_graph(ALL_FORMATS.index(ext) * 4 + directed * 2 + (labels == "str"), directed, labels)
+    check_round_trip(graph, tmp_path / f"g{ext}", frozen)
+
+@pytest.mark.parametrize("ext", [".txt", ".csv", ".json", ".graphml"])
+def test_float_weights(tmp_path, backend, ext):
+    graph = random_graph(5, True, weights="float")
+    check_round_trip(graph, tmp_path / f"g{ext}", True)
+
+@pytest.mark.parametrize("ext", [".txt", ".csv", ".gr"])
+def test_many_chunks(tmp_path, backend, small_blocks, ext):
+    graph = random_graph(11, True, n=300, m=2000)
+    check_round_trip(graph, tmp_path / f"g{ext}", True)
+
+def test_numeric_labels_then_string_label_switches_to_generic(tmp_path, backend, small_blocks):
+    # Many chunks of integer labels parse as numeric blocks; the string label
+    # near the end forces the reader to re-intern everything one by one
+    rng = random.Random(2)
+    edges = [(rng.randint(1, 50), rng.randint(1, 50), rng.randint(1, 9)) for _ in range(400)]
+    edges.append((7, "hub", 3))
+    edges += [(rng.randint(1, 50), rng.randint(1, 50), rng.randint(1, 9)) for _ in range(50)]
+    path = tmp_path / "mixed.txt"
+    path.write_text("".join(f"{u} {v} {w}\n" for u, v, w in edges))
+    expected = Graph(directed=True)
+    for u, v, w in edges:
+        expected.add_edge(u, v, w)
+    loaded = graph_io.read_graph(path, directed=True, frozen=True)
+    assert adjacency(loaded) == adjacency(expected)
+
+def test_comments_blank_lines_header_and_missing_weights(tmp_path, backend, small_blocks):
+    path = tmp_path / "g.csv"
+    path.write_text("source,target,weight\n# comment\n1,2,5\n\n2,3\n% another\n3,1,2\n" + "".join(f"{i},{i + 1},1\n" for i in range(4, 40)))
+    loaded = graph_io.read_graph(path, directed=True)
+    assert sorted(loaded.get_neighbors(1)) == [(2, 5)]
+    assert sorted(loaded.get_neighbors(2)) == [(3, 1)]
+    assert sorted(loaded.get_neighbors(3)) == [(1, 2)]
+    assert sorted(loaded.get_neighbors(39)) == [(40, 1)]
+
+def test_header_false_keeps_first_line(tmp_path, backend):
+    path = tmp_path / "g.txt"
+    path.write_text("from to\n1 2\n")
+    loaded = graph_io.read_edge_list(path, directed=True, header=False)
+    assert sorted(loaded.get_neighbors("from")) == [("to", 1)]
+
+def test_progress_reaches_file_size(tmp_path, backend, small_blocks):
+    graph = random_graph(3, True, n=100, m=500)
+    path = tmp_path / "g.txt"
+    graph_io.write_graph(graph, path)
+    calls = []
+    graph_io.read_graph(path, directed=True, progress=lambda done, total: calls.append((done, total)))
+    assert len(calls) > 1
+    assert calls[-1][0] == calls[-1][1] == path.stat().st_size
+
+def test_unknown_extension_needs_fmt(tmp_path):
+    path = tmp_path / "g.weird"
+    path.write_text("1 2\n")
+    with pytest.raises(ValueError):
+        graph_io.read_graph(path)
+    assert sorted(graph_io.read_graph(path, fmt="edgelist", directed=True).get_neighbors(1)) == [(2, 1)]
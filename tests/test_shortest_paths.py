@@ -0,0 +1,60 @@
+import sys
+import pytest
+from core.graph.algorithms.bellman_ford import bellman_ford_fast
+from core.graph.algorithms.floyd_warshall import floyd_warshall, floyd_warshall_fast
+from core.graph.algorithms.spfa import spfa, spfa_fast
+from core.graph.graph import Graph
+from core.steps import run_to_completion
+
+@pytest.fixture(params=["numpy", "pure"])
+def backend(request, monkeypatch):
+    """Run each test with NumPy and with the pure-Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    return request.param
+
+def make_graph(edges, vertices=()):
+    graph = Graph(directed=True)
+    for v in vertices:
+        graph.add_vertex(v)
+    for u, v, w in edges:
+        graph.add_edge(u, v, w)
+    return graph
+
+def generator_distance(graph, u, v):
+    dist, _ = run_to_completion(floyd_warshall(graph))
+    idx = {x: i for i, x in enumerate(graph.get_vertices())}
+    return dist[idx[u]][idx[v]]
+
+def test_floyd_warshall_keeps_lightest_parallel_edge(backend):
+    for edges in ([(1, 2, 3), (1, 2, 5)], [(1, 2, 5), (1, 2, 3)]):
+        graph = make_graph(edges, [1, 2])
+        assert floyd_warshall_fast(graph).distance(1, 2) == 3
+        assert generator_distance(graph, 1, 2) == 3
+
+def test_floyd_warshall_ignores_positive_self_loop(backend):
+    graph = make_graph([(1, 1, 5), (1, 2, 1)])
+    result = floyd_warshall_fast(graph)
+    assert result.distance(1, 1) == 0
+    assert result.distance(1, 2) == 1
+    assert generator_distance(graph, 1, 1) == 0
+
+def test_floyd_warshall_negative_self_loop_is_a_cycle(backend):
+    graph = make_graph([(1, 1, -2), (1, 2, 1)])
+    assert floyd_warshall_fast(graph).distance(1, 1) < 0
+    assert generator_distance(graph, 1, 1) < 0
+
+def test_spfa_parallel_edges_are_not_a_negative_cycle():
+    graph = make_graph([(1, 2, 4), (1, 2, 3), (1, 2, 2)])
+    result = spfa_fast(graph, 1)
+    assert not result.negative_cycle
+    assert result.dist[2] == bellman_ford_fast(graph, 1).dist[2] == 2
+    dist, _ = run_to_completion(spfa(graph, 1))
+    assert dist[2] == 2
+
+def test_spfa_detects_negative_cycle():
+    graph = make_graph([(1, 2, 1), (2, 3, -2), (3, 2, 1)])
+    assert spfa_fast(graph, 1).negative_cycle
+    assert run_to_completion(spfa(graph, 1)) == (None, None)
@@ -1,8 +1,10 @@
 import pygame
 import sys
-import string
 import math
 from core.graph.graph import Graph
+from core.graph.labels import LabelAllocator, alias, alias_id, aliases
+from core.graph.trace_cache import StepStream, trace_cache
+from .editor_model import EditorModel
 from core.graph.algorithms.bfs import bfs
 from core.graph.algorithms.dfs import dfs
 from core.graph.algorithms.cycle_detection import has_cycle
@@ -28,6 +30,7 @@ class VisualNode:
     """A visual node in the graph, with label and position."""
     def __init__(self, label, pos):
         self.label = label
+        self.name = alias(label)
         self.pos = pos
         self.selected = False
         self.color_id = None
@@ -67,10 +70,9 @@ class DirectedGraphVisualizer:
         self.win = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
         pygame.display.set_caption("Directed Graph Visualizer")
         self.font = pygame.font.SysFont(None, FONT_SIZE)
-        self.nodes = []
-        self.edges = []
+        self.model = EditorModel()
         self.graph = Graph(directed=True)
-        self.node_labels = iter(string.ascii_uppercase)
+        self.node_labels = LabelAllocator()
         self.selected_node = None
         self.start_node = None
         self.dragging = False
@@ -86,12 +88,21 @@ class DirectedGraphVisualizer:
         self.current_mode = MODE_EDIT
         self.active_algo = None
         self.animating = False
-        self.animation_steps = []
-        self.animation_index = 0
+        self.animation_steps = StepStream(())
+        self.visit_order = []
+        self.paused = False
         self.animation_delay = 600  # ms
         self.show_help = False
         self.setup_buttons()
 
+    @property
+    def nodes(self):
+        return self.model.nodes
+
+    @property
+    def edges(self):
+        return self.model.edges
+
     def setup_buttons(self):
         w, h = 150, 36
         gap = 30
@@ -154,7 +165,7 @@ class DirectedGraphVisualizer:
                 color = NODE_COLOR
             pygame.draw.circle(self.win, color, node.pos, NODE_RADIUS)
             pygame.draw.circle(self.win, (0,0,0), node.pos, NODE_RADIUS, 2)
-            label_surf = self.font.render(node.label, True, TEXT_COLOR)
+            label_surf = self.font.render(node.name, True, TEXT_COLOR)
             rect = label_surf.get_rect(center=node.pos)
             self.win.blit(label_surf, rect)
         # Draw dragging edge
@@ -194,6 +205,7 @@ class DirectedGraphVisualizer:
                 "E: Edit mode",
                 "S: Set start node (for BFS/DFS)",
                 "+/-: Adjust animation speed",
+                "Space: Pause/resume, Left/Right: Step back/forward while paused",
                 "H: Toggle this help overlay",
                 "",
                 "ALGORITHMS:",
@@ -264,51 +276,51 @@ class DirectedGraphVisualizer:
 
     def select_node(self, label):
         if self.current_mode == MODE_EDIT:
-            node = next((n for n in self.nodes if n.label == label), None)
+            node = self.model.node(label)
             if node:
                 self.selected_node = node
-                self.message = f"Node '{label}' selected. Click to add edge."
+                self.message = f"Node '{alias(label)}' selected. Click to add edge."
             else:
-                self.selected_node = VisualNode(label, pygame.mouse.get_pos())
+                self.selected_node = VisualNode(self.node_labels.claim(label), pygame.mouse.get_pos())
                 # Add to graph and UI
-                if label not in self.graph.get_vertices():
-                    self.graph.adj[label] = []
-                self.nodes.append(self.selected_node)
-                self.message = f"Node '{label}' added. Click to add edge."
+                self.graph.add_vertex(label)
+                self.model.add_node(self.selected_node)
+                self.message = f"Node '{alias(label)}' added. Click to add edge."
         elif self.current_mode == MODE_SET_START:
-            node = next((n for n in self.nodes if n.label == label), None)
+            node = self.model.node(label)
             if node:
                 self.start_node = node
-                self.message = f"Start node set to '{label}'."
+                self.message = f"Start node set to '{alias(label)}'."
             else:
-                self.error_msg = f"Node '{label}' not found."
+                self.error_msg = f"Node '{alias(label)}' not found."
 
     def add_edge(self, u, v):
         if self.current_mode == MODE_EDIT:
             if u and v:
-                self.edges.append(VisualEdge(u, v))
+                self.model.add_edge(VisualEdge(u, v))
                 self.graph.add_edge(u.label, v.label)
-                self.message = f"Edge from '{u.label}' to '{v.label}' added."
+                self.message = f"Edge from '{u.name}' to '{v.name}' added."
             else:
                 self.error_msg = "Cannot add edge: no node selected or target position is occupied."
         elif self.current_mode == MODE_SET_START:
             if self.start_node and v:
                 self.start_node = v
-                self.graph.add_node(self.start_node.label)
-                self.nodes.append(self.start_node)
-                self.message = f"Start node set to '{self.start_node.label}'."
+                self.graph.add_vertex(self.start_node.label)
+                self.model.add_node(self.start_node)
+                self.message = f"Start node set to '{self.start_node.name}'."
             else:
                 self.error_msg = "Cannot set start node: no node selected or target position is occupied."
 
     def delete_selected(self):
         if self.selected_node:
-            self.graph.remove_node(self.selected_node.label)
-            self.nodes = [n for n in self.nodes if n != self.selected_node]
+            self.graph.remove_vertex(self.selected_node.label)
+            self.model.remove_node(self.selected_node)
+            self.node_labels.release(self.selected_node.label)
             self.selected_node = None
             self.message = "Node deleted."
         elif self.selected_edge:
             self.graph.remove_edge(self.selected_edge.u.label, self.selected_edge.v.label)
-            self.edges = [e for e in self.edges if e != self.selected_edge]
+            self.model.remove_edge(self.selected_edge)
             self.selected_edge = None
             self.message = "Edge deleted."
         else:
@@ -316,8 +328,8 @@ class DirectedGraphVisualizer:
 
     def reset_graph(self):
         self.graph = Graph(directed=True)
-        self.nodes = []
-        self.edges = []
+        self.model.clear()
+        self.node_labels.reset()
         self.selected_node = None
         self.start_node = None
         self.message = "Graph reset."
@@ -334,8 +346,9 @@ class DirectedGraphVisualizer:
             return
         self.result_msg = ''
         self.error_msg = ''
-        self.animation_steps = []
-        self.animation_index = 0
+        self.animation_steps = StepStream(())
+        self.visit_order = []
+        self.paused = False
         self.animating = False
         for node in self.nodes:
             node.selected = False
@@ -350,24 +363,19 @@ class DirectedGraphVisualizer:
                 self.error_msg = "Select a start node (click a node) before running."
                 return
             self.animating = True
-            self.animation_steps = list(bfs(self.graph, self.start_node.label)) if self.active_algo == "BFS" else list(dfs(self.graph, self.start_node.label))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(bfs, self.graph, self.start_node.label) if self.active_algo == "BFS" else trace_cache.stream(dfs, self.graph, self.start_node.label)
         elif self.active_algo == "Cycle Detection":
             self.animating = True
-            self.animation_steps = list(has_cycle(self.graph, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(has_cycle, self.graph, visualize=True)
         elif self.active_algo == "Topological Sort":
             self.animating = True
-            self.animation_steps = list(topo_sort(self.graph, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(topo_sort, self.graph, visualize=True)
         elif self.active_algo == "SCC":
             self.animating = True
-            self.animation_steps = list(strongly_connected_components(self.graph, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(strongly_connected_components, self.graph, visualize=True)
         elif self.active_algo == "Transitive Closure":
             self.animating = True
-            self.animation_steps = list(transitive_closure(self.graph, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(transitive_closure, self.graph, visualize=True)
         elif self.active_algo == "Shortest Path (BFS)":
             if not self.start_node:
                 self.error_msg = "Select a start node (click a node) before running."
@@ -401,14 +409,21 @@ class DirectedGraphVisualizer:
                 path.reverse()
                 steps.append(("path", path))
             self.animating = True
-            self.animation_steps = steps
-            self.animation_index = 0
+            self.animation_steps = StepStream(steps)
         else:
             self.error_msg = f"{self.active_algo} not implemented yet."
 
+    def step_back(self):
+        """Pause and redraw the previous step from the stream's bounded history."""
+        # Un-read the step on screen and the one before it, then replay the earlier one
+        if self.animation_steps.back(2):
+            self.animating = True
+            self.paused = True
+            self.animate()
+
     def animate(self):
-        if self.animating and self.animation_index < len(self.animation_steps):
-            step = self.animation_steps[self.animation_index]
+        if self.animating and self.animation_steps.has_next():
+            step = self.animation_steps.next()
             for node in self.nodes:
                 node.selected = False
                 node.temp_color = None
@@ -420,7 +435,10 @@ class DirectedGraphVisualizer:
             if self.active_algo in ("BFS", "DFS"):
                 for node in self.nodes:
                     node.selected = (node.label == step)
-                msg = f"{self.active_algo} visiting: {step}"
+                # Indexed by stream position, so a replay after step_back overwrites instead of appending
+                del self.visit_order[self.animation_steps.position - 1:]
+                self.visit_order.append(step)
+                msg = f"{self.active_algo} visiting: {alias(step)}"
             elif self.active_algo == "Cycle Detection":
                 if step[0] == "visit":
                     label = step[1]
@@ -429,20 +447,20 @@ class DirectedGraphVisualizer:
                     for node in self.nodes:
                         if node.label in path:
                             node.selected = True
-                    msg = f"DFS path: {' -> '.join(path)} | RecStack: {', '.join(rec_stack)}"
+                    msg = f"DFS path: {' -> '.join(aliases(path))} | RecStack: {', '.join(aliases(rec_stack))}"
                 elif step[0] == "cycle":
                     cycle_path = step[1]
                     for node in self.nodes:
                         if node.label in cycle_path:
                             node.selected = True
-                    msg = f"Cycle found: {' -> '.join(cycle_path)}"
+                    msg = f"Cycle found: {' -> '.join(aliases(cycle_path))}"
                 elif step[0] == "done":
                     has_cycle = step[1]
                     cycle_path = step[2]
                     msg = "Cycle Detected!" if has_cycle else "No Cycles."
             elif self.active_algo == "Topological Sort":
                 if step[0] == "init_queue":
-                    msg = f"Initial queue: {', '.join(step[1])}"
+                    msg = f"Initial queue: {', '.join(aliases(step[1]))}"
                 elif step[0] == "visit":
                     label = step[1]
                     order = step[2]
@@ -450,16 +468,16 @@ class DirectedGraphVisualizer:
                     for node in self.nodes:
                         if node.label == label:
                             node.selected = True
-                    msg = f"TopoSort visiting: {label} | Order: {' -> '.join(order)} | Queue: {', '.join(queue)}"
+                    msg = f"TopoSort visiting: {alias(label)} | Order: {' -> '.join(aliases(order))} | Queue: {', '.join(aliases(queue))}"
                 elif step[0] == "enqueue":
                     label = step[1]
                     queue = step[2]
-                    msg = f"Enqueue: {label} | Queue: {', '.join(queue)}"
+                    msg = f"Enqueue: {alias(label)} | Queue: {', '.join(aliases(queue))}"
                 elif step[0] == "cycle":
                     msg = "Cycle detected! No topological order."
                 elif step[0] == "done":
                     order = step[1]
-                    msg = f"Topological Order: {' -> '.join(order)}"
+                    msg = f"Topological Order: {' -> '.join(aliases(order))}"
             elif self.active_algo == "SCC":
                 if step[0] == "visit":
                     label = step[1]
@@ -467,11 +485,11 @@ class DirectedGraphVisualizer:
                     for node in self.nodes:
                         if node.label == label:
                             node.selected = True
-                    msg = f"SCC {phase} DFS visiting: {label}"
+                    msg = f"SCC {phase} DFS visiting: {alias(label)}"
                 elif step[0] == "finish":
                     label = step[1]
                     order = step[2]
-                    msg = f"Finish: {label} | Order: {', '.join(order)}"
+                    msg = f"Finish: {alias(label)} | Order: {', '.join(aliases(order))}"
                 elif step[0] == "transpose":
                     msg = "Transposing graph..."
                 elif step[0] == "component":
@@ -480,7 +498,7 @@ class DirectedGraphVisualizer:
                     for node in self.nodes:
                         if node.label in comp:
                             node.temp_color = COMPONENT_COLORS[len(sccs) % len(COMPONENT_COLORS)]
-                    msg = f"SCC found: {{{', '.join(comp)}}}"
+                    msg = f"SCC found: {{{', '.join(aliases(comp))}}}"
                 elif step[0] == "done":
                     sccs = step[1]
                     msg = f"Total SCCs: {len(sccs)}"
@@ -490,8 +508,11 @@ class DirectedGraphVisualizer:
                     vertices = step[2]
                     msg = f"Initial closure matrix."
                 elif step[0] == "update":
-                    i, j, k, closure = step[1], step[2], step[3], step[4]
-                    msg = f"Closure[{i},{j}] updated via {k}."
+                    # Delta event: only the vertices newly reachable from i via k
+                    i, k, gained = step[1], step[2], step[3]
+                    for node in self.nodes:
+                        node.selected = node.label == i or node.label in gained
+                    msg = f"{alias(i)} reaches {', '.join(aliases(gained))} via {alias(k)}."
                 elif step[0] == "done":
                     closure = step[1]
                     vertices = step[2]
@@ -502,36 +523,35 @@ class DirectedGraphVisualizer:
                     for node in self.nodes:
                         if node.label == label:
                             node.selected = True
-                    msg = f"BFS visiting: {label}"
+                    msg = f"BFS visiting: {alias(label)}"
                 elif step[0] == "path":
                     path = step[1]
                     for node in self.nodes:
                         if node.label in path:
                             node.selected = True
-                    msg = f"Shortest path: {' -> '.join(path)}"
+                    msg = f"Shortest path: {' -> '.join(aliases(path))}"
             self.result_msg = msg
             self.draw()
             pygame.time.delay(self.animation_delay)
-            self.animation_index += 1
         else:
             self.animating = False
             # Final result message for each algo
             if self.active_algo == "Topological Sort" and self.animation_steps:
-                order = self.animation_steps[-1][1] if self.animation_steps[-1][0] == "done" else []
-                self.result_msg = f"Topological Order: {' -> '.join(order)}"
+                order = self.animation_steps.current[1] if self.animation_steps.current[0] == "done" else []
+                self.result_msg = f"Topological Order: {' -> '.join(aliases(order))}"
             elif self.active_algo == "Cycle Detection" and self.animation_steps:
-                has_cycle = self.animation_steps[-1][1] if self.animation_steps[-1][0] == "done" else False
+                has_cycle = self.animation_steps.current[1] if self.animation_steps.current[0] == "done" else False
                 self.result_msg = "Cycle Detected!" if has_cycle else "No Cycles."
             elif self.active_algo == "SCC" and self.animation_steps:
-                sccs = self.animation_steps[-1][1] if self.animation_steps[-1][0] == "done" else []
+                sccs = self.animation_steps.current[1] if self.animation_steps.current[0] == "done" else []
                 self.result_msg = f"Total SCCs: {len(sccs)}"
             elif self.active_algo == "Transitive Closure" and self.animation_steps:
                 self.result_msg = "Transitive closure complete."
             elif self.active_algo == "Shortest Path (BFS)" and self.animation_steps:
-                path = self.animation_steps[-1][1] if self.animation_steps[-1][0] == "path" else []
-                self.result_msg = f"Shortest path: {' -> '.join(path)}"
+                path = self.animation_steps.current[1] if self.animation_steps.current[0] == "path" else []
+                self.result_msg = f"Shortest path: {' -> '.join(aliases(path))}"
             elif self.active_algo in ("BFS", "DFS") and self.animation_steps:
-                order = [str(x) for x in self.animation_steps]
+                order = aliases(self.visit_order)
                 self.result_msg = f"{self.active_algo} order: {' -> '.join(order)}"
             for node in self.nodes:
                 node.selected = False
@@ -548,27 +568,21 @@ class DirectedGraphVisualizer:
             self.message = "Click to add node | Drag to add edge | Del: delete | R: Reset | Q: Quit | H: Help"
 
     def _add_node_at(self, pos):
-        try:
-            label = next(self.node_labels)
-        except StopIteration:
-            return None
-        node = VisualNode(label, pos)
-        self.nodes.append(node)
-        self.graph.adj[label] = []
+        label = self.node_labels.allocate()
+        node = self.model.add_node(VisualNode(label, pos))
+        self.graph.add_vertex(label)
         return node
 
     def _add_edge_by_label(self, l1, l2):
-        n1 = next((n for n in self.nodes if n.label == l1), None)
-        n2 = next((n for n in self.nodes if n.label == l2), None)
+        n1 = self.model.node(alias_id(l1))
+        n2 = self.model.node(alias_id(l2))
         if n1 and n2:
-            self.edges.append(VisualEdge(n1, n2))
+            self.model.add_edge(VisualEdge(n1, n2))
             self.graph.add_edge(n1.label, n2.label)
 
     def load_example_graph(self):
         self.reset_graph()
-        self.node_labels = iter(string.ascii_uppercase)
-        self.nodes.clear()
-        self.edges.clear()
+        self.model.clear()
         self.graph = Graph(directed=True)
         self.selected_node = None
         self.selected_edge = None
@@ -662,14 +676,14 @@ class DirectedGraphVisualizer:
 
     def get_node_at_pos(self, pos):
         """Returns the node at the given position, or None if no node is found."""
-        for node in self.nodes:
+        for node in self.model.nodes_near(pos, 2 * NODE_RADIUS):
             if (node.pos[0] - pos[0]) ** 2 + (node.pos[1] - pos[1]) ** 2 < (2 * NODE_RADIUS) ** 2:
                 return node
         return None
 
     def get_edge_at_pos(self, pos):
         """Returns the edge at the given position, or None if no edge is found."""
-        for edge in self.edges:
+        for edge in self.model.edges_near(pos, 0):
             if edge.u.pos == pos or edge.v.pos == pos:
                 return edge
         return None
@@ -678,7 +692,7 @@ class DirectedGraphVisualizer:
         clock = pygame.time.Clock()
         while True:
             self.draw()
-            if self.animating:
+            if self.animating and not self.paused:
                 self.animate()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -701,7 +715,7 @@ class DirectedGraphVisualizer:
                             node = self.get_node_at_pos(event.pos)
                             if self.current_mode == MODE_SET_START and node:
                                 self.start_node = node
-                                self.error_msg = f"Start node: {node.label}. Click 'Run' to start {self.active_algo}."
+                                self.error_msg = f"Start node: {node.name}. Click 'Run' to start {self.active_algo}."
                             elif self.current_mode == MODE_EDIT:
                                 if node:
                                     self.selected_node = node
@@ -710,17 +724,12 @@ class DirectedGraphVisualizer:
                                     self.drag_start = node
                                 else:
                                     # Add new node at click position
-                                    if any((node.pos[0] - event.pos[0]) ** 2 + (node.pos[1] - event.pos[1]) ** 2 < (2 * NODE_RADIUS) ** 2 for node in self.nodes):
+                                    if any((node.pos[0] - event.pos[0]) ** 2 + (node.pos[1] - event.pos[1]) ** 2 < (2 * NODE_RADIUS) ** 2 for node in self.model.nodes_near(event.pos, 2 * NODE_RADIUS)):
                                         self.error_msg = "Too close to another node. Move further away."
                                     else:
-                                        try:
-                                            label = next(self.node_labels)
-                                        except StopIteration:
-                                            self.error_msg = "No more node labels available."
-                                            continue
-                                        new_node = VisualNode(label, event.pos)
-                                        self.nodes.append(new_node)
-                                        self.graph.adj[label] = []
+                                        label = self.node_labels.allocate()
+                                        self.model.add_node(VisualNode(label, event.pos))
+                                        self.graph.add_vertex(label)
                     elif event.button == 3:  # Right click
                         edge = self.get_edge_at_pos(event.pos)
                         if edge:
@@ -756,6 +765,12 @@ class DirectedGraphVisualizer:
                     elif event.key == pygame.K_MINUS:
                         self.animation_delay = min(2000, self.animation_delay + 100)
                         self.error_msg = f"Animation speed: {self.animation_delay} ms"
+                    elif event.key == pygame.K_SPACE and self.animating:
+                        self.paused = not self.paused
+                    elif event.key == pygame.K_RIGHT and self.animating and self.paused:
+                        self.animate()
+                    elif event.key == pygame.K_LEFT:
+                        self.step_back()
                     elif event.key == pygame.K_h:
                         self.show_help = not self.show_help
                         continue
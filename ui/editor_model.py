@@ -0,0 +1,161 @@
+"""
+Indexed node/edge store shared by the graph editors
+
+``EditorModel`` keeps the editor's VisualNode/VisualEdge objects in drawing
+order (insertion-ordered dicts, so removal is O(1)) together with the lookups the editors need on every click and frame:
+label -> node, (u, v) -> edges (which also answers "is there a reverse
+edge?"), per-node incident edges, and uniform spatial hashes for point and
+segment hit-testing.  Node positions are fixed once placed, so the spatial
+entries are written when an element is added and dropped when it is removed.
+"""
+import math
+
+class SpatialHash:
+    """Uniform grid mapping ``cell``-sized squares to the items that touch them."""
+    def __init__(self, cell=64):
+        self.cell = cell
+        self.cells = {}
+        self.keys = {}
+
+    def _key(self, x, y):
+        return (int(x // self.cell), int(y // self.cell))
+
+    def _insert(self, item, keys):
+        self.keys[item] = keys
+        for key in keys:
+            self.cells.setdefault(key, {})[item] = None
+
+    def insert_point(self, item, pos):
+        self._insert(item, {self._key(*pos)})
+
+    def insert_segment(self, item, p, q):
+        # Sample every half cell, so any point of the segment is within a
+        # quarter cell of a sample whose cell is recorded
+        steps = max(1, math.ceil(2 * math.hypot(q[0] - p[0], q[1] - p[1]) / self.cell))
+        keys = {self._key(p[0] + (q[0] - p[0]) * i / steps, p[1] + (q[1] - p[1]) * i / steps) for i in range(steps + 1)}
+        self._insert(item, keys)
+
+    def remove(self, item):
+        for key in self.keys.pop(item, ()):
+            bucket = self.cells[key]
+            del bucket[item]
+            if not bucket:
+                del self.cells[key]
+
+    def query(self, pos, radius):
+        """Items in the cells overlapping the square of half-width ``radius`` around ``pos``."""
+        x0, y0 = self._key(pos[0] - radius, pos[1] - radius)
+        x1, y1 = self._key(pos[0] + radius, pos[1] + radius)
+        found = {}
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return list(found)
+
+    def clear(self):
+        self.cells.clear()
+        self.keys.clear()
+
+class EditorModel:
+    """Nodes and edges of a graph editor with O(1) label/pair lookups and spatial hit-testing."""
+    def __init__(self, cell=64):
+        # Insertion-ordered dicts used as ordered sets: drawing order with O(1) removal
+        self._nodes = {}
+        self._edges = {}
+        self.by_label = {}
+        self.by_pair = {}
+        self.incident = {}
+        self.node_grid = SpatialHash(cell)
+        self.edge_grid = SpatialHash(cell)
+
+    @property
+    def nodes(self):
+        """Nodes in drawing order (a live view)."""
+        return self._nodes.keys()
+
+    @property
+    def edges(self):
+        """Edges in drawing order (a live view)."""
+        return self._edges.keys()
+
+    def clear(self):
+        self._nodes.clear()
+        self._edges.clear()
+        self.by_label.clear()
+        self.by_pair.clear()
+        self.incident.clear()
+        self.node_grid.clear()
+        self.edge_grid.clear()
+
+    def add_node(self, node):
+        """Add ``node`` unless a node with its label is already present; return the stored node."""
+        existing = self.by_label.get(node.label)
+        if existing is not None:
+            return existing
+        self._nodes[node] = None
+        self.by_label[node.label] = node
+        self.incident[node.label] = {}
+        self.node_grid.insert_point(node, node.pos)
+        return node
+
+    def remove_node(self, node):
+        """Remove ``node`` and every edge touching it."""
+        if self.by_label.get(node.label) is not node:
+            return
+        for edge in list(self.incident[node.label]):
+            self.remove_edge(edge)
+        del self.by_label[node.label]
+        del self.incident[node.label]
+        del self._nodes[node]
+        self.node_grid.remove(node)
+
+    def add_edge(self, edge):
+        self._edges[edge] = None
+        u, v = edge.u.label, edge.v.label
+        self.by_pair.setdefault((u, v), []).append(edge)
+        self.incident.setdefault(u, {})[edge] = None
+        self.incident.setdefault(v, {})[edge] = None
+        self.edge_grid.insert_segment(edge, edge.u.pos, edge.v.pos)
+        return edge
+
+    def remove_edge(self, edge):
+        u, v = edge.u.label, edge.v.label
+        pair = self.by_pair.get((u, v))
+        if not pair or edge not in pair:
+            return
+        pair.remove(edge)
+        if not pair:
+            del self.by_pair[(u, v)]
+        self.incident[u].pop(edge, None)
+        self.incident[v].pop(edge, None)
+        del self._edges[edge]
+        self.edge_grid.remove(edge)
+
+    def node(self, label):
+        return self.by_label.get(label)
+
+    def edge(self, u, v):
+        """The first edge drawn from label ``u`` to label ``v``, or None."""
+        pair = self.by_pair.get((u, v))
+        return pair[0] if pair else None
+
+    def has_reverse(self, edge):
+        return (edge.v.label, edge.u.label) in self.by_pair
+
+    def between(self, u, v):
+        """Number of edges joining labels ``u`` and ``v`` in either direction."""
+        count = len(self.by_pair.get((u, v), ()))
+        if u != v:
+            count += len(self.by_pair.get((v, u), ()))
+        return count
+
+    def nodes_near(self, pos, radius):
+        """Candidate nodes whose centre may lie within ``radius`` of ``pos``."""
+        return self.node_grid.query(pos, radius)
+
+    def edges_near(self, pos, radius):
+        """Candidate edges whose segment may pass within ``radius`` of ``pos``."""
+        return self.edge_grid.query(pos, radius + self.edge_grid.cell / 2)
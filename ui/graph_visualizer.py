@@ -1,7 +1,7 @@
 import pygame
 import sys
-import string
 from core.graph.graph import Graph
+from core.graph.labels import LabelAllocator, alias, alias_id
 from core.graph.algorithms.topo_sort import topo_sort
 from core.graph.algorithms.bellman_ford import bellman_ford
 
@@ -20,6 +20,7 @@ FONT_SIZE = 28
 class VisualNode:
     def __init__(self, label, pos):
         self.label = label
+        self.name = alias(label)
         self.pos = pos
         self.selected = False
 
@@ -39,7 +40,7 @@ class GraphVisualizer:
         self.nodes = []
         self.edges = []
         self.graph = Graph(directed=True)
-        self.node_labels = iter(string.ascii_uppercase)
+        self.node_labels = LabelAllocator()
         self.selected_node = None
         self.dragging = False
         self.drag_start = None
@@ -57,7 +58,7 @@ class GraphVisualizer:
         self.nodes = []
         self.edges = []
         self.graph = Graph(directed=True)
-        self.node_labels = iter(string.ascii_uppercase)
+        self.node_labels.reset()
         self.selected_node = None
         self.selected_edge = None
         self.dragging = False
@@ -72,13 +73,9 @@ class GraphVisualizer:
         self.awaiting_bf_source = False
 
     def add_node(self, pos):
-        try:
-            label = next(self.node_labels)
-        except StopIteration:
-            self.error_msg = "Max 26 nodes (A-Z) supported."
-            return
+        label = self.node_labels.allocate()
         self.nodes.append(VisualNode(label, pos))
-        self.graph.adj[label] = []
+        self.graph.add_vertex(label)
 
     def get_node_at_pos(self, pos):
         for node in self.nodes:
@@ -111,17 +108,15 @@ class GraphVisualizer:
         if self.selected_node:
             # Remove edges connected to node
             self.edges = [e for e in self.edges if e.u != self.selected_node and e.v != self.selected_node]
-            if self.selected_node.label in self.graph.adj:
-                del self.graph.adj[self.selected_node.label]
-            for adj in self.graph.adj.values():
-                adj[:] = [pair for pair in adj if pair[0] != self.selected_node.label]
+            self.graph.remove_vertex(self.selected_node.label)
             self.nodes.remove(self.selected_node)
+            self.node_labels.release(self.selected_node.label)
             self.selected_node = None
         elif self.selected_edge:
             self.edges.remove(self.selected_edge)
             # Remove from graph
             u, v = self.selected_edge.u.label, self.selected_edge.v.label
-            self.graph.adj[u] = [pair for pair in self.graph.adj[u] if pair[0] != v]
+            self.graph.remove_edge(u, v)
             self.selected_edge = None
 
     def draw(self):
@@ -135,7 +130,7 @@ class GraphVisualizer:
             color = NODE_SELECTED_COLOR if node.selected else NODE_COLOR
             pygame.draw.circle(self.win, color, node.pos, NODE_RADIUS)
             pygame.draw.circle(self.win, (0,0,0), node.pos, NODE_RADIUS, 2)
-            label_surf = self.font.render(node.label, True, TEXT_COLOR)
+            label_surf = self.font.render(node.name, True, TEXT_COLOR)
             rect = label_surf.get_rect(center=node.pos)
             self.win.blit(label_surf, rect)
         # Draw dragging edge
@@ -232,7 +227,7 @@ class GraphVisualizer:
         self.animating = False
         self.draw()
         if not cycle:
-            self.error_msg = "TopoSort order: " + "  " + " ".join(order)
+            self.error_msg = "TopoSort order: " + "  " + " ".join(map(alias, order))
 
     def animate_bellman_ford(self, dist, negative_cycle):
         self.animating = True
@@ -254,7 +249,7 @@ class GraphVisualizer:
         self.animating = False
         self.draw()
         if not negative_cycle:
-            msg = "Shortest distances: " + ", ".join(f"{k}:{v if v!=float('inf') else '∞'}" for k,v in dist.items())
+            msg = "Shortest distances: " + ", ".join(f"{alias(k)}:{v if v!=float('inf') else '∞'}" for k,v in dist.items())
             self.error_msg = msg
 
     def run(self):
@@ -306,13 +301,13 @@ class GraphVisualizer:
                     elif event.key == pygame.K_b:
                         # Bellman-Ford
                         if not self.awaiting_bf_source:
-                            self.message = "Type source node label (A-Z) and press Enter:"
+                            self.message = "Type source node label (A, B, ..., AA, ...) and press Enter:"
                             self.awaiting_bf_source = True
                             self.bf_source = ''
                     elif self.awaiting_bf_source:
                         if event.key == pygame.K_RETURN:
-                            src = self.bf_source.upper()
-                            if src in [n.label for n in self.nodes]:
+                            src = alias_id(self.bf_source) if self.bf_source else None
+                            if src in self.graph.adj:
                                 dist = bellman_ford(self.graph, src)
                                 negative_cycle = (dist is None)
                                 if negative_cycle:
@@ -321,7 +316,7 @@ class GraphVisualizer:
                                 self.awaiting_bf_source = False
                                 self.message = "Click to add node | Drag to add edge | Del: delete | T: TopoSort | B: Bellman-Ford | R: Reset | Q: Quit"
                             else:
-                                self.error_msg = f"Node '{src}' does not exist."
+                                self.error_msg = f"Node '{self.bf_source}' does not exist."
                                 self.bf_source = ''
                         elif event.key == pygame.K_BACKSPACE:
                             self.bf_source = self.bf_source[:-1]
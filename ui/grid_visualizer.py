@@ -2,7 +2,7 @@
 Pygame Grid Visualizer for Pathfinding Algorithms (Improved UI & Robustness, Large Window)
 """
 import pygame
-from core.grid.grid import Grid, Cell
+from core.grid.array_grid import ArrayGrid as Grid
 from core.grid.maze_algorithms.bfs import bfs
 from core.grid.maze_algorithms.dfs import dfs
 from core.grid.maze_algorithms.astar import astar
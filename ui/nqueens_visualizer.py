@@ -1,5 +1,6 @@
 import pygame
 import sys
+from core.n_queens.solver import nqueens_solver
 
 WIDTH, HEIGHT = 1200, 800
 BOARD_TOP = 60
@@ -15,28 +16,6 @@ ERROR_COLOR = (255, 80, 80)
 
 FONT_SIZE = 32
 
-# --- N-Queens Backtracking Generator ---
-def nqueens_solver(N):
-    board = [-1] * N
-    def is_safe(row, col):
-        for r in range(row):
-            c = board[r]
-            if c == col or abs(row - r) == abs(col - c):
-                return False
-        return True
-    def solve(row):
-        if row == N:
-            yield ('solution', list(board))
-            return
-        for col in range(N):
-            if is_safe(row, col):
-                board[row] = col
-                yield ('place', row, col, list(board))
-                yield from solve(row+1)
-                board[row] = -1
-                yield ('remove', row, col, list(board))
-    return solve(0)
-
 # --- Drawing Functions ---
 def draw_board(win, N, board, highlight=None):
     # Make the board responsive to window dimensions
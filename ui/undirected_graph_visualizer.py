@@ -1,8 +1,10 @@
 import pygame
 import sys
-import string
 import math
 from core.graph.graph import Graph
+from core.graph.labels import LabelAllocator, alias, alias_id, aliases
+from core.graph.trace_cache import StepStream, trace_cache
+from .editor_model import EditorModel
 # Import algorithms (to be implemented if not present)
 from core.graph.algorithms.bfs import bfs
 from core.graph.algorithms.dfs import dfs
@@ -29,6 +31,7 @@ class VisualNode:
     """A visual node in the graph, with label and position."""
     def __init__(self, label, pos):
         self.label = label
+        self.name = alias(label)
         self.pos = pos
         self.selected = False
         # For coloring/animation
@@ -74,10 +77,9 @@ class UndirectedGraphVisualizer:
         self.win = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
         pygame.display.set_caption("Undirected Graph Visualizer")
         self.font = pygame.font.SysFont(None, FONT_SIZE)
-        self.nodes = []
-        self.edges = []
+        self.model = EditorModel()
         self.graph = Graph(directed=False)
-        self.node_labels = iter(string.ascii_uppercase)
+        self.node_labels = LabelAllocator()
         self.selected_node = None
         self.start_node = None  # For BFS/DFS
         self.dragging = False
@@ -93,12 +95,21 @@ class UndirectedGraphVisualizer:
         self.current_mode = MODE_EDIT
         self.active_algo = None
         self.animating = False
-        self.animation_steps = []
-        self.animation_index = 0
+        self.animation_steps = StepStream(())
+        self.visit_order = []
+        self.paused = False
         self.animation_delay = 600  # ms
         self.show_help = False
         self.setup_buttons()
 
+    @property
+    def nodes(self):
+        return self.model.nodes
+
+    @property
+    def edges(self):
+        return self.model.edges
+
     def setup_buttons(self):
         """Set up all UI buttons for algorithms, modes, and actions."""
         # Place algorithm buttons at the top, more spacious and centered
@@ -147,8 +158,8 @@ class UndirectedGraphVisualizer:
         self.error_msg = f"Selected: {algo}. Click 'Load Example' for a demo, or build your own graph."
         self.start_node = None
         self.animating = False
-        self.animation_steps = []
-        self.animation_index = 0
+        self.animation_steps = StepStream(())
+        self.paused = False
         # Rebuild buttons to show/hide Set Start Node button based on selected algorithm
         self.setup_buttons()
         # Do NOT clear the graph here! Only update UI state.
@@ -157,18 +168,9 @@ class UndirectedGraphVisualizer:
     def load_example_graph(self):
         """Load a demo/example graph for the selected algorithm."""
         # Always clear the graph before loading a new example
-        self.nodes.clear()
-        self.edges.clear()
+        self.model.clear()
         self.graph = Graph(directed=False)
-        self.node_labels = iter(string.ascii_uppercase)
-        used_labels = set()
-        orig_add_node_at = self._add_node_at
-        def add_and_track(pos):
-            node = orig_add_node_at(pos)
-            if node:
-                used_labels.add(node.label)
-            return node
-        self._add_node_at = add_and_track
+        self.node_labels.reset()
         self.start_node = None
         if self.active_algo == "BFS":
             self._example_bfs_graph()
@@ -184,10 +186,6 @@ class UndirectedGraphVisualizer:
             self._example_bridges()
         elif self.active_algo == "Bipartite Check":
             self._example_bipartite()
-        # Restore the original method BEFORE updating node_labels
-        self._add_node_at = orig_add_node_at
-        all_labels = [c for c in string.ascii_uppercase if c not in used_labels]
-        self.node_labels = iter(all_labels)
         self.result_msg = ''
         self.error_msg = f"Loaded example for {self.active_algo}."
         self.set_mode(MODE_EDIT)
@@ -279,28 +277,23 @@ class UndirectedGraphVisualizer:
 
     def _add_node_at(self, pos):
         """Add a node at the given position and return it."""
-        try:
-            label = next(self.node_labels)
-        except StopIteration:
-            return
-        node = VisualNode(label, pos)
-        self.nodes.append(node)
-        self.graph.adj[label] = []
+        label = self.node_labels.allocate()
+        node = self.model.add_node(VisualNode(label, pos))
+        self.graph.add_vertex(label)
         return node
     def _add_edge_by_label(self, l1, l2):
         """Add an edge between nodes with labels l1 and l2."""
-        n1 = next((n for n in self.nodes if n.label == l1), None)
-        n2 = next((n for n in self.nodes if n.label == l2), None)
+        n1 = self.model.node(alias_id(l1))
+        n2 = self.model.node(alias_id(l2))
         if n1 and n2:
-            self.edges.append(VisualEdge(n1, n2))
+            self.model.add_edge(VisualEdge(n1, n2))
             self.graph.add_edge(n1.label, n2.label)
 
     def reset(self):
         """Reset the graph and UI to the initial state."""
-        self.nodes = []
-        self.edges = []
+        self.model.clear()
         self.graph = Graph(directed=False)
-        self.node_labels = iter(string.ascii_uppercase)
+        self.node_labels.reset()
         self.selected_node = None
         self.selected_edge = None
         self.dragging = False
@@ -311,14 +304,14 @@ class UndirectedGraphVisualizer:
         self.active_algo = None
         self.start_node = None
         self.animating = False
-        self.animation_steps = []
-        self.animation_index = 0
+        self.animation_steps = StepStream(())
+        self.paused = False
         self.set_mode(MODE_EDIT)
 
     def add_node(self, pos):
         """Add a node at the given position, preventing overlap."""
         # Prevent overlap: do not add if too close to existing node
-        for node in self.nodes:
+        for node in self.model.nodes_near(pos, 2 * NODE_RADIUS):
             if (node.pos[0] - pos[0]) ** 2 + (node.pos[1] - pos[1]) ** 2 < (2 * NODE_RADIUS) ** 2:
                 self.error_msg = "Too close to another node. Move further away."
                 return None
@@ -327,7 +320,7 @@ class UndirectedGraphVisualizer:
 
     def get_node_at_pos(self, pos):
         """Return the node at the given position, if any."""
-        for node in self.nodes:
+        for node in self.model.nodes_near(pos, NODE_RADIUS):
             if (node.pos[0] - pos[0]) ** 2 + (node.pos[1] - pos[1]) ** 2 <= NODE_RADIUS ** 2:
                 return node
         return None
@@ -337,16 +330,24 @@ class UndirectedGraphVisualizer:
         if u == v:
             self.error_msg = "No self-loops allowed."
             return
-        for edge in self.edges:
-            if (edge.u == u and edge.v == v) or (edge.u == v and edge.v == u):
-                self.error_msg = "Edge already exists."
-                return
-        self.edges.append(VisualEdge(u, v))
+        if self.model.between(u.label, v.label):
+            self.error_msg = "Edge already exists."
+            return
+        self.model.add_edge(VisualEdge(u, v))
         self.graph.add_edge(u.label, v.label)
 
+    @staticmethod
+    def _point_line_distance(p, a, b):
+        """Distance from point p to the segment a-b."""
+        dx, dy = b[0] - a[0], b[1] - a[1]
+        length_sq = dx * dx + dy * dy
+        t = 0 if length_sq == 0 else max(0, min(1, ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / length_sq))
+        return math.hypot(p[0] - a[0] - t * dx, p[1] - a[1] - t * dy)
+
     def get_edge_at_pos(self, pos):
         """Return the edge at the given position, if any."""
-        for edge in self.edges:
+        # Parallel edges bulge up to 30px off the straight line
+        for edge in self.model.edges_near(pos, 30 + NODE_RADIUS):
             u, v = edge.u, edge.v
             x1, y1 = u.pos
             x2, y2 = v.pos
@@ -356,8 +357,7 @@ class UndirectedGraphVisualizer:
             if dist_to_line <= NODE_RADIUS // 2:
                 return edge
             # For multiple edges, check near the curve
-            key = tuple(sorted([u.label, v.label]))
-            if sum(1 for e in self.edges if tuple(sorted([e.u.label, e.v.label])) == key) > 1:
+            if self.model.between(u.label, v.label) > 1:
                 dx, dy = y2 - y1, x1 - x2
                 norm = math.hypot(dx, dy)
                 if norm == 0:
@@ -371,20 +371,16 @@ class UndirectedGraphVisualizer:
     def delete_selected(self):
         """Delete the currently selected node or edge."""
         if self.selected_node:
-            self.edges = [e for e in self.edges if e.u != self.selected_node and e.v != self.selected_node]
-            if self.selected_node.label in self.graph.adj:
-                del self.graph.adj[self.selected_node.label]
-            for adj in self.graph.adj.values():
-                adj[:] = [pair for pair in adj if pair[0] != self.selected_node.label]
-            self.nodes.remove(self.selected_node)
+            self.model.remove_node(self.selected_node)
+            self.graph.remove_vertex(self.selected_node.label)
+            self.node_labels.release(self.selected_node.label)
             self.selected_node = None
-            if self.start_node and self.start_node not in self.nodes:
+            if self.start_node and self.model.node(self.start_node.label) is not self.start_node:
                 self.start_node = None
         elif self.selected_edge:
-            self.edges.remove(self.selected_edge)
+            self.model.remove_edge(self.selected_edge)
             u, v = self.selected_edge.u.label, self.selected_edge.v.label
-            self.graph.adj[u] = [pair for pair in self.graph.adj[u] if pair[0] != v]
-            self.graph.adj[v] = [pair for pair in self.graph.adj[v] if pair[0] != u]
+            self.graph.remove_edge(u, v)
             self.selected_edge = None
 
     def draw(self):
@@ -436,7 +432,7 @@ class UndirectedGraphVisualizer:
                 color = NODE_COLOR
             pygame.draw.circle(self.win, color, node.pos, NODE_RADIUS)
             pygame.draw.circle(self.win, (0,0,0), node.pos, NODE_RADIUS, 2)
-            label_surf = self.font.render(node.label, True, TEXT_COLOR)
+            label_surf = self.font.render(node.name, True, TEXT_COLOR)
             rect = label_surf.get_rect(center=node.pos)
             self.win.blit(label_surf, rect)
         # Draw dragging edge
@@ -478,6 +474,7 @@ class UndirectedGraphVisualizer:
                 "E: Edit mode",
                 "S: Set start node (for BFS/DFS)",
                 "+/-: Adjust animation speed",
+                "Space: Pause/resume, Left/Right: Step back/forward while paused",
                 "H: Toggle this help overlay",
                 "",
                 "ALGORITHMS:",
@@ -512,8 +509,9 @@ class UndirectedGraphVisualizer:
             return
         self.result_msg = ''
         self.error_msg = ''
-        self.animation_steps = []
-        self.animation_index = 0
+        self.animation_steps = StepStream(())
+        self.visit_order = []
+        self.paused = False
         self.animating = False
         # Reset all node/edge highlights
         for node in self.nodes:
@@ -530,35 +528,37 @@ class UndirectedGraphVisualizer:
                 self.error_msg = "Select a start node (click a node) before running."
                 return
             self.animating = True
-            self.animation_steps = list(bfs(self.graph, self.start_node.label)) if self.active_algo == "BFS" else list(dfs(self.graph, self.start_node.label))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(bfs, self.graph, self.start_node.label) if self.active_algo == "BFS" else trace_cache.stream(dfs, self.graph, self.start_node.label)
         elif self.active_algo == "Connected Components":
             self.animating = True
-            self.animation_steps = list(connected_components(self.graph, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(connected_components, self.graph, visualize=True)
         elif self.active_algo == "Cycle Detection":
             self.animating = True
-            self.animation_steps = list(has_cycle_undirected(self.graph, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(has_cycle_undirected, self.graph, visualize=True)
         elif self.active_algo == "Articulation Points":
             self.animating = True
-            self.animation_steps = list(articulation_points_and_bridges(self.graph, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(articulation_points_and_bridges, self.graph, visualize=True)
         elif self.active_algo == "Bridges":
             self.animating = True
-            self.animation_steps = list(articulation_points_and_bridges(self.graph, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(articulation_points_and_bridges, self.graph, visualize=True)
         elif self.active_algo == "Bipartite Check":
             self.animating = True
-            self.animation_steps = list(is_bipartite(self.graph, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(is_bipartite, self.graph, visualize=True)
         else:
             self.error_msg = f"{self.active_algo} not implemented yet."
 
+    def step_back(self):
+        """Pause and redraw the previous step from the stream's bounded history."""
+        # Un-read the step on screen and the one before it, then replay the earlier one
+        if self.animation_steps.back(2):
+            self.animating = True
+            self.paused = True
+            self.animate()
+
     def animate(self):
         """Animate the algorithm step-by-step, updating the UI."""
-        if self.animating and self.animation_index < len(self.animation_steps):
-            step = self.animation_steps[self.animation_index]
+        if self.animating and self.animation_steps.has_next():
+            step = self.animation_steps.next()
             # Reset highlights for each step
             for node in self.nodes:
                 node.selected = False
@@ -573,7 +573,10 @@ class UndirectedGraphVisualizer:
                 # step is node label
                 for node in self.nodes:
                     node.selected = (node.label == step)
-                msg = f"{self.active_algo} visiting: {step}"
+                # Indexed by stream position, so a replay after step_back overwrites instead of appending
+                del self.visit_order[self.animation_steps.position - 1:]
+                self.visit_order.append(step)
+                msg = f"{self.active_algo} visiting: {alias(step)}"
             elif self.active_algo == "Connected Components":
                 # step: (type, ...)
                 if step[0] == "new_component":
@@ -586,7 +589,7 @@ class UndirectedGraphVisualizer:
                         if node.label == label:
                             node.selected = True
                             node.color_id = color_id
-                    msg = f"Component {color_id+1}: visiting {label}"
+                    msg = f"Component {color_id+1}: visiting {alias(label)}"
                 elif step[0] == "done":
                     comps, color_map = step[1], step[2]
                     for node in self.nodes:
@@ -600,18 +603,18 @@ class UndirectedGraphVisualizer:
                     for node in self.nodes:
                         if node.label in path:
                             node.selected = True
-                    msg = f"DFS path: {' → '.join(path)}"
+                    msg = f"DFS path: {' → '.join(aliases(path))}"
                 elif step[0] == "cycle":
                     cycle_path = step[1]
                     for node in self.nodes:
                         if node.label in cycle_path:
                             node.selected = True
-                    msg = f"Cycle found: {' → '.join(cycle_path)}"
+                    msg = f"Cycle found: {' → '.join(aliases(cycle_path))}"
                 elif step[0] == "done":
                     has_cycle = step[1]
                     cycle_path = step[2]
                     if has_cycle:
-                        msg = f"Cycle Detected! Path: {' → '.join(cycle_path)}"
+                        msg = f"Cycle Detected! Path: {' → '.join(aliases(cycle_path))}"
                     else:
                         msg = "No Cycles."
             elif self.active_algo in ("Articulation Points", "Bridges"):
@@ -620,22 +623,22 @@ class UndirectedGraphVisualizer:
                     for node in self.nodes:
                         if node.label == label:
                             node.selected = True
-                    msg = f"DFS visiting: {label}"
+                    msg = f"DFS visiting: {alias(label)}"
                 elif step[0] == "ap":
                     label = step[1]
                     for node in self.nodes:
                         if node.label == label:
                             node.is_ap = True
-                    msg = f"Articulation Point: {label}"
+                    msg = f"Articulation Point: {alias(label)}"
                 elif step[0] == "bridge":
                     u, v = step[1]
                     for edge in self.edges:
                         if (edge.u.label, edge.v.label) == (u, v) or (edge.u.label, edge.v.label) == (v, u):
                             edge.is_bridge = True
-                    msg = f"Bridge: {u}-{v}"
+                    msg = f"Bridge: {alias(u)}-{alias(v)}"
                 elif step[0] == "done":
                     aps, bridges = step[1], step[2]
-                    msg = f"Articulation Points: {sorted(aps)} | Bridges: {sorted(bridges)}"
+                    msg = f"Articulation Points: {aliases(sorted(aps))} | Bridges: {[(alias(u), alias(v)) for u, v in sorted(bridges)]}"
             elif self.active_algo == "Bipartite Check":
                 if step[0] == "color":
                     label = step[1]
@@ -643,13 +646,13 @@ class UndirectedGraphVisualizer:
                     for node in self.nodes:
                         if node.label == label:
                             node.temp_color = BIPARTITE_COLORS[color % len(BIPARTITE_COLORS)]
-                    msg = f"Coloring {label} as set {color+1}"
+                    msg = f"Coloring {alias(label)} as set {color+1}"
                 elif step[0] == "conflict":
                     v, w = step[1], step[2]
                     for node in self.nodes:
                         if node.label in (v, w):
                             node.is_conflict = True
-                    msg = f"Conflict: {v} and {w} have same color!"
+                    msg = f"Conflict: {alias(v)} and {alias(w)} have same color!"
                 elif step[0] == "done":
                     is_bip, color_map, conflict = step[1], step[2], step[3]
                     for node in self.nodes:
@@ -658,30 +661,29 @@ class UndirectedGraphVisualizer:
                     if is_bip:
                         msg = "Graph is Bipartite!"
                     else:
-                        msg = f"Not Bipartite. Conflict: {conflict[0]}-{conflict[1]}"
+                        msg = f"Not Bipartite. Conflict: {alias(conflict[0])}-{alias(conflict[1])}"
             self.result_msg = msg
             self.draw()
             pygame.time.delay(self.animation_delay)
-            self.animation_index += 1
         else:
             self.animating = False
             # Final result message for each algo
             if self.active_algo == "Connected Components" and self.animation_steps:
-                comps = self.animation_steps[-1][1] if self.animation_steps[-1][0] == "done" else []
-                self.result_msg = f"Connected Components: {['{' + ', '.join(comp) + '}' for comp in comps]}"
+                comps = self.animation_steps.current[1] if self.animation_steps.current[0] == "done" else []
+                self.result_msg = f"Connected Components: {['{' + ', '.join(aliases(comp)) + '}' for comp in comps]}"
             elif self.active_algo == "Cycle Detection" and self.animation_steps:
-                has_cycle = self.animation_steps[-1][1] if self.animation_steps[-1][0] == "done" else False
-                cycle_path = self.animation_steps[-1][2] if self.animation_steps[-1][0] == "done" else []
+                has_cycle = self.animation_steps.current[1] if self.animation_steps.current[0] == "done" else False
+                cycle_path = self.animation_steps.current[2] if self.animation_steps.current[0] == "done" else []
                 self.result_msg = "Cycle Detected!" if has_cycle else "No Cycles."
             elif self.active_algo in ("Articulation Points", "Bridges") and self.animation_steps:
-                aps = self.animation_steps[-1][1] if self.animation_steps[-1][0] == "done" else []
-                bridges = self.animation_steps[-1][2] if self.animation_steps[-1][0] == "done" else []
-                self.result_msg = f"Articulation Points: {sorted(aps)} | Bridges: {sorted(bridges)}"
+                aps = self.animation_steps.current[1] if self.animation_steps.current[0] == "done" else []
+                bridges = self.animation_steps.current[2] if self.animation_steps.current[0] == "done" else []
+                self.result_msg = f"Articulation Points: {aliases(sorted(aps))} | Bridges: {[(alias(u), alias(v)) for u, v in sorted(bridges)]}"
             elif self.active_algo == "Bipartite Check" and self.animation_steps:
-                is_bip = self.animation_steps[-1][1] if self.animation_steps[-1][0] == "done" else True
+                is_bip = self.animation_steps.current[1] if self.animation_steps.current[0] == "done" else True
                 self.result_msg = "Bipartite" if is_bip else "Not Bipartite"
             elif self.active_algo in ("BFS", "DFS") and self.animation_steps:
-                order = [str(x) for x in self.animation_steps]
+                order = aliases(self.visit_order)
                 self.result_msg = f"{self.active_algo} order: {' -> '.join(order)}"
             for node in self.nodes:
                 node.selected = False
@@ -695,7 +697,7 @@ class UndirectedGraphVisualizer:
         clock = pygame.time.Clock()
         while True:
             self.draw()
-            if self.animating:
+            if self.animating and not self.paused:
                 self.animate()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -718,7 +720,7 @@ class UndirectedGraphVisualizer:
                         node = self.get_node_at_pos(event.pos)
                         if self.current_mode == MODE_SET_START and node:
                             self.start_node = node
-                            self.error_msg = f"Start node: {node.label}. Click 'Run' to start {self.active_algo}."
+                            self.error_msg = f"Start node: {node.name}. Click 'Run' to start {self.active_algo}."
                         elif self.current_mode == MODE_EDIT:
                             if node:
                                 self.selected_node = node
@@ -757,6 +759,12 @@ class UndirectedGraphVisualizer:
                     elif event.key == pygame.K_MINUS:
                         self.animation_delay = min(2000, self.animation_delay + 100)
                         self.error_msg = f"Animation speed: {self.animation_delay} ms"
+                    elif event.key == pygame.K_SPACE and self.animating:
+                        self.paused = not self.paused
+                    elif event.key == pygame.K_RIGHT and self.animating and self.paused:
+                        self.animate()
+                    elif event.key == pygame.K_LEFT:
+                        self.step_back()
                     elif event.key == pygame.K_h:
                         self.show_help = not self.show_help
                         continue
@@ -1,13 +1,16 @@
 import pygame
 import sys
-import string
 import math
 from core.graph.graph import Graph
+from core.graph.labels import LabelAllocator, alias, alias_id
+from core.graph.trace_cache import StepStream, trace_cache
+from .editor_model import EditorModel
 from .constants import *
 from core.graph.algorithms.dijkstra import dijkstra
+from core.graph.algorithms.bidirectional_dijkstra import bidirectional_dijkstra
 from core.graph.algorithms.bellman_ford import bellman_ford
 from core.graph.algorithms.floyd_warshall import floyd_warshall
-from core.graph.algorithms.mst import prim, kruskal
+from core.graph.algorithms.mst import prim, kruskal, boruvka
 from core.graph.algorithms.astar import astar
 from core.graph.algorithms.johnson import johnson
 from core.graph.algorithms.spfa import spfa
@@ -22,9 +25,40 @@ ALGO_LIST = [
     ("A*", "A* Search"),
     ("Johnson", "Johnson's All-Pairs Shortest Path"),
     ("SPFA", "Shortest Path Faster Algorithm"),
-    ("TopoSort+Relax", "DAG Shortest Path")
+    ("TopoSort+Relax", "DAG Shortest Path"),
+    ("Bidir Dijkstra", "Bidirectional Dijkstra"),
+    ("Boruvka", "Borůvka's MST (Undirected)")
 ]
 
+# Fallback result message for an algorithm whose last step produced none
+_DONE_MESSAGES = {
+    "Dijkstra": "Dijkstra complete.",
+    "Bidir Dijkstra": "Bidirectional Dijkstra complete.",
+    "Bellman-Ford": "Bellman-Ford complete.",
+    "SPFA": "SPFA complete.",
+    "A*": "A* complete.",
+    "Prim": "Prim's MST complete.",
+    "Kruskal": "Kruskal's MST complete.",
+    "Boruvka": "Borůvka's MST complete.",
+    "Floyd-Warshall": "Floyd-Warshall complete.",
+    "Johnson": "Johnson's algorithm complete.",
+    "TopoSort+Relax": "TopoSort+Relax complete.",
+}
+
+# (algorithm, step kind) -> handler(visualizer, step) returning the status message
+_STEP_HANDLERS = {}
+
+def _on(algos, *kinds):
+    """Register the decorated method as the handler for ``kinds`` steps of each algorithm in ``algos``."""
+    if isinstance(algos, str):
+        algos = (algos,)
+    def register(handler):
+        for algo in algos:
+            for kind in kinds:
+                _STEP_HANDLERS[(algo, kind)] = handler
+        return handler
+    return register
+
 MODE_EDIT = 'Edit Graph'
 MODE_SET_START = 'Set Start Node'
 MODE_SET_TARGET = 'Set Target Node'
@@ -32,6 +66,7 @@ MODE_SET_TARGET = 'Set Target Node'
 class VisualNode:
     def __init__(self, label, pos):
         self.label = label
+        self.name = alias(label)
         self.pos = pos
         self.selected = False
 
@@ -65,10 +100,9 @@ class WeightedGraphVisualizer:
         self.win = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
         pygame.display.set_caption("Weighted Graph Visualizer")
         self.font = pygame.font.SysFont(None, FONT_SIZE)
-        self.nodes = []
-        self.edges = []
+        self.model = EditorModel()
         self.graph = Graph(directed=False)
-        self.node_labels = iter(string.ascii_uppercase)
+        self.node_labels = LabelAllocator()
         self.selected_node = None
         self.start_node = None
         self.dragging = False
@@ -85,13 +119,23 @@ class WeightedGraphVisualizer:
         self.current_mode = MODE_EDIT
         self.active_algo = None
         self.animating = False
-        self.animation_steps = []
-        self.animation_index = 0
+        self.animation_steps = StepStream(())
+        self.mst_rounds = []
+        self.paused = False
+        self.highlighted = []
         self.animation_delay = 600  # ms
         self.show_help = False
         self.target_node = None # Added for A*
         self.setup_buttons()
 
+    @property
+    def nodes(self):
+        return self.model.nodes
+
+    @property
+    def edges(self):
+        return self.model.edges
+
     def setup_buttons(self):
         w, h = 150, 36
         gap = 30
@@ -117,12 +161,12 @@ class WeightedGraphVisualizer:
         ]
         
         # Add Set Start Node button only for algorithms that require it
-        start_node_algorithms = ["Dijkstra", "Bellman-Ford", "A*", "SPFA", "TopoSort+Relax"]
+        start_node_algorithms = ["Dijkstra", "Bellman-Ford", "A*", "SPFA", "TopoSort+Relax", "Bidir Dijkstra"]
         if self.active_algo in start_node_algorithms:
             self.mode_buttons.append(Button((mb_x + mb_w + 16, mb_y, mb_w, mb_h), "Set Start Node", lambda: self.set_mode(MODE_SET_START)))
         
-        # Add Set Target Node button only for A*
-        if self.active_algo == "A*":
+        # Add Set Target Node button only for point-to-point algorithms
+        if self.active_algo in ("A*", "Bidir Dijkstra"):
             self.mode_buttons.append(Button((mb_x, mb_y + 2*mb_h + 16, mb_w, mb_h), "Set Target Node", lambda: self.set_mode(MODE_SET_TARGET)))
         
         self.mode_buttons.append(Button((mb_x, mb_y + mb_h + 16, mb_w, mb_h), "Toggle Directed", self.toggle_directed))
@@ -159,8 +203,7 @@ class WeightedGraphVisualizer:
             mx, my = (u.pos[0] + v.pos[0]) // 2, (u.pos[1] + v.pos[1]) // 2
             offset_x, offset_y = 0, 0
             # Check for reverse edge
-            has_reverse = any(e.u == v and e.v == u for e in self.edges)
-            if has_reverse:
+            if self.model.has_reverse(edge):
                 # Compute perpendicular offset
                 dx, dy = v.pos[0] - u.pos[0], v.pos[1] - u.pos[1]
                 length = math.hypot(dx, dy)
@@ -184,13 +227,13 @@ class WeightedGraphVisualizer:
         for node in self.nodes:
             if node.selected:
                 color = NODE_SELECTED_COLOR
-            elif self.active_algo == "A*" and self.target_node and node == self.target_node:
+            elif self.active_algo in ("A*", "Bidir Dijkstra") and self.target_node and node == self.target_node:
                 color = (255, 80, 80)  # Red for target
             else:
                 color = NODE_COLOR
             pygame.draw.circle(self.win, color, node.pos, NODE_RADIUS)
             pygame.draw.circle(self.win, (0,0,0), node.pos, NODE_RADIUS, 2)
-            label_surf = self.font.render(node.label, True, TEXT_COLOR)
+            label_surf = self.font.render(node.name, True, TEXT_COLOR)
             rect = label_surf.get_rect(center=node.pos)
             self.win.blit(label_surf, rect)
         # Draw dragging edge
@@ -233,13 +276,14 @@ class WeightedGraphVisualizer:
                 "E: Edit mode",
                 "S: Set start node (for SSSP)",
                 "+/-: Adjust animation speed",
+                "Space: Pause/resume, Left/Right: Step back/forward while paused",
                 "H: Toggle this help overlay",
                 "",
                 "ALGORITHMS:",
                 "Dijkstra: Shortest path (non-negative weights)",
                 "Bellman-Ford: Shortest path (negative weights)",
                 "Floyd-Warshall: All-pairs shortest path",
-                "Prim/Kruskal: MST (undirected)",
+                "Prim/Kruskal/Boruvka: MST (undirected)",
                 "A*: Heuristic shortest path",
                 "Johnson: All-pairs shortest path (sparse)",
                 "SPFA: Optimized Bellman-Ford",
@@ -281,13 +325,13 @@ class WeightedGraphVisualizer:
         self.win.blit(surf, rect)
 
     def get_node_at_pos(self, pos):
-        for node in self.nodes:
+        for node in self.model.nodes_near(pos, NODE_RADIUS):
             if (node.pos[0] - pos[0]) ** 2 + (node.pos[1] - pos[1]) ** 2 <= NODE_RADIUS ** 2:
                 return node
         return None
 
     def get_edge_at_pos(self, pos):
-        for edge in self.edges:
+        for edge in self.model.edges_near(pos, NODE_RADIUS // 2):
             ux, uy = edge.u.pos
             vx, vy = edge.v.pos
             mx, my = (ux + vx) / 2, (uy + vy) / 2
@@ -296,18 +340,13 @@ class WeightedGraphVisualizer:
         return None
 
     def add_node(self, pos):
-        for node in self.nodes:
+        for node in self.model.nodes_near(pos, 2 * NODE_RADIUS):
             if (node.pos[0] - pos[0]) ** 2 + (node.pos[1] - pos[1]) ** 2 < (2 * NODE_RADIUS) ** 2:
                 self.error_msg = "Too close to another node. Move further away."
                 return None
-        try:
-            label = next(self.node_labels)
-        except StopIteration:
-            self.error_msg = "No more node labels available."
-            return None
-        node = VisualNode(label, pos)
-        self.nodes.append(node)
-        self.graph.adj[label] = []
+        label = self.node_labels.allocate()
+        node = self.model.add_node(VisualNode(label, pos))
+        self.graph.add_vertex(label)
         return node
 
     def add_edge(self, u, v, weight=1):
@@ -317,43 +356,34 @@ class WeightedGraphVisualizer:
         if u_label == v_label:
             self.error_msg = "No self-loops allowed."
             return
-        for edge in self.edges:
-            if (edge.u.label == u_label and edge.v.label == v_label) or (not self.directed and edge.u.label == v_label and edge.v.label == u_label):
-                self.error_msg = "Edge already exists."
-                return
+        if self.model.edge(u_label, v_label) or (not self.directed and self.model.edge(v_label, u_label)):
+            self.error_msg = "Edge already exists."
+            return
         # Find VisualNode objects for u and v
-        u_node = next((n for n in self.nodes if n.label == u_label), None)
-        v_node = next((n for n in self.nodes if n.label == v_label), None)
+        u_node = self.model.node(u_label)
+        v_node = self.model.node(v_label)
         if not u_node or not v_node:
             self.error_msg = "Invalid node(s) for edge."
             return
-        self.edges.append(VisualEdge(u_node, v_node, weight))
+        self.model.add_edge(VisualEdge(u_node, v_node, weight))
         self.graph.add_edge(u_label, v_label, weight)
-        if not self.directed:
-            self.graph.add_edge(v_label, u_label, weight)
 
     def delete_selected(self):
         if self.selected_node:
-            self.edges = [e for e in self.edges if e.u != self.selected_node and e.v != self.selected_node]
-            if self.selected_node.label in self.graph.adj:
-                del self.graph.adj[self.selected_node.label]
-            for adj in self.graph.adj.values():
-                adj[:] = [pair for pair in adj if pair[0] != self.selected_node.label]
-            self.nodes.remove(self.selected_node)
+            self.model.remove_node(self.selected_node)
+            self.graph.remove_vertex(self.selected_node.label)
+            self.node_labels.release(self.selected_node.label)
             self.selected_node = None
         elif self.selected_edge:
-            self.edges.remove(self.selected_edge)
+            self.model.remove_edge(self.selected_edge)
             u, v = self.selected_edge.u.label, self.selected_edge.v.label
-            self.graph.adj[u] = [pair for pair in self.graph.adj[u] if pair[0] != v]
-            if not self.directed:
-                self.graph.adj[v] = [pair for pair in self.graph.adj[v] if pair[0] != u]
+            self.graph.remove_edge(u, v)
             self.selected_edge = None
 
     def reset(self):
-        self.nodes = []
-        self.edges = []
+        self.model.clear()
         self.graph = Graph(directed=self.directed)
-        self.node_labels = iter(string.ascii_uppercase)
+        self.node_labels.reset()
         self.selected_node = None
         self.selected_edge = None
         self.dragging = False
@@ -364,8 +394,8 @@ class WeightedGraphVisualizer:
         self.start_node = None
         self.target_node = None # Reset target node
         self.animating = False
-        self.animation_steps = []
-        self.animation_index = 0
+        self.animation_steps = StepStream(())
+        self.paused = False
         self.set_mode(MODE_EDIT)
 
     def set_mode(self, mode):
@@ -384,8 +414,8 @@ class WeightedGraphVisualizer:
         self.start_node = None
         self.target_node = None # Reset target node
         self.animating = False
-        self.animation_steps = []
-        self.animation_index = 0
+        self.animation_steps = StepStream(())
+        self.paused = False
         # Force directed mode for A* but don't recreate graph
         if algo == "A*":
             self.directed = True
@@ -445,21 +475,20 @@ class WeightedGraphVisualizer:
         return node
 
     def _add_edge_by_label(self, l1, l2, weight=1):
-        u = next((n for n in self.nodes if n.label == l1), None)
-        v = next((n for n in self.nodes if n.label == l2), None)
+        u = self.model.node(alias_id(l1))
+        v = self.model.node(alias_id(l2))
         if u and v:
             self.add_edge(u, v, weight)
 
     def load_example_graph(self):
         # Set directed/undirected mode as appropriate for each algorithm BEFORE reset
-        if self.active_algo in ("Prim", "Kruskal"):
+        if self.active_algo in ("Prim", "Kruskal", "Boruvka"):
             self.directed = False
             self.graph = Graph(directed=False)
-        elif self.active_algo in ("Dijkstra", "Bellman-Ford", "Floyd-Warshall", "A*", "Johnson", "SPFA", "TopoSort+Relax"):
+        elif self.active_algo in ("Dijkstra", "Bellman-Ford", "Floyd-Warshall", "A*", "Johnson", "SPFA", "TopoSort+Relax", "Bidir Dijkstra"):
             self.directed = True if self.active_algo not in ("Prim", "Kruskal") else False
             self.graph = Graph(directed=self.directed)
         self.reset()  # This clears nodes/edges and sets up the graph
-        self.node_labels = iter(string.ascii_uppercase)
         self.selected_node = None
         self.selected_edge = None
         self.start_node = None
@@ -530,7 +559,7 @@ class WeightedGraphVisualizer:
             self._add_edge_by_label('D', 'E', 4)
             self._add_edge_by_label('E', 'F', 1)
             self.message = "Example loaded. Click 'Run' to see Prim's MST."
-        elif self.active_algo == "Kruskal":
+        elif self.active_algo in ("Kruskal", "Boruvka"):
             a = self.add_node((200, 200))
             b = self.add_node((400, 200))
             c = self.add_node((600, 200))
@@ -545,7 +574,7 @@ class WeightedGraphVisualizer:
             self._add_edge_by_label('C', 'F', 2)
             self._add_edge_by_label('D', 'E', 2)
             self._add_edge_by_label('E', 'F', 2)
-            self.message = "Example loaded. Click 'Run' to see Kruskal's MST."
+            self.message = f"Example loaded. Click 'Run' to see {self.active_algo}'s MST."
         elif self.active_algo == "Johnson":
             a = self.add_node((200, 200))
             b = self.add_node((400, 200))
@@ -596,7 +625,7 @@ class WeightedGraphVisualizer:
             self._add_edge_by_label('E', 'F', 4)
             self.start_node = a
             self.message = "Example loaded. Click 'Run' to see TopoSort+Relax."
-        elif self.active_algo == "A*":
+        elif self.active_algo in ("A*", "Bidir Dijkstra"):
             a = self.add_node((200, 200))
             b = self.add_node((400, 200))
             c = self.add_node((600, 200))
@@ -612,7 +641,7 @@ class WeightedGraphVisualizer:
             self.add_edge(e.label, f.label, 1)
             self.start_node = None # User must set start manually
             self.target_node = None # User must set target manually
-            self.message = "A* example loaded. Set start and target nodes, then click 'Run'."
+            self.message = f"{self.active_algo} example loaded. Set start and target nodes, then click 'Run'."
         else:
             self.message = "Example loaded."
         self.setup_buttons()  # Ensure buttons are updated after loading example
@@ -624,28 +653,23 @@ class WeightedGraphVisualizer:
             return
         self.result_msg = ''
         self.error_msg = ''
-        self.animation_steps = []
-        self.animation_index = 0
+        self.animation_steps = StepStream(())
+        self.mst_rounds = []
+        self.paused = False
         self.animating = False
         for node in self.nodes:
             node.selected = False
         for edge in self.edges:
             edge.selected = False
-        # Debug: Print adjacency list before running A*
-        if self.active_algo == "A*":
-            print(f"Start node: {self.start_node.label if self.start_node else 'None'}")
-            print(f"Target node: {self.target_node.label if self.target_node else 'None'}")
-            print("Adjacency list before running A*:")
-            for k, v in self.graph.adj.items():
-                print(f"  {k}: {v}")
+        self.highlighted = []
         # Error handling for unsupported modes
         if self.active_algo == "A*" and not self.directed:
             self.error_msg = "A* requires a directed graph. Please enable directed mode."
             return
-        if self.active_algo in ("Prim", "Kruskal") and self.directed:
+        if self.active_algo in ("Prim", "Kruskal", "Boruvka") and self.directed:
             self.error_msg = f"{self.active_algo} only works on undirected graphs."
             return
-        if self.active_algo == "Dijkstra":
+        if self.active_algo in ("Dijkstra", "Bidir Dijkstra"):
             # Check for negative weights
             for edge in self.edges:
                 if edge.weight < 0:
@@ -665,293 +689,218 @@ class WeightedGraphVisualizer:
                 return
             node_pos = {n.label: n.pos for n in self.nodes}
             self.animating = True
-            self.animation_steps = list(astar(self.graph, self.start_node.label, self.target_node.label, node_pos, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(astar, self.graph, self.start_node.label, self.target_node.label, node_pos, visualize=True)
         elif self.active_algo == "Dijkstra":
             if not self.start_node:
                 self.error_msg = "Select a start node (click a node) before running."
                 return
             self.animating = True
-            self.animation_steps = list(dijkstra(self.graph, self.start_node.label, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(dijkstra, self.graph, self.start_node.label, visualize=True)
+        elif self.active_algo == "Bidir Dijkstra":
+            if not self.start_node:
+                self.error_msg = "Select a start node (click a node) before running."
+                return
+            if not self.target_node:
+                self.error_msg = "Select a target node (click a node) before running."
+                return
+            self.animating = True
+            self.animation_steps = trace_cache.stream(bidirectional_dijkstra, self.graph, self.start_node.label, self.target_node.label, visualize=True)
         elif self.active_algo == "Bellman-Ford":
             if not self.start_node:
                 self.error_msg = "Select a start node (click a node) before running."
                 return
             self.animating = True
-            self.animation_steps = list(bellman_ford(self.graph, self.start_node.label, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(bellman_ford, self.graph, self.start_node.label, visualize=True)
         elif self.active_algo == "Floyd-Warshall":
             self.animating = True
-            self.animation_steps = list(floyd_warshall(self.graph, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(floyd_warshall, self.graph, visualize=True)
         elif self.active_algo == "Prim":
             self.animating = True
-            self.animation_steps = list(prim(self.graph, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(prim, self.graph, visualize=True)
         elif self.active_algo == "Kruskal":
             self.animating = True
-            self.animation_steps = list(kruskal(self.graph, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(kruskal, self.graph, visualize=True)
+        elif self.active_algo == "Boruvka":
+            self.animating = True
+            self.animation_steps = trace_cache.stream(boruvka, self.graph, visualize=True)
         elif self.active_algo == "Johnson":
             self.animating = True
-            self.animation_steps = list(johnson(self.graph, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(johnson, self.graph, visualize=True)
         elif self.active_algo == "SPFA":
             if not self.start_node:
                 self.error_msg = "Select a start node (click a node) before running."
                 return
             self.animating = True
-            self.animation_steps = list(spfa(self.graph, self.start_node.label, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(spfa, self.graph, self.start_node.label, visualize=True)
         elif self.active_algo == "TopoSort+Relax":
             if not self.start_node:
                 self.error_msg = "Select a start node (click a node) before running."
                 return
             self.animating = True
-            self.animation_steps = list(topo_sort_relax(self.graph, self.start_node.label, visualize=True))
-            self.animation_index = 0
+            self.animation_steps = trace_cache.stream(topo_sort_relax, self.graph, self.start_node.label, visualize=True)
         else:
             self.error_msg = f"{self.active_algo} not implemented yet."
 
+    def step_back(self):
+        """Pause and redraw the previous step from the stream's bounded history."""
+        # Un-read the step on screen and the one before it, then replay the earlier one
+        if self.animation_steps.back(2):
+            self.animating = True
+            self.paused = True
+            self.animate()
+
+    def _select_node(self, label):
+        node = self.model.node(label)
+        if node:
+            node.selected = True
+            self.highlighted.append(node)
+
+    def _select_edge(self, u, v):
+        edge = self.model.edge(u, v) or self.model.edge(v, u)
+        if edge:
+            edge.selected = True
+            self.highlighted.append(edge)
+
+    def _paths_summary(self, dist, prev):
+        paths = []
+        for node in self.nodes:
+            if node.label == self.start_node.label:
+                continue
+            path = []
+            cur = node.label
+            while cur is not None:
+                path.append(cur)
+                cur = prev.get(cur, None)
+            path.reverse()
+            if len(path) > 1 and dist[path[-1]] < float('inf'):
+                paths.append(f"{self.start_node.name}→{alias(path[-1])}: {'->'.join(map(alias, path))} (d={dist[path[-1]]})")
+        return " | ".join(paths) if paths else "No reachable nodes."
+
+    # Bidirectional Dijkstra emits the same visit/update/found steps as Dijkstra
+    @_on(("Dijkstra", "Bidir Dijkstra"), "visit")
+    def _dijkstra_visit(self, step):
+        self._select_node(step[1])
+        return f"Visiting: {alias(step[1])}"
+
+    @_on(("SPFA", "A*", "TopoSort+Relax"), "visit")
+    def _visit_with_distance(self, step):
+        self._select_node(step[1])
+        return f"{self.active_algo} visiting: {alias(step[1])}, Distance: {step[2]}"
+
+    @_on(("Dijkstra", "Bidir Dijkstra", "Bellman-Ford"), "update")
+    def _update(self, step):
+        return f"Update: {alias(step[1])}, New Distance: {step[2]}"
+
+    @_on(("SPFA", "A*", "TopoSort+Relax"), "update")
+    def _named_update(self, step):
+        return f"{self.active_algo} update: {alias(step[1])}, New Distance: {step[2]}"
+
+    @_on(("Dijkstra", "Bidir Dijkstra"), "found")
+    def _path_found(self, step):
+        for label in step[1]:
+            self._select_node(label)
+        return f"Path found: {' → '.join(map(alias, step[1]))}"
+
+    @_on(("Dijkstra", "Bidir Dijkstra"), "not_found")
+    def _path_not_found(self, step):
+        return "No path found."
+
+    @_on(("Bellman-Ford", "SPFA", "Johnson"), "negative_cycle")
+    def _negative_cycle(self, step):
+        return "Negative weight cycle detected!"
+
+    @_on(("Dijkstra", "Bellman-Ford", "SPFA", "TopoSort+Relax"), "done")
+    def _sssp_done(self, step):
+        return f"{self.active_algo} complete. " + self._paths_summary(step[1], step[2])
+
+    @_on("A*", "done")
+    def _astar_done(self, step):
+        dist, path = step[1], step[3]
+        if len(path) > 1 and dist[path[-1]] < float('inf'):
+            return f"A* path: {' → '.join(map(alias, path))} (cost={dist[path[-1]]})"
+        return "A*: No path found."
+
+    @_on(("Prim", "Kruskal"), "add_edge")
+    def _mst_add_edge(self, step):
+        _, u, v, w = step
+        self._select_edge(u, v)
+        return f"MST add edge: {alias(u)}-{alias(v)} (w={w})"
+
+    @_on(("Prim", "Kruskal", "Boruvka"), "done")
+    def _mst_done(self, step):
+        name = {"Prim": "Prim's", "Kruskal": "Kruskal's", "Boruvka": "Borůvka's"}[self.active_algo]
+        edges = [f"{alias(u)}-{alias(v)}(w={w})" for u, v, w in step[1]]
+        return f"{name} MST: " + (", ".join(edges) if edges else "No MST found.")
+
+    @_on("Boruvka", "round")
+    def _boruvka_round(self, step):
+        # Every component's cheapest edge is added at once; show the whole forest so far.
+        # Rounds are numbered from 1, so replaying round k after step_back drops later rounds
+        del self.mst_rounds[step[1] - 1:]
+        self.mst_rounds.append(step[2])
+        for added in self.mst_rounds:
+            for u, v, _ in added:
+                self._select_edge(u, v)
+        return f"Round {step[1]}: " + ", ".join(f"{alias(u)}-{alias(v)}(w={w})" for u, v, w in step[2])
+
+    @_on("Floyd-Warshall", "round")
+    def _floyd_round(self, step):
+        k, updates = step[1], step[2]
+        self._select_node(k)
+        shown = ", ".join(f"{alias(i)}→{alias(j)}={d}" for i, j, d in updates[:6])
+        more = f" (+{len(updates) - 6} more)" if len(updates) > 6 else ""
+        return f"Via {alias(k)}: {shown}{more}"
+
+    @_on("Floyd-Warshall", "done")
+    def _floyd_done(self, step):
+        dist, vertices = step[1], step[3]
+        matrix = []
+        for i, u in enumerate(vertices):
+            row = [f"{d if d < float('inf') else '∞'}" for d in (dist[i][j] for j in range(len(vertices)))]
+            matrix.append(f"{alias(u)}: " + ", ".join(row))
+        return "Floyd-Warshall complete.\n" + "\n".join(matrix)
+
+    @_on("Johnson", "update")
+    def _johnson_update(self, step):
+        if len(step) >= 4:
+            return f"Johnson update: {alias(step[1])} → {alias(step[2])}, Distance: {step[3]}"
+        if len(step) == 2 and isinstance(step[1], str):
+            return f"Johnson error: {step[1]}"
+        return "Johnson: Unexpected step format."
+
+    @_on("Johnson", "done")
+    def _johnson_done(self, step):
+        dist = step[1]
+        if not isinstance(dist, dict) or not dist:
+            return "Johnson's algorithm complete. (Result unavailable)"
+        # Use sorted list of vertices for consistent matrix
+        vertices = sorted(dist.keys())
+        lines = []
+        for u in vertices:
+            row = [f"{d if d < float('inf') else '∞'}" for d in (dist[u][v] for v in vertices)]
+            lines.append(f"{alias(u)}: " + ", ".join(row))
+        return "Johnson's algorithm complete.\n" + "\n".join(lines)
+
     def animate(self):
-        msg = ''  # Always define msg at the top
         try:
-            if self.animating and self.animation_index < len(self.animation_steps):
-                step = self.animation_steps[self.animation_index]
-                for node in self.nodes:
-                    node.selected = False
-                for edge in self.edges:
-                    edge.selected = False
-                    if self.active_algo == "Dijkstra":
-                        if step[0] == "visit":
-                            label = step[1]
-                            node = next((n for n in self.nodes if n.label == label), None)
-                            if node:
-                                node.selected = True
-                            msg = f"Visiting: {label}"
-                        elif step[0] == "found":
-                            path = step[1]
-                            for label in path:
-                                node = next((n for n in self.nodes if n.label == label), None)
-                                if node:
-                                    node.selected = True
-                            msg = f"Path found: {' → '.join(path)}"
-                        elif step[0] == "not_found":
-                            msg = "No path found."
-                        elif step[0] == "update":
-                            label = step[1]
-                            new_dist = step[2]
-                            msg = f"Update: {label}, New Distance: {new_dist}"
-                        elif step[0] == "done":
-                            dist = step[1]
-                            prev = step[2]
-                            # Find shortest path to all nodes from start
-                            paths = []
-                            for node in self.nodes:
-                                if node.label == self.start_node.label:
-                                    continue
-                                path = []
-                                cur = node.label
-                                while cur is not None:
-                                    path.append(cur)
-                                    cur = prev.get(cur, None)
-                                path.reverse()
-                                if len(path) > 1 and dist[path[-1]] < float('inf'):
-                                    paths.append(f"{self.start_node.label}→{path[-1]}: {'->'.join(path)} (d={dist[path[-1]]})")
-                            msg = "Dijkstra complete. " + (" | ".join(paths) if paths else "No reachable nodes.")
-                    elif self.active_algo == "Bellman-Ford":
-                        if step[0] == "update":
-                            label = step[1]
-                            new_dist = step[2]
-                            msg = f"Update: {label}, New Distance: {new_dist}"
-                        elif step[0] == "negative_cycle":
-                            msg = "Negative weight cycle detected!"
-                        elif step[0] == "done":
-                            dist = step[1]
-                            prev = step[2]
-                            paths = []
-                            for node in self.nodes:
-                                if node.label == self.start_node.label:
-                                    continue
-                                path = []
-                                cur = node.label
-                                while cur is not None:
-                                    path.append(cur)
-                                    cur = prev.get(cur, None)
-                                path.reverse()
-                                if len(path) > 1 and dist[path[-1]] < float('inf'):
-                                    paths.append(f"{self.start_node.label}→{path[-1]}: {'->'.join(path)} (d={dist[path[-1]]})")
-                            msg = "Bellman-Ford complete. " + (" | ".join(paths) if paths else "No reachable nodes.")
-                    elif self.active_algo == "SPFA":
-                        if step[0] == "visit":
-                            label = step[1]
-                            dist = step[2]
-                            for node in self.nodes:
-                                if node.label == label:
-                                    node.selected = True
-                            msg = f"SPFA visiting: {label}, Distance: {dist}"
-                        elif step[0] == "update":
-                            label = step[1]
-                            new_dist = step[2]
-                            msg = f"SPFA update: {label}, New Distance: {new_dist}"
-                        elif step[0] == "negative_cycle":
-                            msg = "Negative weight cycle detected!"
-                        elif step[0] == "done":
-                            dist = step[1]
-                            prev = step[2]
-                            paths = []
-                            for node in self.nodes:
-                                if node.label == self.start_node.label:
-                                    continue
-                                path = []
-                                cur = node.label
-                                while cur is not None:
-                                    path.append(cur)
-                                    cur = prev.get(cur, None)
-                                path.reverse()
-                                if len(path) > 1 and dist[path[-1]] < float('inf'):
-                                    paths.append(f"{self.start_node.label}→{path[-1]}: {'->'.join(path)} (d={dist[path[-1]]})")
-                            msg = "SPFA complete. " + (" | ".join(paths) if paths else "No reachable nodes.")
-                    elif self.active_algo == "A*":
-                        if step[0] == "visit":
-                            label = step[1]
-                            dist = step[2]
-                            for node in self.nodes:
-                                if node.label == label:
-                                    node.selected = True
-                            msg = f"A* visiting: {label}, Distance: {dist}"
-                        elif step[0] == "update":
-                            label = step[1]
-                            new_dist = step[2]
-                            msg = f"A* update: {label}, New Distance: {new_dist}"
-                        elif step[0] == "done":
-                            dist = step[1]
-                            prev = step[2]
-                            path = step[3]
-                            if len(path) > 1 and dist[path[-1]] < float('inf'):
-                                msg = f"A* path: {' → '.join(path)} (cost={dist[path[-1]]})"
-                            else:
-                                msg = "A*: No path found."
-                    elif self.active_algo == "Prim":
-                        if step[0] == "add_edge":
-                            u, v, w = step[1], step[2], step[3]
-                            for edge in self.edges:
-                                if (edge.u.label, edge.v.label) == (u, v) or (edge.u.label, edge.v.label) == (v, u):
-                                    edge.selected = True
-                            msg = f"MST add edge: {u}-{v} (w={w})"
-                        elif step[0] == "done":
-                            mst = [s for s in self.animation_steps if s[0] == "add_edge"]
-                            edges = [f"{u}-{v}(w={w})" for _, u, v, w in mst]
-                            msg = "Prim's MST: " + (", ".join(edges) if edges else "No MST found.")
-                    elif self.active_algo == "Kruskal":
-                        if step[0] == "add_edge":
-                            u, v, w = step[1], step[2], step[3]
-                            for edge in self.edges:
-                                if (edge.u.label, edge.v.label) == (u, v) or (edge.u.label, edge.v.label) == (v, u):
-                                    edge.selected = True
-                            msg = f"MST add edge: {u}-{v} (w={w})"
-                        elif step[0] == "done":
-                            mst = [s for s in self.animation_steps if s[0] == "add_edge"]
-                            edges = [f"{u}-{v}(w={w})" for _, u, v, w in mst]
-                            msg = "Kruskal's MST: " + (", ".join(edges) if edges else "No MST found.")
-                    elif self.active_algo == "Floyd-Warshall":
-                        if step[0] == "update":
-                            i, j, new_dist = step[1], step[2], step[3]
-                            msg = f"Update: {i} → {j}, New Distance: {new_dist}"
-                        elif step[0] == "done":
-                            dist = step[1]
-                            vertices = step[3]
-                            matrix = []
-                            for i, u in enumerate(vertices):
-                                row = []
-                                for j, v in enumerate(vertices):
-                                    d = dist[i][j]
-                                    row.append(f"{d if d < float('inf') else '∞'}")
-                                matrix.append(f"{u}: " + ", ".join(row))
-                            msg = "Floyd-Warshall complete.\n" + "\n".join(matrix)
-                    elif self.active_algo == "Johnson":
-                        if step[0] == "update":
-                            if len(step) >= 4:
-                                u, v, d = step[1], step[2], step[3]
-                                msg = f"Johnson update: {u} → {v}, Distance: {d}"
-                            elif len(step) == 2 and isinstance(step[1], str):
-                                msg = f"Johnson error: {step[1]}"
-                            else:
-                                msg = "Johnson: Unexpected step format."
-                        elif step[0] == "negative_cycle":
-                            msg = "Negative weight cycle detected!"
-                        elif step[0] == "done":
-                            dist = step[1]
-                            matrix = {}
-                            if not isinstance(dist, dict) or not dist:
-                                msg = "Johnson's algorithm complete. (Result unavailable)"
-                            else:
-                                # Use sorted list of vertices for consistent matrix
-                                vertices = sorted(dist.keys())
-                                lines = []
-                                for u in vertices:
-                                    row = []
-                                    for v in vertices:
-                                        d = dist[u][v]
-                                        row.append(f"{d if d < float('inf') else '∞'}")
-                                    lines.append(f"{u}: " + ", ".join(row))
-                                msg = "Johnson's algorithm complete.\n" + "\n".join(lines)
-                    elif self.active_algo == "TopoSort+Relax":
-                        if step[0] == "visit":
-                            label = step[1]
-                            dist = step[2]
-                            for node in self.nodes:
-                                if node.label == label:
-                                    node.selected = True
-                            msg = f"TopoSort+Relax visiting: {label}, Distance: {dist}"
-                        elif step[0] == "update":
-                            label = step[1]
-                            new_dist = step[2]
-                            msg = f"TopoSort+Relax update: {label}, New Distance: {new_dist}"
-                        elif step[0] == "done":
-                            dist = step[1]
-                            prev = step[2]
-                            paths = []
-                            for node in self.nodes:
-                                if node.label == self.start_node.label:
-                                    continue
-                                path = []
-                                cur = node.label
-                                while cur is not None:
-                                    path.append(cur)
-                                    cur = prev.get(cur, None)
-                                path.reverse()
-                                if len(path) > 1 and dist[path[-1]] < float('inf'):
-                                    paths.append(f"{self.start_node.label}→{path[-1]}: {'->'.join(path)} (d={dist[path[-1]]})")
-                            msg = "TopoSort+Relax complete. " + (" | ".join(paths) if paths else "No reachable nodes.")
+            if self.animating and self.animation_steps.has_next():
+                step = self.animation_steps.next()
+                # Only the elements the previous step lit up need clearing
+                for element in self.highlighted:
+                    element.selected = False
+                self.highlighted = []
+                handler = _STEP_HANDLERS.get((self.active_algo, step[0]))
+                msg = handler(self, step) if handler else ''
                 self.last_msg = msg # Store the last message
                 self.result_msg = msg
                 self.draw()
                 pygame.time.delay(self.animation_delay)
-                self.animation_index += 1
             else:
                 self.animating = False
                 # Use the last message from the animation loop, or a default
                 msg = getattr(self, 'last_msg', '')
-                if self.active_algo == "Dijkstra" and self.animation_steps:
-                    self.result_msg = msg if msg else "Dijkstra complete."
-                elif self.active_algo == "Bellman-Ford" and self.animation_steps:
-                    self.result_msg = msg if msg else "Bellman-Ford complete."
-                elif self.active_algo == "SPFA" and self.animation_steps:
-                    self.result_msg = msg if msg else "SPFA complete."
-                elif self.active_algo == "A*" and self.animation_steps:
-                    self.result_msg = msg if msg else "A* complete."
-                elif self.active_algo == "Prim" and self.animation_steps:
-                    self.result_msg = msg if msg else "Prim's MST complete."
-                elif self.active_algo == "Kruskal" and self.animation_steps:
-                    self.result_msg = msg if msg else "Kruskal's MST complete."
-                elif self.active_algo == "Floyd-Warshall" and self.animation_steps:
-                    self.result_msg = msg if msg else "Floyd-Warshall complete."
-                elif self.active_algo == "Johnson" and self.animation_steps:
-                    self.result_msg = msg if msg else "Johnson's algorithm complete."
-                elif self.active_algo == "TopoSort+Relax" and self.animation_steps:
-                    self.result_msg = msg if msg else "TopoSort+Relax complete."
+                if self.animation_steps and self.active_algo in _DONE_MESSAGES:
+                    self.result_msg = msg if msg else _DONE_MESSAGES[self.active_algo]
                 for node in self.nodes:
                     node.selected = False
                 for edge in self.edges:
@@ -966,7 +915,7 @@ class WeightedGraphVisualizer:
         try:
             while True:
                 self.draw()
-                if self.animating:
+                if self.animating and not self.paused:
                     self.animate()
                 for event in pygame.event.get():
                     if event.type == pygame.QUIT:
@@ -986,14 +935,10 @@ class WeightedGraphVisualizer:
                                     edge.weight = new_weight
                                     # Remove old edge from graph data structure
                                     u_label, v_label = edge.u.label, edge.v.label
-                                    # Remove all (v, *) from adj[u] and (u, *) from adj[v] if undirected
-                                    self.graph.adj[u_label] = [pair for pair in self.graph.adj.get(u_label, []) if pair[0] != v_label]
-                                    if not self.directed:
-                                        self.graph.adj[v_label] = [pair for pair in self.graph.adj.get(v_label, []) if pair[0] != u_label]
+                                    # Graph mirrors both calls itself when undirected
+                                    self.graph.remove_edge(u_label, v_label)
                                     # Add new edge with updated weight
                                     self.graph.add_edge(u_label, v_label, new_weight)
-                                    if not self.directed:
-                                        self.graph.add_edge(v_label, u_label, new_weight)
                                     break
                             else:
                                 for btn in self.mode_buttons + self.buttons + self.example_buttons + [self.run_button]:
@@ -1005,10 +950,10 @@ class WeightedGraphVisualizer:
                                     node = self.get_node_at_pos(event.pos)
                                     if self.current_mode == MODE_SET_START and node:
                                         self.start_node = node
-                                        self.error_msg = f"Start node: {node.label}. Click 'Run' to start {self.active_algo}."
-                                    elif self.current_mode == MODE_SET_TARGET and node and self.active_algo == "A*":
+                                        self.error_msg = f"Start node: {node.name}. Click 'Run' to start {self.active_algo}."
+                                    elif self.current_mode == MODE_SET_TARGET and node and self.active_algo in ("A*", "Bidir Dijkstra"):
                                         self.target_node = node
-                                        self.error_msg = f"Target node: {node.label}. Click 'Run' to start {self.active_algo}."
+                                        self.error_msg = f"Target node: {node.name}. Click 'Run' to start {self.active_algo}."
                                     elif self.current_mode == MODE_EDIT:
                                         if node:
                                             self.selected_node = node
@@ -1048,6 +993,12 @@ class WeightedGraphVisualizer:
                             self.animation_delay = max(50, self.animation_delay - 50)
                         elif event.key == pygame.K_MINUS:
                             self.animation_delay = min(2000, self.animation_delay + 50)
+                        elif event.key == pygame.K_SPACE and self.animating:
+                            self.paused = not self.paused
+                        elif event.key == pygame.K_RIGHT and self.animating and self.paused:
+                            self.animate()
+                        elif event.key == pygame.K_LEFT:
+                            self.step_back()
                         elif event.key == pygame.K_h:
                             self.show_help = not self.show_help
                         elif event.key == pygame.K_RETURN and not self.animating: